@@ -312,17 +312,112 @@ class RenderSettings(_Settings):
     """Rendering settings
     """
     dir: DirectoryPath = Field(default=str(ROOTDIR / 'render'), title="render directory")
-    """The directory where SVG files should be rendered to
+    """The directory where renders are saved to if :attr:`keep` is enabled
     """
     keep: bool = Field(default=False, title="keep files after rendering")
-    """Keep rendered images after they've been used. 
-    
-    Disabled by default, you may want to enable this if you want to inspect the
-    renders.
+    """Save rendered images to :attr:`dir`.
+
+    Designs are rendered in memory, so this is disabled by default.
+    You may want to enable this if you want to inspect the renders.
+    """
+    workers: int = Field(default=0, title="# of render processes")
+    """The number of processes to render design layers in.
+
+    Defaults to 0, which uses one process per CPU.
+    Set to 1 to render layers one by one in the current process.
+    Takes effect after a restart.
     """
 
     _validate_dir = validator('dir', allow_reuse=True, pre=True)(_Settings._validate_directorypath)
 
+    @validator('workers', pre=True, allow_reuse=True)
+    def _validate_workers(cls, value):
+        if value < 0:
+            return 0
+        else:
+            return value
+
+
+class FileHashMode(str, Enum):
+    """How to identify video & design files
+    """
+    full = "full"
+    """Hash the complete file
+    """
+    sampled = "sampled"
+    """Hash the size, start, end and some evenly spaced blocks of the file.
+    Much faster for large files.
+    """
+
+
+class EventEncoding(str, Enum):
+    """How to encode events in multiplexed streams
+    """
+    json = "json"
+    """Encode events as JSON
+    """
+    msgpack = "msgpack"
+    """Encode events as `MessagePack <https://msgpack.org>`_, which is more
+    compact than JSON. Requires the ``msgpack`` package, falls back to JSON
+    if it's not installed.
+    """
+
+
+class StreamSettings(_Settings):
+    """Streaming settings.
+    """
+    latest_only: bool = Field(default=True, title="only stream the latest frame")
+    """Only stream the latest frame of image streams.
+
+    If the browser can't keep up, frames that are superseded before they're
+    sent are dropped instead of being sent late.
+    """
+    jpeg_quality: int = Field(default=85, title="JPEG quality")
+    """The quality of streamed images, from 0 to 100.
+    Lower values use less bandwidth.
+    """
+    max_size: int = Field(default=0, title="maximum image size (px)")
+    """Images that are wider or taller than this are scaled down before
+    they're streamed. Set to 0 to stream images at their original size.
+    """
+
+    update_workers: int = Field(default=2, title="# of stream update threads")
+    """The number of threads that update streams in the background.
+    Takes effect after a restart.
+    """
+    progress_interval: float = Field(default=0.25, title="progress update interval (s)")
+    """The minimum time between two progress updates of an analyzer.
+    Updates that come in faster are combined into one.
+    """
+    event_encoding: EventEncoding = Field(default=EventEncoding.json, title="event encoding")
+    """How to encode events in multiplexed streams
+    """
+
+    @validator('jpeg_quality', pre=True, allow_reuse=True)
+    def _validate_jpeg_quality(cls, value):
+        return min(max(int(value), 0), 100)
+
+    @validator('max_size', pre=True, allow_reuse=True)
+    def _validate_max_size(cls, value):
+        if value < 0:
+            return 0
+        else:
+            return value
+
+    @validator('progress_interval', pre=True, allow_reuse=True)
+    def _validate_progress_interval(cls, value):
+        if value < 0:
+            return 0.0
+        else:
+            return value
+
+    @validator('update_workers', pre=True, allow_reuse=True)
+    def _validate_update_workers(cls, value):
+        if value < 1:
+            return 1
+        else:
+            return value
+
 
 class DatabaseSettings(_Settings):
     """Database settings.
@@ -334,8 +429,62 @@ class DatabaseSettings(_Settings):
     """The database can get cluttered after a while, and will be cleaned at 
     this interval
     """
+    wal: bool = Field(default=True, title="write-ahead logging")
+    """Use SQLite's `write-ahead log <wal_>`_ with ``synchronous=NORMAL``.
+    
+    Readers don't block writers and vice versa, so concurrent analyzers don't
+    have to wait for each other to commit to the database.
+    
+    .. _wal: https://sqlite.org/wal.html
+    """
+    pool_size: int = Field(default=8, title="# of database connections")
+    """The number of database connections to keep open
+    """
+    busy_timeout: float = Field(default=10.0, title="wait for locked database (s)")
+    """How long to wait for another connection to release its lock on the
+    database before giving up
+    """
+    hash_mode: FileHashMode = Field(default=FileHashMode.full, title="file identification")
+    """How to identify video & design files. 
+    
+    Files are only hashed the first time they're used, or when they've 
+    changed since; hashes are remembered in 
+    :attr:`~shapeflow.DatabaseSettings.identity_dir`.
+    Switching modes changes the hashes of large files, so files that were 
+    added in the other mode will be treated as new files.
+    """
+    identity_dir: DirectoryPath = Field(default=str(ROOTDIR / 'identity'), title="file identity directory")
+    """Where to remember the hashes of files
+    """
+    hash_workers: int = Field(default=1, title="# of files to hash at once")
+    """The number of files that can be hashed at the same time.
+    
+    Defaults to 1, since reading multiple large files at once tends to be 
+    slower than reading them one by one, especially on hard drives.
+    Takes effect after a restart.
+    """
+    snapshot_interval: int = Field(default=16, title="config snapshot interval")
+    """Configuration history is stored as changes with respect to the 
+    previous configuration, with a full snapshot at this interval.
+    Lower values use more disk space, but make undo/redo slightly faster.
+    """
 
     _validate_path = validator('path', allow_reuse=True, pre=True)(_Settings._validate_filepath)
+    _validate_identity_dir = validator('identity_dir', allow_reuse=True, pre=True)(_Settings._validate_directorypath)
+
+    @validator('hash_workers', pre=True, allow_reuse=True)
+    def _validate_hash_workers(cls, value):
+        if value < 1:
+            return 1
+        else:
+            return value
+
+    @validator('snapshot_interval', pre=True, allow_reuse=True)
+    def _validate_snapshot_interval(cls, value):
+        if value < 1:
+            return 1
+        else:
+            return value
 
 
 class ResultSaveMode(str, Enum):
@@ -356,6 +505,35 @@ class ResultSaveMode(str, Enum):
     """
 
 
+class ResultFormat(str, Enum):
+    """The file format to save results in
+    """
+    xlsx = "xlsx"
+    """A single Excel file with a sheet for each feature
+    """
+    csv = "csv"
+    """A CSV file for each feature
+    """
+    parquet = "parquet"
+    """A Parquet file for each feature. Requires ``pyarrow``
+    """
+
+
+class ServerBackend(str, Enum):
+    """How to serve the application
+    """
+    waitress = "waitress"
+    """Serve ``Flask`` with ``waitress``, with a fixed number of threads
+    ~ :attr:`shapeflow.ApplicationSettings.threads`
+    """
+    asgi = "asgi"
+    """Serve asynchronously with ``uvicorn``, see :mod:`shapeflow.asgi`.
+    API calls run on :attr:`shapeflow.ApplicationSettings.threads` threads,
+    but streams don't hold on to any of them.
+    Requires ``uvicorn``; falls back to ``waitress`` if it's not installed.
+    """
+
+
 class ApplicationSettings(_Settings):
     """Application settings.
     """
@@ -389,6 +567,11 @@ class ApplicationSettings(_Settings):
     result_dir: DirectoryPath = Field(default=str(ROOTDIR / 'results'), title="result directory")
     """The path to the result directory
     """
+    result_format: ResultFormat = Field(default=ResultFormat.xlsx, title="result file format")
+    """The file format to save results in. 
+    Metadata is included in the ``.xlsx`` file or saved to a separate 
+    ``.json`` file for the other formats.
+    """
     cancel_on_q_stop: bool = Field(default=False, title="cancel running analyzers when stopping queue")
     """Whether to cancel the currently running analysis when stopping a queue.
     
@@ -396,9 +579,13 @@ class ApplicationSettings(_Settings):
     completed first.
     """
     threads: int = Field(default=cpu_count(), title="# of threads")
-    f"""The number of threads the server uses. Defaults to {cpu_count()}, the 
+    f"""The number of threads the server uses, also to restore analyzers
+    from the application state. Defaults to {cpu_count()}, the
     number of logical cores of your machine's CPU.
     """
+    server: ServerBackend = Field(default=ServerBackend.waitress, title="server")
+    """How to serve the application. Takes effect after a restart.
+    """
 
     _validate_dir = validator('result_dir', allow_reuse=True, pre=True)(_Settings._validate_directorypath)
     _validate_state_path = validator('state_path', allow_reuse=True, pre=True)(_Settings._validate_filepath)
@@ -424,6 +611,8 @@ class Settings(_Settings):
 
     * format: :class:`~shapeflow.FormatSettings`
 
+    * stream: :class:`~shapeflow.StreamSettings`
+
     * db: :class:`~shapeflow.DatabaseSettings`
     """
     app: ApplicationSettings = Field(default=ApplicationSettings(), title="Application")
@@ -431,6 +620,7 @@ class Settings(_Settings):
     cache: CacheSettings = Field(default=CacheSettings(), title="Caching")
     render: RenderSettings = Field(default=RenderSettings(), title="SVG Rendering")
     format: FormatSettings = Field(default=FormatSettings(), title="Formatting")
+    stream: StreamSettings = Field(default=StreamSettings(), title="Streaming")
     db: DatabaseSettings = Field(default=DatabaseSettings(), title="Database")
 
     @classmethod
@@ -539,23 +729,28 @@ class Logger(logging.Logger):
 
     def debug(self, msg, *args, **kwargs):
         """:meta private:"""
-        super().debug(self._remove_newlines(msg))
+        if self.isEnabledFor(logging.DEBUG):
+            super().debug(self._format(msg, args), **kwargs)
 
     def info(self, msg, *args, **kwargs):
         """:meta private:"""
-        super().info(self._remove_newlines(msg))
+        if self.isEnabledFor(logging.INFO):
+            super().info(self._format(msg, args), **kwargs)
 
     def warning(self, msg, *args, **kwargs):
         """:meta private:"""
-        super().warning(self._remove_newlines(msg))
+        if self.isEnabledFor(logging.WARNING):
+            super().warning(self._format(msg, args), **kwargs)
 
     def error(self, msg, *args, **kwargs):
         """:meta private:"""
-        super().error(self._remove_newlines(msg))
+        if self.isEnabledFor(logging.ERROR):
+            super().error(self._format(msg, args), **kwargs)
 
     def critical(self, msg, *args, **kwargs):
         """:meta private:"""
-        super().critical(self._remove_newlines(msg))
+        if self.isEnabledFor(logging.CRITICAL):
+            super().critical(self._format(msg, args), **kwargs)
 
     def vdebug(self, message, *args, **kwargs):
         """Log message with severity 'VDEBUG'.
@@ -563,9 +758,18 @@ class Logger(logging.Logger):
         """
         if self.isEnabledFor(VDEBUG):
             self.log(
-                VDEBUG, self._remove_newlines(message), *args, **kwargs
+                VDEBUG, self._format(message, args), **kwargs
             )
 
+    def _format(self, msg: str, args: tuple) -> str:
+        """Format ``%``-style arguments into the message, so they're only
+        formatted if the message is actually logged.
+        """
+        msg = str(msg)
+        if args:
+            msg = msg % args
+        return self._remove_newlines(msg)
+
     def _remove_newlines(self, msg: str) -> str:
         return self._pattern.sub(' ', msg)
 
@@ -618,7 +822,7 @@ def get_logger(name: str) -> Logger:
 
 log = get_logger(__name__)
 log.info(f"v{__version__}")
-log.debug(f"settings: {settings.dict()}")
+log.debug("settings: %s", settings)
 
 
 def get_cache(retry: bool = False) -> diskcache.Cache:
@@ -253,6 +253,28 @@ class _VideoAnalyzerManagerDispatcher(Dispatcher):
     
     :func:`shapeflow.main._VideoAnalyzerManager.stream_stop`
     """
+    mux = Endpoint(Callable[[str], BaseStreamer])
+    """Open a multiplexed stream of frames and events for a given client ID
+    
+    :func:`shapeflow.main._VideoAnalyzerManager.mux`
+    """
+    mux_add = Endpoint(Callable[[str, str, str], None])
+    """Add the stream for a given analyzer ID and endpoint to a multiplexed 
+    stream
+    
+    :func:`shapeflow.main._VideoAnalyzerManager.mux_add`
+    """
+    mux_remove = Endpoint(Callable[[str, str, str], None])
+    """Remove the stream for a given analyzer ID and endpoint from a 
+    multiplexed stream
+    
+    :func:`shapeflow.main._VideoAnalyzerManager.mux_remove`
+    """
+    mux_stop = Endpoint(Callable[[str], None])
+    """Close a multiplexed stream
+    
+    :func:`shapeflow.main._VideoAnalyzerManager.mux_stop`
+    """
 
     __id__ = _VideoAnalyzerDispatcher()
     """Prototype :class:`~shapeflow.api._VideoAnalyzerDispatcher` instance.
@@ -283,6 +305,17 @@ class _DatabaseDispatcher(Dispatcher):
     
     :func:`shapeflow.db.History.get_result`
     """
+    get_run_lists = Endpoint(Callable[[List[int]], dict])
+    """Get run metadata for a list of analyzer IDs
+    
+    :func:`shapeflow.db.History.get_run_lists`
+    """
+    get_results = Endpoint(Callable[[List[int], List[int], List[str], List[str], float, float], dict])
+    """Get the results for a list of analyzer IDs, optionally restricted to 
+    some runs, features, masks and a time range 
+    
+    :func:`shapeflow.db.History.get_results`
+    """
     export_result = Endpoint(Callable[[int, int], bool])
     """Export the result for a given analyzer ID and result ID
     
@@ -0,0 +1,267 @@
+"""Asynchronous serving over `ASGI <https://asgi.readthedocs.io>`_.
+
+Serves the same ``/api/<address>`` routes and user interface files as the
+``Flask`` app in :mod:`shapeflow.server`, see
+:attr:`shapeflow.ServerBackend.asgi`.
+
+API calls are dispatched to a pool of
+:attr:`shapeflow.ApplicationSettings.threads` workers. Streams are relayed
+to the event loop from their own threads, so open streams don't hold on to
+any of the workers and don't keep other calls from being handled.
+"""
+
+import os
+import asyncio
+import mimetypes
+import threading
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Generator, \
+    List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from shapeflow import get_logger, settings
+from shapeflow.core import DispatchingError
+from shapeflow.core.streaming import BaseStreamer
+
+log = get_logger(__name__)
+
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+_END = object()
+"""Marks the end of a relayed stream.
+"""
+
+
+async def relay(generator: Generator[bytes, None, None], stop: threading.Event) \
+        -> AsyncGenerator[bytes, None]:
+    """Iterate over a blocking generator without blocking the event loop.
+
+    The generator runs in its own thread and hands its output over to the
+    event loop one chunk at a time, so a slow client holds up the generator
+    instead of piling up chunks in memory.
+
+    Parameters
+    ----------
+    generator : Generator[bytes, None, None]
+        A generator that blocks while waiting for output,
+        e.g. :func:`shapeflow.core.streaming.BaseStreamer.stream`
+    stop : threading.Event
+        Set to stop relaying
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    def put(item: Any) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stop.is_set():
+            try:
+                future.result(timeout=1)
+                return True
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+        return False
+
+    def run():
+        try:
+            for chunk in generator:
+                if stop.is_set() or not put(chunk):
+                    break
+        except Exception as e:
+            log.error(f"stream failed - {e.__class__.__name__}: {e}")
+        finally:
+            generator.close()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(queue.put_nowait, _END)
+
+    threading.Thread(target=run, daemon=True, name='relay').start()
+
+    while True:
+        chunk = await queue.get()
+        if chunk is _END or stop.is_set():
+            break
+        yield chunk
+
+
+class AsgiApp(object):
+    """An ASGI application that serves ``shapeflow``.
+
+    Parameters
+    ----------
+    server
+        The :class:`~shapeflow.server.ShapeflowServer` to dispatch API calls to
+    ui : str
+        The directory to serve user interface files from
+    """
+    _server: Any
+    _ui: str
+    _executor: ThreadPoolExecutor
+
+    def __init__(self, server: Any, ui: str):
+        self._server = server
+        self._ui = os.path.abspath(ui)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.app.threads, thread_name_prefix='api'
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope['path']
+        method = scope['method']
+
+        if path.startswith('/api/'):
+            if method not in ('GET', 'POST', 'PUT'):
+                await self._respond(send, 405)
+            else:
+                await self._call_api(
+                    path[len('/api/'):],
+                    await self._body(receive),
+                    self._args(scope),
+                    receive,
+                    send
+                )
+        elif method == 'GET':
+            await self._get_file(path.lstrip('/') or 'index.html', send)
+        else:
+            await self._respond(send, 405)
+
+    async def _call_api(self, address: str, data: bytes, args: Dict[str, str],
+                        receive: Receive, send: Send) -> None:
+        loop = asyncio.get_running_loop()
+
+        try:
+            result = await loop.run_in_executor(
+                self._executor, self._server.dispatch, address, data, args
+            )
+        except DispatchingError:
+            await self._respond(send, 404)
+            return
+        except Exception as e:
+            log.error(f"'{address}' - {e.__class__.__name__}: {str(e)}")
+            await self._respond(send, 500)
+            return
+
+        if isinstance(result, bytes):
+            await self._respond(send, 200, result, 'text/html; charset=utf-8')
+        elif isinstance(result, BaseStreamer):
+            await self._stream(result, receive, send)
+        else:
+            await self._respond(
+                send, 200, self._server.to_json(result).encode('utf-8'),
+                'application/json'
+            )
+
+    async def _stream(self, streamer: BaseStreamer, receive: Receive, send: Send) -> None:
+        stop = threading.Event()
+        task = asyncio.current_task()
+
+        async def disconnect():
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    # Don't wait for the stream to produce anything else;
+                    #  only this stream ends, the streamer itself is left
+                    #  to the streams it's registered with
+                    stop.set()
+                    streamer.wake()
+                    task.cancel()
+                    return
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': self._headers(streamer.mime_type(), streamer.headers),
+        })
+
+        watcher = asyncio.ensure_future(disconnect())
+        try:
+            async for chunk in relay(streamer.stream(stop), stop):
+                await send({
+                    'type': 'http.response.body', 'body': chunk, 'more_body': True
+                })
+            await send({'type': 'http.response.body', 'body': b''})
+        except (OSError, asyncio.CancelledError):
+            log.debug("client disconnected while streaming")
+        finally:
+            stop.set()
+            streamer.wake()
+            watcher.cancel()
+
+    async def _get_file(self, file: str, send: Send) -> None:
+        self._server.active()
+
+        path = os.path.abspath(os.path.join(self._ui, *file.split('/')))
+        if os.path.commonpath([path, self._ui]) != self._ui or not os.path.isfile(path):
+            await self._respond(send, 404)
+            return
+
+        def read() -> bytes:
+            with open(path, 'rb') as f:
+                return f.read()
+
+        log.debug(f"serving '{file}'")
+        body = await asyncio.get_running_loop().run_in_executor(self._executor, read)
+        await self._respond(
+            send, 200, body,
+            mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        )
+
+    @staticmethod
+    async def _body(receive: Receive) -> bytes:
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body', False):
+                return body
+
+    @staticmethod
+    def _args(scope: Scope) -> Dict[str, str]:
+        args: Dict[str, str] = {}
+        for k, v in parse_qsl(
+                scope.get('query_string', b'').decode('utf-8'),
+                keep_blank_values=True
+        ):
+            args.setdefault(k, v)
+        return args
+
+    @staticmethod
+    def _headers(content_type: str, headers: Optional[dict] = None) \
+            -> List[Tuple[bytes, bytes]]:
+        encoded = [(b'content-type', content_type.encode('latin-1'))]
+        if headers is not None:
+            encoded += [
+                (k.lower().encode('latin-1'), str(v).encode('latin-1'))
+                for k, v in headers.items()
+            ]
+        return encoded
+
+    async def _respond(self, send: Send, status: int, body: bytes = b'',
+                       content_type: str = 'text/plain') -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': self._headers(content_type) + [
+                (b'content-length', str(len(body)).encode('latin-1'))
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
@@ -16,16 +16,17 @@ from pathlib import Path
 import argparse
 import shutil
 from functools import lru_cache
-from typing import List, Callable, Optional, Tuple
+from typing import List, Callable, Optional, Tuple, TYPE_CHECKING
 from urllib.request import urlretrieve
 from zipfile import ZipFile
 
-from distutils.util import strtobool
-import git
-import requests
-
 from shapeflow import __version__, get_logger, settings
-from shapeflow.util import before_version, after_version, suppress_stdout
+from shapeflow.util import before_version, after_version, suppress_stdout, \
+    strtobool
+
+if TYPE_CHECKING:
+    # git & requests are only imported by the commands that use them
+    import git
 
 
 log = get_logger(__name__)
@@ -261,6 +262,7 @@ class Serve(Command):
         if self._in_use():
             log.info('address already in use')
 
+            import requests
             requests.post(f"http://{self.args.host}:{self.args.port}/api/quit")
             while self._in_use():
                 time.sleep(0.1)
@@ -313,7 +315,9 @@ class GitMixin(abc.ABC):
     _latest = None
 
     @property
-    def repo(self) -> git.Repo:
+    def repo(self) -> 'git.Repo':
+        import git
+
         if self._repo is None:
             self._repo = git.Repo()
             self._repo.remote().fetch()
@@ -322,6 +326,7 @@ class GitMixin(abc.ABC):
     @property
     def latest(self) -> str:
         if self._latest is None:
+            import requests
             response = requests.head(self.URL + 'releases/latest')
             self._latest = response.headers['location'].split('/')[-1]
         return self._latest
@@ -335,6 +340,8 @@ class GitMixin(abc.ABC):
 
     @property
     def tag(self) -> str:
+        import git
+
         try:
             return self.repo.git.describe('--exact-match', '--tag')
         except git.GitCommandError:
@@ -342,6 +349,7 @@ class GitMixin(abc.ABC):
 
     @lru_cache()
     def is_at_release(self, tag: str) -> bool:
+        import requests
         return requests.head(self.URL + 'releases/tag/' + tag).status_code == 200
 
     @property
@@ -349,12 +357,16 @@ class GitMixin(abc.ABC):
         return self.URL + f'releases/download/{self.tag}/dist-{self.tag}.tar.gz'
 
     def _is_a_ref(self, ref: str) -> bool:
+        import git
+
         try:
             return len(self.repo.git.rev_list('-n', '1', ref)) > 0
         except git.GitCommandError:
             return False
 
     def _is_after_0_4_4(self, ref: str) -> bool:
+        import git
+
         try:
             return before_version('0.4.4', ref)
         except ValueError:
@@ -1,4 +1,5 @@
 from typing import Optional, Tuple, Dict, Any, Type, Union
+import copy
 import json
 
 from pydantic import Field, validator
@@ -10,6 +11,7 @@ from shapeflow.core.config import extend, ConfigType, \
 from shapeflow.core.backend import BaseAnalyzerConfig, \
     FeatureType, FeatureConfig, AnalyzerState, QueueState
 from shapeflow.core import EnforcedStr
+from shapeflow.core.registry import registry
 from shapeflow.core.interface import FilterType, TransformType, TransformConfig, \
     FilterConfig, HandlerConfig
 from shapeflow.maths.coordinates import Roi
@@ -18,6 +20,12 @@ from shapeflow.maths.colors import HsvColor
 from shapeflow.util import before_version
 
 
+_schemas: Dict[Any, Tuple[int, dict]] = {}
+"""Memoized schemas, along with the plugin registry version they were
+generated for.
+"""
+
+
 class ColorSpace(EnforcedStr):  # todo: this is never used outside of tests
     _options = ['hsv', 'bgr', 'rgb']
 
@@ -173,10 +181,22 @@ class VideoAnalyzerConfig(BaseAnalyzerConfig):
 
     @classmethod
     def schema(cls, by_alias: bool = True, ref_template: str = '') -> Dict[str, Any]:
-        schema = super().schema(by_alias)
+        """Get the JSON schema, including the schemas of all
+        feature, transform and filter implementations.
+
+        The schema is memoized until the available plugins change
+        ~ :attr:`shapeflow.core.registry.PluginRegistry.version`,
+        so it shouldn't be modified.
+        """
+        key = (cls, by_alias)
+        if key in _schemas and _schemas[key][0] == registry.version:
+            return _schemas[key][1]
+
+        schema = copy.deepcopy(super().schema(by_alias))
 
+        # pydantic caches schemas; copy them before moving definitions around
         schema.update({
-            'implementations': {  # add implementation schemas to schema
+            'implementations': copy.deepcopy({  # add implementation schemas to schema
                 'FeatureConfig': {
                     feature: FeatureType(feature).config_schema()
                     for feature in FeatureType().options
@@ -189,7 +209,7 @@ class VideoAnalyzerConfig(BaseAnalyzerConfig):
                     filter: FilterType(filter).config_schema()
                     for filter in FilterType().options
                 },
-            },
+            }),
             'shapeflow_version': __version__,  # add version to schema
         })
 
@@ -199,6 +219,8 @@ class VideoAnalyzerConfig(BaseAnalyzerConfig):
                 if 'definitions' in implementation:
                     schema['definitions'].update(implementation.pop('definitions'))
 
+        # Loading plugins while building the schema changes the version
+        _schemas[key] = (registry.version, schema)
         return schema
 
 
@@ -278,13 +300,20 @@ def schemas() -> Dict[str, dict]:
     * :class:`shapeflow.core.backend.AnalyzerState`
 
     * :class:`shapeflow.core.backend.QueueState`
+
+    The schemas are memoized until the available plugins change
+    ~ :attr:`shapeflow.core.registry.PluginRegistry.version`,
+    so they shouldn't be modified.
     """
-    return {
-        'config': VideoAnalyzerConfig.schema(),
-        'settings': settings.schema(),
-        'analyzer_state': dict(AnalyzerState.__members__),
-        'queue_state': dict(QueueState.__members__),
-    }
+    if 'all' not in _schemas or _schemas['all'][0] != registry.version:
+        config = VideoAnalyzerConfig.schema()
+        _schemas['all'] = (registry.version, {
+            'config': config,
+            'settings': settings.schema(),
+            'analyzer_state': dict(AnalyzerState.__members__),
+            'queue_state': dict(QueueState.__members__),
+        })
+    return _schemas['all'][1]
 
 def loads(config: str) -> BaseConfig:
     """Load a configuration object from a JSON string.
@@ -333,6 +362,10 @@ def normalize_config(d: dict) -> dict:
     if len(d) == 0:
         return d
 
+    # Configurations written by this version don't need to be normalized
+    if d.get(VERSION) == __version__ and d.get(CLASS) == VideoAnalyzerConfig.__name__:
+        return untag(d)
+
     # Deal with legacy formatting
     if VERSION not in d or CLASS not in d:
         if 'version' in d:
@@ -1,6 +1,7 @@
 import abc
+import json
 import threading
-from typing import Callable, Dict, List, Tuple, Type, Optional, _GenericAlias, Any  # type: ignore
+from typing import Callable, Dict, List, Tuple, Type, Optional, _GenericAlias, Any, Union  # type: ignore
 import collections
 from contextlib import contextmanager
 
@@ -149,6 +150,48 @@ stream_json = _Streaming('json')
 stream_plain = _Streaming('plain')
 
 
+def _bool(value: str) -> bool:
+    if value.lower() in ('true', '1', 'yes', 'on'):
+        return True
+    elif value.lower() in ('false', '0', 'no', 'off'):
+        return False
+    else:
+        raise ValueError(f"can't interpret '{value}' as a bool")
+
+
+def _coercer(annotation: Any) -> Optional[Callable[[str], Any]]:
+    """Get a function to convert a query argument string to an annotated type.
+
+    Parameters
+    ----------
+    annotation
+        A type annotation
+
+    Returns
+    -------
+    Optional[Callable[[str], Any]]
+        A function that converts a ``str`` to the annotated type,
+        or ``None`` if values should be passed on as they are.
+    """
+    origin = getattr(annotation, '__origin__', None)
+
+    if origin is Union:
+        types = [t for t in annotation.__args__ if t is not type(None)]
+        if len(types) == 1:
+            coerce = _coercer(types[0])
+            if coerce is not None:
+                return lambda value: None if value in ('null', 'None') else coerce(value)
+        return None
+    elif annotation is bool:
+        return _bool
+    elif annotation in (int, float):
+        return annotation
+    elif annotation in (list, dict) or origin in (list, dict):
+        return json.loads
+    else:
+        return None
+
+
 class Endpoint(object):
     """An endpoint for an internal method.
     """
@@ -156,6 +199,7 @@ class Endpoint(object):
     _registered: bool
     _signature: Type[Callable]
     _method: Optional[Callable]
+    _coercion: Dict[str, Callable[[str], Any]]
     _streaming: _Streaming
     _update: Optional[Callable[['Endpoint'], None]]
 
@@ -167,6 +211,7 @@ class Endpoint(object):
             raise TypeError('Invalid Endpoint signature')
 
         self._method = None
+        self._coercion = {}
         self._update = None
         self._registered = False
         self._signature = signature
@@ -219,6 +264,12 @@ class Endpoint(object):
 
             method._endpoint = self
             self._method = method
+            self._coercion = {}
+            for arg, annotation in method.__annotations__.items():
+                coerce = _coercer(annotation)
+                if arg != 'return' and coerce is not None:
+                    self._coercion[arg] = coerce
+
             if self._update is not None:
                 self._update(self)
 
@@ -231,6 +282,30 @@ class Endpoint(object):
         """
         return self._method
 
+    def coerce(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert ``str`` arguments to the types the exposed method is
+        annotated with, e.g. for arguments taken from a query string.
+        Values that can't be converted are passed on as they are.
+
+        Parameters
+        ----------
+        kwargs : Dict[str, Any]
+            Keyword arguments for the exposed method. Modified in place.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The converted keyword arguments
+        """
+        for arg, coerce in self._coercion.items():
+            value = kwargs.get(arg)
+            if isinstance(value, str):
+                try:
+                    kwargs[arg] = coerce(value)
+                except (ValueError, TypeError):
+                    pass
+        return kwargs
+
     @property
     def signature(self) -> tuple:
         """The signature of this endpoint.
@@ -269,26 +344,27 @@ class Endpoint(object):
 
 class Dispatcher(object):  # todo: these should also register specific instances & handle dispatching?
     """Dispatches requests to :class:`shapeflow.core.Endpoint` objects.
+
+    Addresses are resolved one segment at a time: each dispatcher only knows
+    about its own endpoints and the dispatchers nested directly in it, so
+    nested dispatchers can be added and removed without touching the rest.
     """
     _endpoints: Tuple[Endpoint, ...]  #type: ignore
-    _dispatchers: Tuple['Dispatcher', ...]
 
     _name: str
     _parent: Optional['Dispatcher']
-    _address_space: Dict[str, Optional[Callable]]
-
-    _update: Optional[Callable[['Dispatcher'], None]]
+    _methods: Dict[str, Optional[Callable]]
+    _routes: Dict[str, 'Dispatcher']
 
     _instance: Optional[object]
 
     def __init__(self, instance: object = None):
-        self._update = None
         if instance is not None:
             self._set_instance(instance)
         else:
-            self._address_space = {}
+            self._methods = {}
+            self._routes = {}
             self._endpoints = tuple()
-            self._dispatchers = tuple()
 
     @property
     def name(self) -> str:
@@ -303,7 +379,7 @@ class Dispatcher(object):  # todo: these should also register specific instances
     def dispatchers(self) -> Tuple['Dispatcher', ...]:
         """The dispatchers nested in this dispatcher.
         """
-        return self._dispatchers
+        return tuple(self._routes.values())
 
     @property
     def endpoints(self) -> Tuple[Endpoint, ...]:
@@ -313,15 +389,23 @@ class Dispatcher(object):  # todo: these should also register specific instances
 
     @property
     def address_space(self) -> Dict[str, Optional[Callable]]:
-        """The address-method mapping of this dispatcher.
+        """The address-method mapping of this dispatcher,
+        including nested dispatchers.
         """
-        return self._address_space
+        address_space = dict(self._methods)
+        for name, dispatcher in self._routes.items():
+            address_space.update({
+                "/".join([name, address]): method
+                for address, method in dispatcher.address_space.items()
+                if method is not None and "__" not in address
+            })
+        return address_space
 
     def _set_instance(self, instance: object):
         self._instance = instance
-        self._address_space = {}
+        self._methods = {}
+        self._routes = {}
         self._endpoints = tuple()
-        self._dispatchers = tuple()
 
         for attr, val in self.__class__.__dict__.items():
             if isinstance(val, Endpoint):  # todo: also register dispatchers
@@ -329,10 +413,9 @@ class Dispatcher(object):  # todo: these should also register specific instances
             elif isinstance(val, Dispatcher):
                 self._add_dispatcher(attr, val)
 
-    def _register(self, name: str, callback: Callable[['Dispatcher'], None]):
+    def _register(self, name: str):
         """Register this dispatcher within another dispatcher.
         """
-        self._update = callback
         self._name = name
 
     def _add_endpoint(self, name: str, endpoint: Endpoint):
@@ -343,47 +426,41 @@ class Dispatcher(object):  # todo: these should also register specific instances
         else:
             method = endpoint.method
 
-        self._address_space[name] = method
+        self._methods[name] = method
         self._endpoints = tuple(list(self._endpoints) + [endpoint])
         setattr(self, name, endpoint)
 
-        if self._update is not None:
-            self._update(self)
-
     def _add_dispatcher(self, name: str, dispatcher: 'Dispatcher'):
-        dispatcher._register(name=name, callback=self._update_dispatcher)
-
-        self._address_space.update({
-            "/".join([name, address]): method
-            for address, method in dispatcher.address_space.items()
-            if method is not None and "__" not in address
-        })
-        self._dispatchers = tuple(list(self._dispatchers) + [dispatcher])
+        dispatcher._register(name=name)
+
+        self._routes[name] = dispatcher
         setattr(self, name, dispatcher)
 
-        if self._update is not None:
-            self._update(self)
+    def _remove_dispatcher(self, name: str):
+        del self._routes[name]
+        delattr(self, name)
 
     def _update_endpoint(self, endpoint: Endpoint) -> None:
-        self._address_space.update({
-            endpoint.name: endpoint.method
-        })
-        if self._update is not None:
-            self._update(self)
-
-    def _update_dispatcher(self, dispatcher: 'Dispatcher') -> None:
-        self._address_space.update({  # todo: this doesn't take into account deleted keys!
-            "/".join([dispatcher.name, address]): method
-            for address, method in dispatcher.address_space.items()
-            if method is not None and "__" not in address
-        })
-
-        if self._update is not None:
-            self._update(self)
+        self._methods[endpoint.name] = endpoint.method
+
+    def _resolve(self, address: str) -> Optional[Callable]:
+        dispatcher = self
+        *path, name = address.split('/')
+
+        for segment in path:
+            if "__" in segment:
+                raise KeyError(segment)
+            dispatcher = dispatcher._routes[segment]
+
+        return dispatcher._methods[name]
 
     def dispatch(self, address: str, *args, **kwargs) -> Any:
         """Dispatch a request to a method.
 
+        Keyword arguments that are passed as ``str`` are converted to the
+        types the method is annotated with ~
+        :func:`~shapeflow.core.Endpoint.coerce`.
+
         Parameters
         ----------
         address : str
@@ -399,16 +476,17 @@ class Dispatcher(object):  # todo: these should also register specific instances
             Whatever the method returns.
         """
         try:
-            method = self.address_space[address]
-
-            if method is not None:
-                # todo: consider doing some type checking here, args/kwargs vs. method._endpoint.signature
-                return method(*args, **kwargs)
+            method = self._resolve(address)
         except KeyError:
             raise DispatchingError(
                 f"'{self.name}' can't dispatch address '{address}'."
             )
 
+        if method is not None:
+            if kwargs and hasattr(method, '_endpoint'):
+                kwargs = method._endpoint.coerce(kwargs)
+            return method(*args, **kwargs)
+
     def dispatch_async(self, address: str, *args, **kwargs) -> None:
         def _dispatch():
             self.dispatch(address, *args, **kwargs)
@@ -6,10 +6,10 @@ import abc
 import time
 import threading
 from contextlib import contextmanager
-from typing import Any, List, Optional, Tuple, Dict, Type, Mapping
+from typing import Any, List, Optional, Tuple, Dict, Type, Mapping, \
+    TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 from pydantic import Field
 
@@ -26,6 +26,10 @@ from shapeflow.core.streaming import EventStreamer
 
 from shapeflow.core.interface import InterfaceType
 
+if TYPE_CHECKING:
+    # pandas is slow to import, only import it when results are set up
+    import pandas as pd
+
 
 log = get_logger(__name__)
 
@@ -184,7 +188,7 @@ class CachingInstance(Instance):  # todo: consider a waterfall cache: e.g. 2 GB
                     # Some other thread is currently reading the same frame
                     # Wait a bit and try to get from cache again
                     log.debug(f'{self.__class__.__qualname__}: '
-                              f'waiting for {key} to be released...', 5)
+                              f'waiting for {key} to be released...')
                     time.sleep(0.01)
 
                 value = self._from_cache(key)
@@ -478,6 +482,7 @@ class FeatureType(InterfaceType):
         """Modify ``pydantic`` schema to include units and labels.
         """
         super().__modify_schema__(field_schema)
+        cls._load()
         field_schema.update(
             units={ k:v._unit for k,v in cls._mapping.items() },
             labels={ k:v._label for k,v in cls._mapping.items() }
@@ -501,11 +506,14 @@ class BaseAnalyzer(Instance, RootInstance, metaclass=abc.ABCMeta):
     _state: int
     _busy: bool
     _progress: float
+    _progress_pushed: float
+    _progress_timer: Optional[threading.Timer]
+    _progress_lock: threading.Lock
 
     _cancel: threading.Event
     _error: threading.Event
 
-    results: Dict[str, pd.DataFrame]
+    results: Dict[str, 'pd.DataFrame']
 
     _timer: Timer
 
@@ -531,6 +539,9 @@ class BaseAnalyzer(Instance, RootInstance, metaclass=abc.ABCMeta):
         self._state: AnalyzerState = AnalyzerState.INCOMPLETE
         self._busy = False
         self._progress = 0.0
+        self._progress_pushed = 0.0
+        self._progress_timer = None
+        self._progress_lock = threading.Lock()
         self._model = None
 
         self._cancel = threading.Event()
@@ -743,10 +754,45 @@ class BaseAnalyzer(Instance, RootInstance, metaclass=abc.ABCMeta):
         self.set_state(AnalyzerState.ERROR)
 
     def set_progress(self, progress: float, push: bool = True):
+        """Set the analyzer's progress.
+
+        Progress is pushed at most once every
+        :attr:`shapeflow.StreamSettings.progress_interval`. Updates that come
+        in faster are combined into a single push at the end of the interval.
+
+        Parameters
+        ----------
+        progress : float
+            The progress, from 0 to 1
+        push : bool
+            Whether to push the analyzer's status
+        """
         self._progress = progress
         if push:
+            with self._progress_lock:
+                if self._progress_timer is not None:
+                    # The pending push will include this update
+                    return
+
+                wait = self._progress_pushed \
+                       + settings.stream.progress_interval - time.monotonic()
+                if wait > 0:
+                    self._progress_timer = threading.Timer(
+                        wait, self._push_progress
+                    )
+                    self._progress_timer.daemon = True
+                    self._progress_timer.start()
+                    return
+
+                self._progress_pushed = time.monotonic()
             self.push_status()
 
+    def _push_progress(self):
+        with self._progress_lock:
+            self._progress_timer = None
+            self._progress_pushed = time.monotonic()
+        self.push_status()
+
     @property
     def progress(self) -> float:
         return self._progress
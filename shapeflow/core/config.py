@@ -1,12 +1,14 @@
 import abc
 import copy
-from typing import Optional, Union, Type, Dict, Mapping, List
+import itertools
+from typing import Optional, Union, Type, Dict, Mapping, List, Any
 
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from shapeflow import get_logger, __version__
 from shapeflow.core import EnforcedStr, Described
+from shapeflow.core.registry import registry
 from shapeflow.util import ndarray2str
 
 log = get_logger(__name__)
@@ -23,6 +25,10 @@ __meta_ext__ = '.meta'
 # Excel sheet name
 __meta_sheet__ = 'metadata'
 
+# Configuration version stamps
+_stamps = itertools.count(1)
+_nested: Dict[type, List[str]] = {}
+
 
 # todo: move up to shapeflow.core
 class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issubclass check
@@ -30,6 +36,10 @@ class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issub
 
     Included types should be subclasses of :class:`~shapeflow.core.Described`
     in order to generate descriptions for all options.
+
+    Options can also be provided by plugins in the
+    :data:`~shapeflow.core.registry.registry`; these are only imported
+    once their type is needed.
     """
     _mapping: Mapping[str, Type[Described]] = {}
     _default: Optional[str] = None
@@ -38,6 +48,8 @@ class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issub
     def get(self) -> Type[Described]:
         """Get the type associated with the current string.
         """
+        if self._str not in self._mapping:
+            registry.load(self.__class__, self._str)
         if self._str in self._mapping:
             return self._mapping[self._str]
         else:
@@ -56,12 +68,16 @@ class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issub
     def options(self) -> List[str]:
         """The options for this factory.
         """
-        return list(self._mapping.keys())
+        return list(self._mapping.keys()) + [
+            name for name in registry.pending(self.__class__)
+            if name not in self._mapping
+        ]
 
     @property
     def descriptions(self) -> Dict[str, str]:
         """The descriptions for this factory.
         """
+        self._load()
         return { k:v._description() for k,v in self._mapping.items() }
 
     @property
@@ -71,11 +87,18 @@ class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issub
         if self._default is not None:
             return self._default
         else:
-            if hasattr(self, '_mapping') and len(self._mapping):
-                return list(self._mapping.keys())[0]
+            options = self.options
+            if len(options):
+                return options[0]
             else:
                 return None
 
+    @classmethod
+    def _load(cls) -> None:
+        """Load all plugins for this factory
+        """
+        registry.load_all(cls)
+
     @classmethod
     def extend(cls, key: str, extension: Type[Described]):
         """Add a new type to this factory.
@@ -90,6 +113,7 @@ class Factory(EnforcedStr, metaclass=abc.ABCMeta):  # todo: add a _class & issub
             log.debug(f"Extending Factory '{cls.__name__}' "
                       f"with {{'{key}': {extension}}}")
             cls._mapping.update({key: extension})
+            registry.changed()
         else:
             raise TypeError(f"Attempting to extend Factory '{cls.__name__}' "
                             f"with incompatible class {extension.__name__}")
@@ -128,6 +152,39 @@ class extend(object):  # todo: can this be a function instead? look at the @data
         return cls
 
 
+def _version(value: Any) -> Any:
+    """The version of a configuration field value;
+    ``None`` for anything that doesn't contain configuration objects.
+    """
+    if isinstance(value, BaseConfig):
+        return value.version
+    elif isinstance(value, (tuple, list)) \
+            and any(isinstance(v, BaseConfig) for v in value):
+        return tuple(_version(v) for v in value)
+    else:
+        return None
+
+
+def _unchanged(old: Any, new: Any) -> bool:
+    """Whether a configuration field value is unchanged after assignment.
+    Configuration objects are compared by version instead of by value.
+    """
+    if old is new:
+        return True
+    elif isinstance(old, BaseConfig) or isinstance(new, BaseConfig):
+        return type(old) is type(new) and old.version == new.version
+    elif isinstance(old, tuple) and isinstance(new, tuple):
+        return len(old) == len(new) and all(map(_unchanged, old, new))
+    elif isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        return isinstance(old, np.ndarray) and isinstance(new, np.ndarray) \
+               and np.array_equal(old, new)
+    else:
+        try:
+            return bool(old == new)
+        except Exception:
+            return False
+
+
 def untag(d: dict) -> dict:
     """Remove the tags from a configuration ``dict``
 
@@ -165,6 +222,11 @@ class BaseConfig(BaseModel, Described):
             # saving
             dict_with_fields_and_values = config.to_dict()
 
+            # checking for changes
+            version = config.version
+            config(field1=2.0)
+            assert config.version != version
+
     When writing ``BaseConfig`` subclasses, use the
     :class:`~shapeflow.core.config.extend` decorator to make your
     configuration class accessible through the
@@ -193,6 +255,41 @@ class BaseConfig(BaseModel, Described):
             EnforcedStr: str,
         }
 
+    _version: int = PrivateAttr(default=0)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._version = next(_stamps)
+
+    def __setattr__(self, name, value):
+        if name in self.__fields__:
+            old = self.__dict__.get(name)
+            super().__setattr__(name, value)
+            if not _unchanged(old, self.__dict__.get(name)):
+                self._version = next(_stamps)
+        else:
+            super().__setattr__(name, value)
+
+    @property
+    def version(self) -> tuple:
+        """The version of this configuration object and its nested
+        configuration objects.
+
+        Changes whenever a field is assigned a different value, anywhere in
+        the tree, so checking whether a configuration has changed doesn't
+        require a copy to compare against. Copies share the version of the
+        original until either is changed.
+        """
+        try:
+            nested = _nested[self.__class__]
+        except KeyError:
+            nested = _nested.setdefault(self.__class__, [
+                name for name, field in self.__fields__.items()
+                if not isinstance(field.type_, type)
+                   or issubclass(field.type_, BaseConfig)
+            ])
+        return (self._version, *(_version(self.__dict__[f]) for f in nested))
+
     @classmethod
     def _resolve_enforcedstr(cls, value, field):
         """Resolve :class:`~shapeflow.core.EnforcedStr` objects
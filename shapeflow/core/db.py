@@ -1,10 +1,10 @@
 import abc
-import queue
 import os
 import time
 from contextlib import contextmanager
 from typing import Optional, List, Type, Any, Tuple
 import datetime
+from concurrent.futures import Future
 
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session
@@ -15,7 +15,7 @@ from sqlalchemy.exc import InvalidRequestError
 
 from shapeflow import get_logger
 from shapeflow.core import RootException, RootInstance, Lockable
-from shapeflow.util import hash_file
+from shapeflow.core.identity import submit
 
 log = get_logger(__name__)
 Base = declarative_base()
@@ -143,7 +143,7 @@ class FileModel(DbModel):
     Files are hashed and resolved in order to keep a single entry per file.
     """
     __abstract__ = True
-    _hash_q: queue.Queue
+    _hash: Future
     _resolved: bool
     _path: str
 
@@ -170,15 +170,13 @@ class FileModel(DbModel):
     def _queue_hash(self, path: str) -> None:
         self._path = path
         if self._check_file():
-            self._hash_q = hash_file(self._path)
+            self._hash = submit(path)
         else:
             raise ValueError
-        if not self._hash_q.qsize():
-            log.debug(f"queueing hash for {path}")
 
     def _get_hash(self) -> str:
         try:
-            return self._hash_q.get()
+            return self._hash.result()
         except AttributeError:
             raise RootException(f"{self.__class__.__qualname__}: "
                                 f"get_hash() was called before queue_hash()")
@@ -189,14 +187,8 @@ class FileModel(DbModel):
         else:
             return False
 
-    def _join(self):
-        if self.hash is None:
-            if self._hash_q is not None:
-                while not self._hash_q.qsize():
-                    time.sleep(0.01)
-
     def resolve(self) -> 'FileModel':
-        """Resolve the file by its SHA1 hash ~ :func:`~shapeflow.util.hash_file`.
+        """Resolve the file by its hash ~ :func:`~shapeflow.core.identity.identify`.
 
         If the computed hash is new, the file is committed to the database.
         Otherwise, the original entry is re-used.
@@ -208,7 +200,6 @@ class FileModel(DbModel):
             instance representing the original database entry.
         """
         if not self.resolved:
-            self._join()
             hash = self._get_hash()
 
             with self.session(add=False) as s:
@@ -269,8 +260,8 @@ class BaseAnalysisModel(DbModel):
         to the database"""
 
     @abc.abstractmethod
-    def export_result(self, run: int = None) -> None:
-        """Export a result from the database"""
+    def export_result(self, run: int = None, manual: bool = False) -> Optional[Future]:
+        """Export a result from the database in the background"""
 
     @abc.abstractmethod
     def get_runs(self) -> int:
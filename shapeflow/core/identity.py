@@ -0,0 +1,155 @@
+"""File identification.
+
+Files are identified by their hash ~ :attr:`shapeflow.DatabaseSettings.hash_mode`.
+Hashes are remembered by path, size, modification time and inode in a
+persistent table, so files are only read again if they've changed.
+
+Files are hashed on a shared executor with a limited number of workers
+~ :attr:`shapeflow.DatabaseSettings.hash_workers`, so requests to hash
+many files at once don't end up competing for the disk.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Tuple, Dict
+
+import diskcache
+
+from shapeflow import settings, get_logger, FileHashMode
+from shapeflow.util import sha1_file, fingerprint_file
+
+log = get_logger(__name__)
+
+
+_table: Optional[diskcache.Cache] = None
+_table_dir: Optional[str] = None
+_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_pending: Dict[tuple, Future] = {}
+_pending_lock = threading.Lock()
+
+
+def _get_table() -> diskcache.Cache:
+    global _table, _table_dir
+
+    with _lock:
+        if _table is None or _table_dir != str(settings.db.identity_dir):
+            if _table is not None:
+                _table.close()
+            _table_dir = str(settings.db.identity_dir)
+            _table = diskcache.Cache(directory=_table_dir)
+        return _table
+
+
+def _key(path: str) -> Tuple[str, int, int, int, str]:
+    stat = os.stat(path)
+    return (
+        os.path.abspath(path), stat.st_size, stat.st_mtime_ns, stat.st_ino,
+        str(settings.db.hash_mode.value),
+    )
+
+
+def known(path: str) -> Optional[str]:
+    """Look up the hash of a file without reading it.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file
+
+    Returns
+    -------
+    Optional[str]
+        The hash of the file if it has been identified before and hasn't
+        changed since, ``None`` otherwise.
+    """
+    return _get_table().get(_key(path))
+
+
+def identify(path: str) -> str:
+    """Get the hash of a file.
+
+    The file is only read if it hasn't been identified before or has
+    changed since.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file
+
+    Returns
+    -------
+    str
+        The hash of the file
+    """
+    key = _key(path)
+    table = _get_table()
+
+    hash = table.get(key)
+    if hash is None:
+        log.debug(f"hashing '{path}' ({settings.db.hash_mode.value})")
+        if settings.db.hash_mode == FileHashMode.sampled:
+            hash = fingerprint_file(path)
+        else:
+            hash = sha1_file(path)
+        table.set(key, hash)
+    return hash
+
+
+def forget() -> None:
+    """Forget all file hashes.
+    """
+    _get_table().clear()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.db.hash_workers, thread_name_prefix='hash'
+            )
+        return _executor
+
+
+def submit(path: str) -> Future:
+    """Get the hash of a file without blocking the current thread.
+
+    Requests for a file that is already being hashed share the same
+    ``Future`` instead of reading the file again.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file
+
+    Returns
+    -------
+    Future
+        Resolves to the hash of the file
+    """
+    key = _key(path)
+
+    with _pending_lock:
+        if key in _pending:
+            return _pending[key]
+
+        hash = _get_table().get(key)
+        if hash is not None:
+            future: Future = Future()
+            future.set_result(hash)
+            return future
+
+        log.debug(f"queueing hash for {path}")
+        future = _get_executor().submit(identify, path)
+        _pending[key] = future
+
+    def _done(_):
+        with _pending_lock:
+            _pending.pop(key, None)
+    future.add_done_callback(_done)
+
+    return future
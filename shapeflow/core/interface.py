@@ -1,5 +1,5 @@
 import abc
-from typing import Type, Tuple, Optional, Dict, Mapping
+from typing import Any, Type, Tuple, Optional, Dict, Mapping
 
 import numpy as np
 
@@ -50,11 +50,13 @@ class Handler(abc.ABC):
 
     def set_implementation(self, implementation: str) -> str:
         """Set the implementation.
+        The current implementation is kept if it's of the same type.
         """
         impl_type: type = self._implementation_factory(implementation).get()
         assert issubclass(impl_type, self._implementation_class)
 
-        self._implementation = impl_type()
+        if type(getattr(self, '_implementation', None)) is not impl_type:
+            self._implementation = impl_type()
         return self._implementation_factory.get_str(  # todo: this is not necessary when using @extend(<Factory>)
             self._implementation.__class__
         )
@@ -283,6 +285,31 @@ class FilterInterface(Configurable, metaclass=abc.ABCMeta):
             The configuration's mean color
         """
 
+    def compile(self, filter) -> Any:
+        """Prepare a filter configuration for use in
+        :func:`~shapeflow.core.interface.FilterInterface.filter`.
+
+        Filters are applied to every frame, while their configuration only
+        changes every once in a while. Implementations can override this
+        method to work out anything that only depends on the configuration
+        in advance, e.g. as a lightweight object with ``__slots__``.
+        :class:`~shapeflow.video.FilterHandler` only compiles its
+        configuration again after it has changed.
+
+        The default implementation returns the configuration as-is.
+
+        Parameters
+        ----------
+        filter : FilterConfig
+            The filter configuration
+
+        Returns
+        -------
+        Any
+            The compiled filter configuration
+        """
+        return filter
+
     @abc.abstractmethod
     def filter(self, filter, image: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
         """Filter a frame.
@@ -290,7 +317,8 @@ class FilterInterface(Configurable, metaclass=abc.ABCMeta):
         Parameters
         ----------
         filter : FilterConfig
-            The filter configuration
+            The filter configuration, as compiled by
+            :func:`~shapeflow.core.interface.FilterInterface.compile`
         image : np.ndarray
             The frame to filter
         mask : Optional[np.ndarray]
@@ -0,0 +1,243 @@
+"""Plugin registry.
+
+Plugins are registered by name, along with the
+:class:`~shapeflow.core.config.Factory` classes they extend and the module
+that implements them. Registering a plugin doesn't import its module; that
+only happens once the plugin is first used, e.g. when a
+:class:`~shapeflow.core.config.Factory` is asked for its class or for the
+descriptions & schemas of all of its options.
+
+The registry only records the names of plugins and where to find them.
+Anything that's defined by the plugin itself, like its description or its
+configuration schema, is only known once its module has been imported.
+
+Third-party plugins are discovered through package
+`entry points <https://packaging.python.org/specifications/entry-points/>`_,
+see :func:`~shapeflow.core.registry.PluginRegistry.discover`.
+"""
+import threading
+import importlib
+import importlib.metadata
+from typing import Dict, List, Any
+
+from shapeflow import get_logger
+from shapeflow.core import RootException
+
+log = get_logger(__name__)
+
+
+class PluginError(RootException, ValueError):
+    """Raised if a plugin can't be loaded.
+
+    A :class:`ValueError`, like the error
+    :func:`~shapeflow.core.config.Factory.get` raises for options that don't
+    map to a class at all.
+    """
+    msg = 'Could not load plugin'
+
+
+class Plugin(object):
+    """Metadata of a plugin.
+
+    Parameters
+    ----------
+    name : str
+        The name of the plugin. Should match the key its classes are
+        registered with ~ :class:`~shapeflow.core.config.extend`
+    module : str
+        The module that implements the plugin
+    factories : List[type]
+        The :class:`~shapeflow.core.config.Factory` classes the plugin extends,
+        starting with the type of the plugin itself
+        (e.g. :class:`~shapeflow.core.interface.FilterType`)
+    """
+    name: str
+    module: str
+    factories: List[type]
+
+    _loaded: bool
+
+    def __init__(self, name: str, module: str, factories: List[type]):
+        self.name = name
+        self.module = module
+        self.factories = factories
+        self._loaded = False
+
+    @property
+    def type(self) -> type:
+        """The type of this plugin
+        """
+        return self.factories[0]
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the module of this plugin has been imported
+        """
+        return self._loaded
+
+    def load(self) -> None:
+        """Import the module of this plugin, if it hasn't been imported yet.
+
+        Raises
+        ------
+        PluginError
+            If the module can't be imported
+        """
+        if not self._loaded:
+            log.debug(f"loading plugin '{self.name}' from {self.module}")
+            try:
+                importlib.import_module(self.module)
+            except Exception as e:
+                raise PluginError(
+                    f"could not load plugin '{self.name}' from {self.module} "
+                    f"({e.__class__.__name__}: {e})"
+                )
+            self._loaded = True
+
+    def config_schema(self) -> dict:
+        """The configuration schema of this plugin.
+
+        The schema is generated from the plugin's configuration class, so this
+        imports the plugin's module if it hasn't been imported yet.
+
+        Raises
+        ------
+        PluginError
+            If the plugin can't be loaded
+        """
+        return self.type(self.name).config_schema()
+
+    def __repr__(self):
+        return f"<Plugin '{self.name}' ({self.module})>"
+
+
+class PluginRegistry(object):
+    """Keeps track of plugins without importing them.
+    """
+    _plugins: Dict[str, Plugin]
+    _lock: threading.Lock
+    _version: int
+
+    def __init__(self):
+        self._plugins = {}
+        self._lock = threading.Lock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Increments whenever plugins are registered, loaded or removed.
+        Can be used to invalidate anything derived from the available plugins,
+        e.g. schemas.
+        """
+        return self._version
+
+    def changed(self) -> None:
+        """Mark that the available plugins have changed.
+        """
+        with self._lock:
+            self._version += 1
+
+    def add(self, name: str, module: str, *factories: type) -> None:
+        """Register a plugin.
+
+        Parameters
+        ----------
+        name : str
+            The name of the plugin
+        module : str
+            The module that implements the plugin
+        factories
+            The :class:`~shapeflow.core.config.Factory` classes the
+            plugin extends
+        """
+        with self._lock:
+            if name in self._plugins:
+                log.warning(f"plugin '{name}' is already registered "
+                            f"from {self._plugins[name].module}, "
+                            f"ignoring {module}")
+            else:
+                self._plugins[name] = Plugin(name, module, list(factories))
+                self._version += 1
+
+    def discover(self, group: str, *factories: type) -> None:
+        """Register the plugins declared as entry points of installed packages.
+
+        The name of each entry point is the name of a plugin and its value is
+        the module that implements it, e.g. in ``setup.cfg``::
+
+            [options.entry_points]
+            shapeflow.filters =
+                MyFilter = my_package.MyFilter
+
+        Parameters
+        ----------
+        group : str
+            The entry point group
+        factories
+            The :class:`~shapeflow.core.config.Factory` classes the plugins
+            in this group extend
+        """
+        entry_points: Any = importlib.metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=group)
+        else:
+            entry_points = entry_points.get(group, [])
+
+        for entry_point in entry_points:
+            self.add(
+                entry_point.name,
+                entry_point.value.split(':')[0].strip(),
+                *factories
+            )
+
+    @property
+    def plugins(self) -> List[Plugin]:
+        """All registered plugins
+        """
+        return list(self._plugins.values())
+
+    def pending(self, factory: type) -> List[str]:
+        """The names of plugins for a factory that haven't been loaded yet.
+        """
+        return [
+            plugin.name for plugin in list(self._plugins.values())
+            if not plugin.loaded and factory in plugin.factories
+        ]
+
+    def load(self, factory: type, name: str) -> None:
+        """Load a plugin by name, if it extends a factory.
+
+        Raises
+        ------
+        PluginError
+            If the plugin can't be loaded. It's removed from the registry.
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None and factory in plugin.factories:
+            try:
+                plugin.load()
+            except PluginError:
+                self._remove(plugin.name)
+                raise
+
+    def load_all(self, factory: type) -> None:
+        """Load all plugins that extend a factory.
+        Plugins that can't be loaded are logged and removed from the registry.
+        """
+        for plugin in list(self._plugins.values()):
+            if factory in plugin.factories:
+                try:
+                    plugin.load()
+                except PluginError as e:
+                    log.error(str(e))
+                    self._remove(plugin.name)
+
+    def _remove(self, name: str) -> None:
+        with self._lock:
+            if self._plugins.pop(name, None) is not None:
+                self._version += 1
+
+
+registry = PluginRegistry()
+"""The global plugin registry
+"""
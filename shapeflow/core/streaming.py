@@ -3,16 +3,18 @@
 
 import abc
 import json
+import struct
+from collections import deque
 from threading import Thread
-from typing import Optional, Tuple, Generator, Callable, Dict, Type, Any, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Generator, Callable, Dict, Type, Any, Union, List, Set, Deque, Iterable
 from functools import wraps
 
-from shapeflow import get_logger
+from shapeflow import get_logger, settings, EventEncoding
 from shapeflow.core import Lockable, _Streaming
 
 from shapeflow.util import Singleton
 from shapeflow.util.meta import unbind
-import queue
 
 import threading
 import time
@@ -26,26 +28,71 @@ import cv2
 log = get_logger(__name__)
 
 
+_msgpack: Any = None
+
+
+def _get_msgpack() -> Any:
+    """Import ``msgpack`` if it's installed, only warn once if it isn't.
+    """
+    global _msgpack
+    if _msgpack is None:
+        try:
+            import msgpack
+            _msgpack = msgpack
+        except ImportError:
+            log.warning("msgpack is not installed, encoding events as JSON")
+            _msgpack = False
+    return _msgpack
+
+
 class BaseStreamer(abc.ABC):
     """Abstract streamer.
     """
-    _queue: queue.Queue
+    _queue: Deque[Any]
+    _ready: threading.Condition
     _stop: threading.Event
     _paused: bool
 
-    _empty_queue_timeout: float = 0.02
     _stop_timeout: float = 60
 
     _boundary: Optional[bytes] = None
     _content_type: Optional[bytes] = None
     _mime_type: Optional[str] = None
 
-    _double_yield: bool = False
+    _encoded: int
+    _dropped: int
+
+    _listeners: List[Callable[['BaseStreamer', Any], None]]
+    _active: int
 
     def __init__(self):
-        self._queue = queue.Queue()
+        self._queue = deque()
+        self._ready = threading.Condition(threading.RLock())
         self._stop = threading.Event()
         self._paused = False
+        self._encoded = 0
+        self._dropped = 0
+        self._listeners = []
+        self._active = 0
+
+    @property
+    def encoded(self) -> int:
+        """The number of values that were encoded for streaming
+        """
+        return self._encoded
+
+    @property
+    def dropped(self) -> int:
+        """The number of values that were dropped before they were encoded
+        """
+        return self._dropped
+
+    @property
+    def active(self) -> int:
+        """The number of streams that are currently open
+        """
+        with self._ready:
+            return self._active
 
     def push(self, value: Any) -> None:
         """Push something to the stream.
@@ -56,42 +103,111 @@ class BaseStreamer(abc.ABC):
             Anything, really. If it doesn't work, you'll hear it.
         """
         if self._validate(value):
-            self._queue.put(value)
+            # If everything is forwarded to listeners, don't pile up values
+            # that nothing is going to stream
+            with self._ready:
+                if self._active or not self._listeners:
+                    self._put(value)
+            self._notify(value)
         else:
             log.warning(f"{self.__class__.__name__}: skipping invalid value")
 
-    def stream(self) -> Generator[Any, None, None]:
+    def listen(self, callback: Callable[['BaseStreamer', Any], None]) -> None:
+        """Forward values that are pushed to this streamer.
+
+        Parameters
+        ----------
+        callback : Callable[[BaseStreamer, Any], None]
+            Called with this streamer and the value for every valid value
+            that's pushed. Should return quickly.
+        """
+        self._listeners.append(callback)
+
+    def unlisten(self, callback: Callable[['BaseStreamer', Any], None]) -> None:
+        """Stop forwarding values to a callback.
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _put(self, value: Any) -> None:
+        with self._ready:
+            self._queue.append(value)
+            self._ready.notify()
+
+    def _open(self) -> None:
+        with self._ready:
+            self._active += 1
+
+    def _close(self) -> None:
+        with self._ready:
+            self._active -= 1
+
+    def _stopped(self, stop: Optional[threading.Event]) -> bool:
+        return self._stop.is_set() or (stop is not None and stop.is_set())
+
+    def _notify(self, value: Any) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(self, value)
+            except Exception as e:
+                log.error(f"{self.__class__.__name__}: {e} occurred @ {callback}")
+
+    def stream(self, stop: Optional[threading.Event] = None) \
+            -> Generator[Any, None, None]:
         """Start a stream.
 
+        Blocks until something is pushed to the stream or the stream is
+        stopped, so idle streams don't have to poll.
+
+        Parameters
+        ----------
+        stop : Optional[threading.Event]
+            Set to end only this stream, e.g. when its client has
+            disconnected, followed by
+            :func:`~shapeflow.core.streaming.BaseStreamer.wake`.
+            The streamer itself and its other streams keep going.
+
         Returns
         -------
         Generator[Any, None, None]
             A generator that can be returned as a ``Flask`` response.
         """
         self._stop.clear()
+        self._open()
+
+        try:
+            while True:
+                with self._ready:
+                    while not (self._queue or self._stopped(stop)):
+                        self._ready.wait()
+                    if self._stopped(stop):
+                        break
+                    value = self._queue.popleft()
 
-        while not self._stop.is_set():
-            if not self._queue.empty():
-                value = self._queue.get()
                 output = self._decorate(self._encode(value))
 
                 if output is not None:
+                    self._encoded += 1
                     log.vdebug(f"{self}: yielding...")
                     yield output
-                    if self._double_yield:
-                        yield output   # todo: image streaming doesn't work properly if not yielded twice for some reason
                 else:
                     log.warning(f"{self.__class__.__name__}: encoding failed for {value}")
                     continue
-            else:
-                time.sleep(self._empty_queue_timeout)
+        finally:
+            self._close()
 
     def stop(self) -> None:
         """Stop the stream.
         """
         self._stop.set()
-        with self._queue.mutex:
-            self._queue.queue.clear()
+        self.wake()
+
+    def wake(self) -> None:
+        """Wake up all streams that are waiting for something to be pushed,
+        so they can check whether they should stop.
+        """
+        with self._ready:
+            self._ready.notify_all()
 
     @classmethod
     def mime_type(cls) -> str:
@@ -155,13 +271,14 @@ class PlainFileStreamer(BaseStreamer):
         def target():
             with open(self._path) as f:
                 while not self._stop.is_set():
-                    self._queue.put(f.read())
+                    self._put(f.read())
                     time.sleep(1)
         Thread(target=target).start()
 
-    def stream(self) -> Generator[Any, None, None]:
+    def stream(self, stop: Optional[threading.Event] = None) \
+            -> Generator[Any, None, None]:
         self.read()
-        return super().stream()  # todo: typing issue?
+        return super().stream(stop)  # todo: typing issue?
 
     def _validate(self, value: Any) -> bool:
         return True
@@ -206,7 +323,7 @@ class EventStreamer(JsonStreamer):
         :param data: event data
         :return:
         """
-        log.debug(f"pushing event - id:{id} category:{category} data:{data}")
+        log.debug("pushing event - id:%s category:%s data:%s", id, category, data)
         self.push({'category': category, 'id': id, 'data': data})
 
     def stop(self):
@@ -215,16 +332,169 @@ class EventStreamer(JsonStreamer):
 
 
 class FrameStreamer(BaseStreamer):
-    """Streams images.
+    """Streams images as ``multipart/x-mixed-replace``, i.e. MJPEG.
     Subclasses can define specific encodings, for now
     :class:`~shapeflow.core.streaming.JpegStreamer` seems to work best.
+
+    Every part is followed by the boundary of the next one, so browsers can
+    show each image as soon as it arrives.
+
+    If ``settings.stream.latest_only`` is set, frames are kept in a
+    single slot instead of a queue. Frames that are pushed before the
+    previous one was encoded replace it. Each frame is encoded once and
+    the result is shared between all streams of the streamer.
     """
     _boundary = b"frame"
 
-    _empty_queue_timeout: float = 0.02
     _stop_timeout: float = 60
 
-    _double_yield = True
+    _latest_only: bool
+
+    _slot: threading.Condition
+    _frame: Optional[np.ndarray]
+    _seq: int
+    _taken: int
+
+    _encoding: threading.Lock
+    _buffer: Optional[bytes]
+    _part: Optional[bytes]
+    _buffer_seq: int
+
+    def __init__(self):
+        super().__init__()
+        self._latest_only = settings.stream.latest_only
+
+        self._slot = threading.Condition()
+        self._frame = None
+        self._seq = 0
+        self._taken = 0
+
+        self._encoding = threading.Lock()
+        self._buffer = None
+        self._part = None
+        self._buffer_seq = 0
+
+    def push(self, value: Any) -> None:
+        if not self._latest_only:
+            super().push(value)
+        elif self._validate(value):
+            with self._slot:
+                if self._frame is not None and self._taken < self._seq:
+                    self._dropped += 1
+                self._frame = value
+                self._seq += 1
+                self._slot.notify_all()
+            self._notify(value)
+        else:
+            log.warning(f"{self.__class__.__name__}: skipping invalid value")
+
+    def _get(self, seen: int, stop: Optional[threading.Event] = None) \
+            -> Tuple[int, Optional[bytes]]:
+        """Wait for a frame that's newer than ``seen`` and encode it,
+        unless another stream has done so already.
+
+        Parameters
+        ----------
+        seen : int
+            The sequence number of the last frame that was streamed
+        stop : Optional[threading.Event]
+            Stop waiting for this stream only
+
+        Returns
+        -------
+        Tuple[int, Optional[bytes]]
+            The sequence number of the frame and the encoded frame
+        """
+        with self._slot:
+            while self._seq <= seen and not self._stopped(stop):
+                self._slot.wait()
+            if self._stopped(stop):
+                return seen, None
+            seq, frame = self._seq, self._frame
+            self._taken = max(self._taken, seq)
+
+        seq, _, part = self._encode_once(seq, frame)
+        return seq, part
+
+    def _encode_once(self, seq: int, frame: np.ndarray) \
+            -> Tuple[int, Optional[bytes], Optional[bytes]]:
+        with self._encoding:
+            if self._buffer_seq < seq:
+                self._buffer = self._encode(frame)
+                self._part = self._decorate(self._buffer)
+                self._buffer_seq = seq
+
+                if self._part is not None:
+                    self._encoded += 1
+                else:
+                    log.warning(f"{self.__class__.__name__}: encoding failed")
+            return self._buffer_seq, self._buffer, self._part
+
+    def latest(self) -> Optional[bytes]:
+        """Get the latest frame without waiting, encoded but not decorated.
+        Only works if ``settings.stream.latest_only`` is set.
+
+        Returns
+        -------
+        Optional[bytes]
+            The encoded frame, or ``None`` if there is no frame.
+        """
+        with self._slot:
+            seq, frame = self._seq, self._frame
+            if frame is None:
+                return None
+            self._taken = max(self._taken, seq)
+
+        _, buffer, _ = self._encode_once(seq, frame)
+        return buffer
+
+    def _latest(self, stop: Optional[threading.Event] = None) \
+            -> Generator[bytes, None, None]:
+        seen = 0
+        self._open()
+
+        try:
+            while True:
+                seen, output = self._get(seen, stop)
+
+                if self._stopped(stop):
+                    break
+                if output is not None:
+                    log.vdebug(f"{self}: yielding...")
+                    yield output
+        finally:
+            self._close()
+
+    def stream(self, stop: Optional[threading.Event] = None) \
+            -> Generator[Any, None, None]:
+        self._stop.clear()
+
+        if self._latest_only:
+            frames = self._latest(stop)
+        else:
+            frames = super().stream(stop)
+
+        # The first part is preceded by a boundary, the others come after
+        # the boundary that ends the previous part.
+        first = True
+        for output in frames:
+            if first:
+                output = b"--" + self._boundary + b"\r\n" + output
+                first = False
+            yield output
+
+    def stop(self) -> None:
+        super().stop()
+        with self._slot:
+            self._frame = None
+            self._slot.notify_all()
+
+    def wake(self) -> None:
+        super().wake()
+        with self._slot:
+            self._slot.notify_all()
+        log.debug(f"{self.__class__.__name__}: stopped after encoding "
+                  f"{self.encoded} frames, dropped {self.dropped} frames")
 
     def _validate(self, value: Any) -> bool:
         return isinstance(value, np.ndarray)
@@ -233,11 +503,11 @@ class FrameStreamer(BaseStreamer):
         if data is not None:
             try:
                 return (
-                    b"--frame\r\nContent-Type: "
-                    + self.content_type()
-                    + b"\r\n\r\n" +
-                    bytearray(data)
-                    + b"\r\n"
+                    b"Content-Type: " + self.content_type()
+                    + b"\r\nContent-Length: " + str(len(data)).encode('ascii')
+                    + b"\r\n\r\n"
+                    + bytes(data)
+                    + b"\r\n--" + self._boundary + b"\r\n"
                 )
             except Exception as e:
                 log.error(e)
@@ -246,24 +516,212 @@ class FrameStreamer(BaseStreamer):
             return None
 
 
-class JpegStreamer(FrameStreamer):  # todo: configure quality in settings
+class JpegStreamer(FrameStreamer):
     """Streams JPEG images.
+
+    Quality and size ~ :class:`~shapeflow.StreamSettings`.
     """
     _content_type = b"image/jpeg"
 
     def _encode(self, frame: np.ndarray) -> Optional[bytes]:
         # Assuming HSV input frame, cv2.imencode works with BGR
+        frame = cv2.cvtColor(frame, cv2.COLOR_HSV2BGR)
+
+        max_size = settings.stream.max_size
+        if max_size and max(frame.shape[:2]) > max_size:
+            scale = max_size / max(frame.shape[:2])
+            frame = cv2.resize(
+                frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+
         (success, encoded_frame) = cv2.imencode(
-            ".jpg", cv2.cvtColor(frame, cv2.COLOR_HSV2BGR),
-            params = [cv2.IMWRITE_JPEG_QUALITY, 85]
+            ".jpg", frame,
+            params = [cv2.IMWRITE_JPEG_QUALITY, settings.stream.jpeg_quality]
         )
 
         if success:
-            return encoded_frame
+            return encoded_frame.tobytes()
         else:
             return None
 
 
+class Multiplexer(BaseStreamer):
+    """Streams frames and events of several streamers over a single
+    connection, as tagged binary messages::
+
+        kind (1 byte) | channel length (2 bytes) | payload length (4 bytes) | channel | payload
+
+    Lengths are big-endian unsigned integers and channel names are UTF-8.
+    Frames (kind ``f``) are encoded by their
+    :class:`~shapeflow.core.streaming.FrameStreamer`, events are JSON
+    (kind ``e``) or MessagePack (kind ``m``)
+    ~ :attr:`shapeflow.StreamSettings.event_encoding`.
+
+    Events are sent in order. Frames that are superseded by a newer frame
+    on the same channel before they're sent are dropped, as are the oldest
+    events if more than :attr:`_max_events` are waiting to be sent.
+
+    Parameters
+    ----------
+    client : Optional[str]
+        Identifies the client this multiplexer belongs to.
+        If set, the multiplexer is removed from
+        :data:`~shapeflow.core.streaming.streams` once its stream ends.
+    """
+    _mime_type = "application/octet-stream"
+
+    _header = struct.Struct('>cHI')
+    _max_events: int = 1024
+
+    _client: Optional[str]
+    _channels: Dict[str, Tuple[BaseStreamer, Callable]]
+    _frames: Dict[str, Tuple[BaseStreamer, Any]]
+    _events: Deque[Tuple[str, BaseStreamer, Any]]
+
+    def __init__(self, client: Optional[str] = None):
+        super().__init__()
+        self._client = client
+        self._channels = {}
+        self._frames = {}
+        self._events = deque(maxlen=self._max_events)
+
+    @property
+    def channels(self) -> List[str]:
+        """The channels that are currently multiplexed
+        """
+        return list(self._channels.keys())
+
+    def add(self, channel: str, streamer: BaseStreamer) -> None:
+        """Start multiplexing a streamer.
+
+        Parameters
+        ----------
+        channel : str
+            The channel to send the streamer's values on
+        streamer : BaseStreamer
+            The streamer to multiplex
+        """
+        def forward(source: BaseStreamer, value: Any) -> None:
+            self._receive(channel, source, value)
+
+        with self._ready:
+            self.remove(channel)
+            self._channels[channel] = (streamer, forward)
+            streamer.listen(forward)
+
+            # Send the current frame right away
+            if isinstance(streamer, FrameStreamer) and streamer._frame is not None:
+                self._receive(channel, streamer, streamer._frame)
+
+    def remove(self, channel: str) -> None:
+        """Stop multiplexing a channel.
+
+        Parameters
+        ----------
+        channel : str
+            The channel to remove
+        """
+        with self._ready:
+            if channel in self._channels:
+                streamer, forward = self._channels.pop(channel)
+                streamer.unlisten(forward)
+                self._frames.pop(channel, None)
+
+    def _receive(self, channel: str, source: BaseStreamer, value: Any) -> None:
+        with self._ready:
+            if isinstance(source, FrameStreamer):
+                if channel in self._frames:
+                    self._dropped += 1
+                self._frames[channel] = (source, value)
+            else:
+                if len(self._events) == self._events.maxlen:
+                    self._dropped += 1
+                self._events.append((channel, source, value))
+            self._ready.notify_all()
+
+    def stream(self, stop: Optional[threading.Event] = None) \
+            -> Generator[Any, None, None]:
+        self._stop.clear()
+        self._open()
+
+        try:
+            while True:
+                with self._ready:
+                    while not (self._frames or self._events or self._stopped(stop)):
+                        self._ready.wait()
+                    if self._stopped(stop):
+                        break
+
+                    events = list(self._events)
+                    self._events.clear()
+                    frames, self._frames = self._frames, {}
+
+                messages = []
+                for channel, source, value in events:
+                    messages.append(self._event(channel, source, value))
+                for channel, (source, value) in frames.items():
+                    if isinstance(source, FrameStreamer) and source._latest_only:
+                        messages.append((b'f', channel, source.latest()))
+                    else:
+                        messages.append((b'f', channel, source._encode(value)))
+
+                output = self._decorate(self._encode(b''.join(
+                    self._pack(kind, channel, payload)
+                    for kind, channel, payload in messages
+                    if payload is not None
+                )))
+
+                if output:
+                    self._encoded += 1
+                    log.vdebug(f"{self}: yielding...")
+                    yield output
+        finally:
+            self._close()
+            # Don't keep forwarding to a client that's gone,
+            # even if it didn't stop its stream explicitly
+            self.stop()
+            if self._client is not None:
+                streams.demultiplex(self._client, self)
+
+    def _event(self, channel: str, source: BaseStreamer, value: Any) \
+            -> Tuple[bytes, str, Optional[bytes]]:
+        if settings.stream.event_encoding == EventEncoding.msgpack:
+            msgpack = _get_msgpack()
+            if msgpack:
+                try:
+                    return b'm', channel, msgpack.packb(value, default=str)
+                except Exception as e:
+                    log.warning(f"{self.__class__.__name__}: {e}, encoding as JSON")
+        return b'e', channel, source._encode(value)
+
+    def stop(self) -> None:
+        super().stop()
+        with self._ready:
+            for channel in self.channels:
+                self.remove(channel)
+            self._events.clear()
+            self._ready.notify_all()
+
+    def _validate(self, value: Any) -> bool:
+        return False
+
+    def _encode(self, value: Any) -> Optional[bytes]:
+        return value
+
+    def _pack(self, kind: bytes, channel: str, payload: bytes) -> bytes:
+        """Tag a payload with its kind and channel.
+        """
+        channel_bytes = channel.encode('utf-8')
+        return (
+            self._header.pack(kind, len(channel_bytes), len(payload))
+            + channel_bytes
+            + payload
+        )
+
+    def _decorate(self, value: Optional[bytes]) -> Optional[bytes]:
+        return value
+
+
 _stream_mapping: Dict[_Streaming, Type[BaseStreamer]] = {
     _Streaming('plain'): PlainFileStreamer,
     _Streaming('json'): JsonStreamer,
@@ -273,14 +731,38 @@ _stream_mapping: Dict[_Streaming, Type[BaseStreamer]] = {
 to :class:`~shapeflow.core.streaming.BaseStreamer` implementations.
 """
 
+def _unwrap(method: Callable) -> Callable:
+    """Resolve a method as it's registered in the
+    :class:`~shapeflow.core.streaming.StreamHandler`, i.e. unbound and not
+    wrapped by :func:`~shapeflow.core.streaming.stream`.
+    """
+    method = unbind(method)
+    return getattr(method, '__wrapped__', method)
+
+
 class StreamHandler(Lockable, metaclass=Singleton):
     """Handles streaming of method return values
+
+    Streams are updated in the background, on a small pool of threads
+    ~ :attr:`shapeflow.StreamSettings.update_workers`.
     """
     _streams: Dict[object, Dict[Callable, BaseStreamer]]
+    _multiplexers: Dict[str, Multiplexer]
+
+    _executor: Optional[ThreadPoolExecutor]
+    _updates: threading.Condition
+    _queued: Dict[object, Optional[Set[Callable]]]
+    _running: Set[object]
 
     def __init__(self):
         super().__init__()
         self._streams = {}
+        self._multiplexers = {}
+
+        self._executor = None
+        self._updates = threading.Condition()
+        self._queued = {}
+        self._running = set()
 
     def register(self, instance: object, method) -> BaseStreamer:
         """Register an instance/method combination, start a streamer.
@@ -384,35 +866,141 @@ class StreamHandler(Lockable, metaclass=Singleton):
                 for method in self._streams[instance].values():
                     _unregister(method)
 
-    def update(self) -> None:
-        """Update all streams.
+    def multiplex(self, client: str) -> Multiplexer:
+        """Get the :class:`~shapeflow.core.streaming.Multiplexer` of a client.
+        If the client doesn't have one yet, start one.
+
+        Parameters
+        ----------
+        client : str
+            Identifies the client
+
+        Returns
+        -------
+        Multiplexer
+            The client's multiplexer
+        """
+        with self.lock():
+            if client not in self._multiplexers:
+                log.debug(f"multiplexing streams for {client}")
+                self._multiplexers[client] = Multiplexer(client)
+            return self._multiplexers[client]
+
+    def demultiplex(self, client: str, multiplexer: Optional[Multiplexer] = None) -> None:
+        """Stop a client's :class:`~shapeflow.core.streaming.Multiplexer`.
 
-        For all registered streamers, invoke their ``method`` against their
-        ``instance`` and push the return value.
+        Parameters
+        ----------
+        client : str
+            Identifies the client
+        multiplexer : Optional[Multiplexer]
+            Only stop the client's multiplexer if it's this one.
+            Defaults to ``None``, i.e. stop it regardless.
         """
-        try:
-            for instance in self._streams.keys():
-                for method in self._streams[instance].keys():
-                    try:
-                        log.debug(f'updating {instance}, {method}')
-                        self.push(instance, method, method(instance))
-                    except Exception as e:
-                        log.error(f"{e} occured @ {instance}, {method}")
-        except RuntimeError:
-            log.debug(f"new stream opened while updating")
-            # Repeat the update. This doesn't happen too often,
-            # so don't worry about the performance hit.
-            self.update()
-            # Recursion could be problematic if too many streams are opened
-            # within a short time span, but this shouldn't be an issue.
-        except Exception as e:
-            log.error(f"{e} occurred")
+        with self.lock():
+            if client in self._multiplexers and (
+                    multiplexer is None
+                    or self._multiplexers[client] is multiplexer
+            ):
+                log.debug(f"stop multiplexing streams for {client}")
+                self._multiplexers.pop(client).stop()
+
+    def update(self, instance: Optional[object] = None,
+               methods: Optional[Iterable[Callable]] = None) -> None:
+        """Update streams in the background.
+
+        For all registered streamers of ``instance``, invoke their ``method``
+        against ``instance`` and push the return value.
+
+        Returns immediately. Updates for an instance that's already waiting
+        to be updated are coalesced, and the streams of a single instance
+        are never updated concurrently.
+
+        Parameters
+        ----------
+        instance : Optional[object]
+            The instance to update. If ``None``, update all instances.
+        methods : Optional[Iterable[Callable]]
+            The streaming methods to update. If ``None``, update all of them.
+        """
+        if instance is None:
+            instances = list(self._streams.keys())
+        else:
+            instances = [instance]
+
+        if methods is not None:
+            methods = {_unwrap(method) for method in methods}
+
+        with self._updates:
+            for instance in instances:
+                if not self.is_registered(instance):
+                    continue
+
+                if instance in self._queued:
+                    queued = self._queued[instance]
+                    if queued is not None:
+                        self._queued[instance] = \
+                            None if methods is None else queued | methods
+                    continue
+
+                self._queued[instance] = None if methods is None else set(methods)
+
+                # If it's being updated right now, it's updated again after
+                if instance not in self._running:
+                    self._running.add(instance)
+                    self._get_executor().submit(self._update, instance)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all streams are up to date.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            How long to wait, in seconds. If ``None``, wait indefinitely.
+
+        Returns
+        -------
+        bool
+            ``False`` if the timeout expired, ``True`` otherwise
+        """
+        with self._updates:
+            return self._updates.wait_for(
+                lambda: not self._running, timeout=timeout
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.stream.update_workers,
+                thread_name_prefix='stream-update'
+            )
+        return self._executor
+
+    def _update(self, instance: object) -> None:
+        while True:
+            with self._updates:
+                if instance not in self._queued:
+                    self._running.discard(instance)
+                    self._updates.notify_all()
+                    return
+                methods = self._queued.pop(instance)
+
+            for method in list(self._streams.get(instance, {}).keys()):
+                if methods is not None and method not in methods:
+                    continue
+                try:
+                    log.debug(f'updating {instance}, {method}')
+                    self.push(instance, method, method(instance))
+                except Exception as e:
+                    log.error(f"{e} occured @ {instance}, {method}")
 
     def stop(self) -> None:
         """Unregister everything and stop streaming altogether.
         """
         for instance in list(self._streams):
             self.unregister(instance)
+        for client in list(self._multiplexers):
+            self.demultiplex(client)
 
 
 streams = StreamHandler()
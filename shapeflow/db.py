@@ -1,21 +1,24 @@
 import os
 import json
 from typing import Optional, Tuple, List, Dict, Type
+from concurrent.futures import Future
 from pathlib import Path
 import datetime
 import sqlite3
 
 from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey
-
-import pandas as pd
+from sqlalchemy import create_engine, event, Column, Integer, Float, String, DateTime, ForeignKey, Index
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.exc import OperationalError
 
 from shapeflow.api import api
 from shapeflow.core import RootInstance
 from shapeflow.core.db import Base, DbModel, SessionWrapper, FileModel, BaseAnalysisModel
-from shapeflow import settings, get_logger, ResultSaveMode
-from shapeflow.core.config import __meta_sheet__
+from shapeflow import settings, get_logger, ResultSaveMode, __version__
+from shapeflow.export import ResultExport, submit
+from shapeflow.util.patch import diff, patch
 from shapeflow.config import normalize_config, VideoAnalyzerConfig
+from shapeflow.core.config import VERSION, untag
 from shapeflow.core.streaming import EventStreamer
 
 from shapeflow.core.backend import BaseAnalyzer, BaseAnalyzerConfig
@@ -57,10 +60,136 @@ class ConfigModel(DbModel):
     design = Column(Integer, ForeignKey('design_file.id'))
     analysis = Column(Integer, ForeignKey('analysis.id'))
 
+    seq = Column(Integer)
+    """Sequence number of the configuration within its analysis"""
+
     json = Column(String)
+    """The full configuration in JSON. Only set for snapshots."""
+    delta = Column(String)
+    """Patch from the previous configuration in JSON 
+    ~ :func:`shapeflow.util.patch.diff`. Only set if not a snapshot."""
+    version = Column(String)
+    """The version the configuration was written by. Configurations are
+    written in the current format, so only those written by older versions
+    (or before this column was added) have to be normalized when read."""
 
     added = Column(DateTime)
 
+    __table_args__ = (
+        Index('ix_config_video_design_added', 'video', 'design', 'added'),
+        Index('ix_config_analysis_seq', 'analysis', 'seq'),
+    )
+
+
+class ConfigChangeModel(DbModel):
+    """Database model of a change in configuration.
+
+    Marks that a field of the configuration at ``seq`` differs from the
+    configuration at the previous ``seq`` of the same analysis.
+    """
+    __tablename__ = 'config_change'
+
+    id = Column(Integer, primary_key=True)
+
+    analysis = Column(Integer, ForeignKey('analysis.id'))
+    seq = Column(Integer)
+    context = Column(String)
+    """The :class:`~shapeflow.config.VideoAnalyzerConfig` field that changed"""
+
+    __table_args__ = (
+        Index('ix_config_change_analysis_context_seq', 'analysis', 'context', 'seq'),
+    )
+
+
+def _loads(config_json: Optional[str]) -> Optional[dict]:
+    if config_json is None:
+        return None
+    return json.loads(config_json)
+
+
+def _reconstruct(s, model: Optional[ConfigModel]) -> Optional[dict]:
+    """Reconstruct a configuration from the database.
+
+    Snapshots are returned as-is. For other configurations, the deltas
+    since the latest snapshot of the same analysis are applied to it.
+
+    Parameters
+    ----------
+    s
+        An open session
+    model : Optional[ConfigModel]
+        The configuration to reconstruct
+
+    Returns
+    -------
+    Optional[dict]
+        The configuration, or ``None`` if it can't be reconstructed
+    """
+    if model is None:
+        return None
+    if model.json is not None:
+        return json.loads(model.json)
+    if model.delta is None or model.seq is None:
+        return None
+
+    snapshot = s.query(ConfigModel.seq, ConfigModel.json).\
+        filter(ConfigModel.analysis == model.analysis).\
+        filter(ConfigModel.seq < model.seq).\
+        filter(ConfigModel.json != None).\
+        order_by(ConfigModel.seq.desc()).first()
+    if snapshot is None:
+        log.warning(f"no snapshot to reconstruct config {model.id} from")
+        return None
+
+    deltas = [delta for delta, in s.query(ConfigModel.delta).\
+        filter(ConfigModel.analysis == model.analysis).\
+        filter(ConfigModel.seq > snapshot.seq).\
+        filter(ConfigModel.seq <= model.seq).\
+        order_by(ConfigModel.seq)]
+    if len(deltas) != model.seq - snapshot.seq or None in deltas:
+        log.warning(f"missing deltas to reconstruct config {model.id}")
+        return None
+
+    config = json.loads(snapshot.json)
+    for delta in deltas:
+        config = patch(config, json.loads(delta))
+    return config
+
+
+def _normalize(model: ConfigModel, config: Optional[dict]) -> Optional[dict]:
+    """Normalize a configuration from the database, unless it was written by
+    the current version ~ :attr:`~shapeflow.db.ConfigModel.version`.
+
+    Parameters
+    ----------
+    model : ConfigModel
+        The configuration model
+    config : Optional[dict]
+        The reconstructed configuration ~ :func:`~shapeflow.db._reconstruct`
+
+    Returns
+    -------
+    Optional[dict]
+        The normalized configuration without tags
+    """
+    if config is None:
+        return None
+    if model.version == __version__:
+        return untag(config)
+    return normalize_config(config)
+
+
+def _changed_fields(previous: Optional[dict], current: dict) -> List[str]:
+    """The :class:`~shapeflow.config.VideoAnalyzerConfig` fields that differ
+    between two configuration ``dict``s
+    """
+    if previous is None:
+        return []
+    return [
+        field for field in VideoAnalyzerConfig.__fields__
+        if previous.get(field) != current.get(field)
+    ]
+
 
 class ResultModel(DbModel):
     """Database model of a result.
@@ -83,6 +212,10 @@ class ResultModel(DbModel):
     finished = Column(DateTime)
     elapsed = Column(Float)
 
+    __table_args__ = (
+        Index('ix_results_analysis_run', 'analysis', 'run'),
+    )
+
 
 class AnalysisModel(BaseAnalysisModel):
     """Database model of an analysis.
@@ -96,7 +229,8 @@ class AnalysisModel(BaseAnalysisModel):
     _video: Optional[VideoFileModel]
     _design: Optional[DesignFileModel]
     _config: Optional[ConfigModel]
-    _added_by_context: Dict[str, datetime.datetime]
+    _config_cache: Optional[Tuple[int, Optional[dict]]]
+    _seq_by_context: Dict[str, int]
 
     id = Column(Integer, primary_key=True)
     runs = Column(Integer)
@@ -112,12 +246,16 @@ class AnalysisModel(BaseAnalysisModel):
     added = Column(DateTime)
     modified = Column(DateTime)
 
+    __table_args__ = (
+        Index('ix_analysis_modified', 'modified'),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._resolve_attributes()
 
     def _resolve_attributes(self):
-        for attr in ['_analyzer', '_video', '_design', '_config']:
+        for attr in ['_analyzer', '_video', '_design', '_config', '_config_cache']:
             if not hasattr(self, attr):
                 setattr(self, attr, None)
 
@@ -200,22 +338,66 @@ class AnalysisModel(BaseAnalysisModel):
             if self._design is not None:
                 self.design = self._design.id
 
-    def _add_config(self, json: str) -> Optional[ConfigModel]:
-        with self.session():
+    def _get_config_dict(self, model: ConfigModel) -> Optional[dict]:
+        id = model.get('id')
+        if self._config_cache is None or self._config_cache[0] != id:
+            with self.session() as s:
+                self._config_cache = (id, _reconstruct(
+                    s, s.query(ConfigModel).filter_by(id=id).first()
+                ))
+        return self._config_cache[1]
+
+    def _add_config(self, config_json: str) -> Optional[ConfigModel]:
+        with self.session() as s:
             video = self.video
             design = self.design
             analysis = self.id
 
-        if video is not None or design is not None:
+            if video is None and design is None:
+                return None
+
+            config = json.loads(config_json)
+            previous = s.query(ConfigModel).\
+                filter(ConfigModel.analysis == analysis).\
+                order_by(ConfigModel.seq.desc()).first()
+
+            if previous is not None and previous.seq is not None:
+                seq = previous.seq + 1
+                if self._config_cache is not None \
+                        and self._config_cache[0] == previous.id:
+                    previous_config = self._config_cache[1]
+                else:
+                    previous_config = _reconstruct(s, previous)
+                changes = _changed_fields(previous_config, config)
+            else:
+                seq = 1
+                previous_config = None
+                changes = []
+
             model = ConfigModel(
-                video=video, design=design, analysis=analysis,
-                json=json,
-                added=datetime.datetime.now(),
+                video=video, design=design, analysis=analysis, seq=seq,
+                version=config.get(VERSION), added=datetime.datetime.now(),
             )
-            model.connect(self)
-            return model
-        else:
-            return None
+
+            # Store a delta, unless it's time for a snapshot
+            if previous_config is not None \
+                    and (seq - 1) % settings.db.snapshot_interval:
+                delta = json.dumps(diff(previous_config, config))
+                if len(delta) < len(config_json):
+                    model.delta = delta
+            if model.delta is None:
+                model.json = config_json
+
+            s.add(model)
+            s.add_all([
+                ConfigChangeModel(analysis=analysis, seq=seq, context=field)
+                for field in changes
+            ])
+            s.flush()
+            self._config_cache = (model.id, config)
+
+        model.connect(self)
+        return model
 
     def store(self):  # todo: consider passing analyzer to store() instead of keeping a reference
         """Store analysis information from the
@@ -227,10 +409,11 @@ class AnalysisModel(BaseAnalysisModel):
             self._resolve_files()
 
             if self._config is None:
-                self._config = self._add_config(json=config_json)
+                self._config = self._add_config(config_json)
             else:
-                if config_json != self._config.get('json'):
-                    self._config = self._add_config(json=config_json)
+                # Compare as JSON types; the config dict may contain tuples
+                if json.loads(config_json) != self._get_config_dict(self._config):
+                    self._config = self._add_config(config_json)
 
             with self.session() as s:
                 if self._analyzer.config.name is not None:
@@ -243,15 +426,15 @@ class AnalysisModel(BaseAnalysisModel):
                     self.description = self._analyzer.config.description
 
                 self.runs = self._analyzer.runs
-
-                s.commit()
+                s.flush()
 
                 if self._config is not None:
                     self.config = self._config.id
 
                 # Store results
+                models = []
+                t = self._analyzer.timing
                 for k, df in self._analyzer.results.items():
-                    # Add columnsfe
                     if not df.isnull().all().all():  # todo: doesn't save results if there's *one* NaN?
                         model = ResultModel(
                             analysis=self.id,
@@ -260,20 +443,27 @@ class AnalysisModel(BaseAnalysisModel):
                             feature=k,
                             data=df.to_json(orient='split'),
                         )  # todo: should have a _results: Dict[ <?>, ResultsModel] so these don't spawn new results each time
-                        s.add(model)
 
                         # Store timing info
-                        t = self._analyzer.timing
                         if t is not None:
                             model.started = datetime.datetime.fromtimestamp(t.t0)
                             model.finished = datetime.datetime.fromtimestamp(t.t1)
                             model.elapsed = t.elapsed
 
-                        s.commit()
-                        self.results = model.id
+                        models.append(model)
+
+                if models:
+                    # Flush once to get the result ids, commit on exit
+                    s.add_all(models)
+                    s.flush()
+                    self.results = models[-1].id
 
-    def export_result(self, run: int = None, manual: bool = False):
-        """Export a result to disk
+    def export_result(self, run: int = None, manual: bool = False) -> Optional[Future]:
+        """Export a result to disk.
+
+        Result data is gathered from the database and then written to disk
+        on a background worker ~ :func:`shapeflow.export.submit`, in the
+        format set in ``settings.app.result_format``.
 
         Parameters
         ----------
@@ -284,6 +474,12 @@ class AnalysisModel(BaseAnalysisModel):
             by the user). This setting determines whether to follow
             ``settings.app.save_result_manual`` or ``settings.app.save_result_auto``
             when choosing where or whether to actually save.
+
+        Returns
+        -------
+        Optional[Future]
+            Resolves to the exported path once the export is done.
+            ``None`` if the result is not exported.
         """
         with self.session() as s:
             if self.runs is None or self.runs < 1:
@@ -296,62 +492,53 @@ class AnalysisModel(BaseAnalysisModel):
             results = list(
                 s.query(ResultModel).filter_by(analysis=self.id).filter_by(run=run)
             )
-            config = json.loads(
-                s.query(ConfigModel).filter_by(id=results[0].config).first().json
+            config = _reconstruct(
+                s, s.query(ConfigModel).filter_by(id=results[0].config).first()
             )
+            if config is None:
+                log.error(
+                    f"'{self.id}' results were not exported: "
+                    f"could not reconstruct configuration of run {run}"
+                )
+                return None
+
             video = s.query(VideoFileModel).filter_by(id=self.video).first()
             design = s.query(DesignFileModel).filter_by(id=self.design).first()
 
-            base_f = None
-
             if manual:
-                if settings.app.save_result_manual == ResultSaveMode.next_to_video:
-                    base_f = str(os.path.splitext(config['video_path'])[0])
-                elif settings.app.save_result_manual == ResultSaveMode.next_to_design:
-                    base_f = str(os.path.splitext(config['design_path'])[0])
-                elif settings.app.save_result_manual == ResultSaveMode.directory:
-                    base_f = os.path.join(
-                        str(settings.app.result_dir),
-                        f"{self.name} run {run}"
-                    )
+                mode = settings.app.save_result_manual
             else:
-                if settings.app.save_result_auto == ResultSaveMode.next_to_video:
-                    base_f = str(os.path.splitext(config['video_path'])[0])
-                elif settings.app.save_result_auto == ResultSaveMode.next_to_design:
-                    base_f = str(os.path.splitext(config['design_path'])[0])
-                elif settings.app.save_result_auto == ResultSaveMode.directory:
-                    base_f = os.path.join(
-                        str(settings.app.result_dir),
-                        f"{self.name} run {run}"
-                    )
-
-            if base_f is not None:
-                f = base_f + ' ' + datetime.datetime.now().strftime(
-                    settings.format.datetime_format_fs
-                ) + '.xlsx'
+                mode = settings.app.save_result_auto
 
-                w = pd.ExcelWriter(f)
+            base_f = None
+            if mode == ResultSaveMode.next_to_video:
+                base_f = str(os.path.splitext(config['video_path'])[0])
+            elif mode == ResultSaveMode.next_to_design:
+                base_f = str(os.path.splitext(config['design_path'])[0])
+            elif mode == ResultSaveMode.directory:
+                base_f = os.path.join(
+                    str(settings.app.result_dir),
+                    f"{self.name} run {run}"
+                )
 
-                # Features to separate sheets
-                for result in results:
-                    df = pd.read_json(result.data, orient='split')
-                    df.to_excel(w, sheet_name=result.feature)
+            if base_f is None:
+                log.warning(f"'{self.id}' results were not exported!")
+                return None
 
-                # Metadata in a separate sheet
-                pd.DataFrame([json.dumps({
+            result = ResultExport(
+                base=base_f + ' ' + datetime.datetime.now().strftime(
+                    settings.format.datetime_format_fs
+                ),
+                data={r.feature: r.data for r in results},
+                meta={
                     'config': config,
                     'video_hash': video.hash,
                     'design_hash': design.hash,
-                }, indent=2)]).to_excel(
-                    w, sheet_name=__meta_sheet__
-                )
-
-                w.save()
-                w.close()
-                log.info(f"'{self.id}' results exported to {f}")
-            else:
-                log.warning(f"'{self.id}' results were not exported!")
+                }
+            )
 
+        # Write to disk outside of the session, so the model isn't locked
+        return submit(result, settings.app.result_format)
 
     def load_config(self, video_path: str = None, design_path: str = None, include: List[str] = None) -> Optional[dict]:
         """Load configuration from the database.
@@ -403,7 +590,9 @@ class AnalysisModel(BaseAnalysisModel):
 
                 config = {}
                 for match in q.order_by(ConfigModel.id.desc()):
-                    match_config = normalize_config(json.loads(match.json))
+                    match_config = _normalize(match, _reconstruct(s, match))
+                    if match_config is None:
+                        continue
 
                     # Assimilate `include` fields from match
                     for field in include:
@@ -432,58 +621,100 @@ class AnalysisModel(BaseAnalysisModel):
 
     def get_config_json(self) -> Optional[str]:
         with self.session() as s:
-            return s.query(ConfigModel.json).\
-                    filter(ConfigModel.id == self.config).first()[0]  # todo: why does it return a tuple of length 1?
+            config = _reconstruct(
+                s, s.query(ConfigModel).filter_by(id=self.config).first()
+            )
+            if config is not None:
+                return json.dumps(config)
+            else:
+                return None
 
     def _fetch_latest_config(self) -> Optional[ConfigModel]:
         with self.session() as s:
             return s.query(ConfigModel). \
-                order_by(ConfigModel.added.desc()). \
-                first()  # todo: check if ordering by datetime works properly
+                filter(ConfigModel.analysis == self.id). \
+                order_by(ConfigModel.seq.desc()). \
+                first()
+
+    def _seq(self, context: str = None) -> Optional[int]:
+        """The sequence number of the current configuration.
+        Contexts keep track of their own position in the history.
+        """
+        if not hasattr(self, '_seq_by_context'):
+            self._seq_by_context = {}
+        if context in self._seq_by_context:
+            return self._seq_by_context[context]
 
-    def _added(self, context: str = None) -> datetime.datetime:
         if self._config is None:
             self._config = self._fetch_latest_config()
-        if not hasattr(self, '_added_by_context'):
-            self._added_by_context = {}
+        if self._config is not None:
+            return self._config.get('seq')
+        else:
+            return None
 
-        with self.session() as s:
-            if context not in self._added_by_context:
-                if self._config is not None:
-                    assert isinstance(self._config.added, datetime.datetime)
-                    return self._config.added
-                else:
-                    assert isinstance(self.added, datetime.datetime)
-                    return self.added
-            else:
-                return self._added_by_context[context]
+    def _step_config(self, undo: bool, context: str = None) -> Tuple[Optional[dict], Optional[int]]:
+        """Step through the configuration history of this analysis.
 
-    def _step_config(self, filter, order, context: str = None) -> Tuple[Optional[dict], Optional[int]]:
-        with self.session() as s:
-            q = list(
-                s.query(ConfigModel).\
-                filter(ConfigModel.video == self.video).\
-                filter(ConfigModel.design == self.design).\
-                filter(filter).\
-                order_by(order)
-            )
+        Without a ``context``, step to the previous or next configuration.
 
-            for match in q:
-                assert isinstance(match, ConfigModel)
-                assert isinstance(match.json, str)  # todo: fail more gracefully if json is empty; skip & remove from database
-                config = normalize_config(json.loads(match.json))
+        With a ``context``, step to the closest configuration where the
+        ``context`` field differs from the current one. Candidates are
+        found through their :class:`~shapeflow.db.ConfigChangeModel`
+        markers, so only the configurations that are actually applied need
+        to be parsed.
+        """
+        seq = self._seq(context)
+        if seq is None:
+            return None, None
 
-                if context is None:
-                    self._config = match
-                    self._config.connect(self)
-                    s.add(self._config)
-                    return config, match.id
+        with self.session() as s:
+            if context is None:
+                q = s.query(ConfigModel).\
+                    filter(ConfigModel.analysis == self.id)
+                if undo:
+                    q = q.filter(ConfigModel.seq < seq).\
+                        order_by(ConfigModel.seq.desc())
+                else:
+                    q = q.filter(ConfigModel.seq > seq).\
+                        order_by(ConfigModel.seq)
+
+                match = q.first()
+                config = _reconstruct(s, match)
+                if config is None:
+                    return None, None
+                config = _normalize(match, config)
+
+                self._config = match
+                self._config.connect(self)
+                return config, match.id
+            else:
+                assert self._analyzer is not None
+                current = self._analyzer.get_config()[context]
+
+                q = s.query(ConfigChangeModel.seq).\
+                    filter(ConfigChangeModel.analysis == self.id).\
+                    filter(ConfigChangeModel.context == context)
+                if undo:
+                    # The configuration before a change has a different value
+                    q = q.filter(ConfigChangeModel.seq <= seq).\
+                        order_by(ConfigChangeModel.seq.desc())
+                    offset = -1
                 else:
-                    assert self._analyzer is not None
-                    if context in config and config[context] != self._analyzer.get_config()[context]:
+                    q = q.filter(ConfigChangeModel.seq > seq).\
+                        order_by(ConfigChangeModel.seq)
+                    offset = 0
+
+                for change, in q:
+                    match = s.query(ConfigModel).\
+                        filter(ConfigModel.analysis == self.id).\
+                        filter(ConfigModel.seq == change + offset).first()
+                    config = _normalize(match, _reconstruct(s, match))
+                    if config is None:
+                        continue
+
+                    if context in config and config[context] != current:
                         self._config = None
-                        assert isinstance(match.added, datetime.datetime)
-                        self._added_by_context[context] = match.added
+                        self._seq_by_context[context] = match.seq
                         return {context: config[context]}, match.id
         return None, None
 
@@ -502,11 +733,7 @@ class AnalysisModel(BaseAnalysisModel):
             If ``context`` is not a ``VideoAnalyzer`` field
         """
         if context is None or context in VideoAnalyzerConfig.__fields__:
-            return self._step_config(
-                ConfigModel.added < self._added(context),
-                ConfigModel.added.desc(),
-                context
-            )
+            return self._step_config(undo=True, context=context)
         else:
             raise ValueError(f"Invalid undo context '{context}'")
 
@@ -525,14 +752,59 @@ class AnalysisModel(BaseAnalysisModel):
             If ``context`` is not a ``VideoAnalyzer`` field
         """
         if context is None or context in VideoAnalyzerConfig.__fields__:
-            return self._step_config(
-                ConfigModel.added > self._added(context),
-                ConfigModel.added,
-                context
-            )
+            return self._step_config(undo=False, context=context)
         else:
             raise ValueError(f"Invalid redo context '{context}'")
 
+
+def _slice_result(result: dict, masks: List[str] = None, start: float = None, stop: float = None) -> dict:
+    """Select columns and rows from a result.
+
+    Parameters
+    ----------
+    result : dict
+        Result formatted ~ ``pandas.DataFrame.to_json(orient='split')``
+    masks : List[str]
+        Columns to include, in addition to ``'time'``
+    start : float
+        Minimal value of ``'time'``
+    stop : float
+        Maximal value of ``'time'``
+    """
+    if masks is None and start is None and stop is None:
+        return result
+
+    columns = result['columns']
+    if masks is not None:
+        keep = [i for i, c in enumerate(columns) if c == 'time' or c in masks]
+    else:
+        keep = list(range(len(columns)))
+
+    try:
+        t = columns.index('time')
+    except ValueError:
+        t = None
+
+    index = []
+    data = []
+    for i, row in zip(result['index'], result['data']):
+        if t is not None and (start is not None or stop is not None):
+            if row[t] is None:
+                continue
+            if start is not None and row[t] < start:
+                continue
+            if stop is not None and row[t] > stop:
+                continue
+        index.append(i)
+        data.append([row[k] for k in keep])
+
+    return {
+        'columns': [columns[k] for k in keep],
+        'index': index,
+        'data': data,
+    }
+
+
 class History(SessionWrapper, RootInstance):
     """Interface to the history database
     """
@@ -544,7 +816,17 @@ class History(SessionWrapper, RootInstance):
         if path is None:
             path = Path(str(settings.db.path))
 
-        self._engine = create_engine(f'sqlite:///{str(path)}')
+        self._engine = create_engine(
+            f'sqlite:///{str(path)}',
+            poolclass=QueuePool,
+            pool_size=settings.db.pool_size,
+            connect_args={
+                'check_same_thread': False,
+                'timeout': settings.db.busy_timeout,
+            },
+        )
+        event.listen(self._engine, 'connect', self._on_connect)
+
         try:
             Base.metadata.create_all(self._engine)
         except sqlite3.OperationalError as e:
@@ -552,7 +834,82 @@ class History(SessionWrapper, RootInstance):
                 pass
             else:
                 log.error(f"could not create tables - {e.__class__.__name__}: {str(e)}")
+        self._add_columns()
+        self._create_indexes()
         self._session_factory = scoped_session(sessionmaker(bind=self._engine))
+        self._number_configs()
+
+    @staticmethod
+    def _on_connect(connection, record):
+        cursor = connection.cursor()
+        if settings.db.wal:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    def _add_columns(self):
+        """``create_all`` doesn't add new columns to tables that already
+        exist, so databases created by older versions need them added
+        separately.
+        """
+        with self._engine.connect() as db:
+            for table in Base.metadata.tables.values():
+                columns = [
+                    column[1] for column in
+                    db.execute(f"PRAGMA table_info({table.name})")
+                ]
+                for column in table.columns:
+                    if columns and column.name not in columns:
+                        log.info(f"adding column '{table.name}.{column.name}'")
+                        db.execute(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                            f"{column.type.compile(self._engine.dialect)}"
+                        )
+
+    def _number_configs(self):
+        """Number configurations that were added by older versions and
+        mark their changes, so they can be stepped through with undo/redo.
+        """
+        with self.session() as s:
+            unnumbered = list(
+                s.query(ConfigModel).filter_by(seq=None).\
+                    order_by(ConfigModel.analysis, ConfigModel.id)
+            )
+            if unnumbered:
+                log.info(f"numbering {len(unnumbered)} configurations")
+
+            analysis = None
+            previous: Optional[dict] = None
+            seq = 0
+            for config in unnumbered:
+                if config.analysis != analysis:
+                    analysis = config.analysis
+                    previous = None
+                    seq = 0
+
+                current = _loads(config.json)
+                seq += 1
+                config.seq = seq
+                if current is not None:
+                    s.add_all([
+                        ConfigChangeModel(
+                            analysis=analysis, seq=seq, context=field
+                        ) for field in _changed_fields(previous, current)
+                    ])
+                    previous = current
+
+    def _create_indexes(self):
+        """``create_all`` skips indexes of tables that already exist,
+        so databases created by older versions need them added separately.
+        """
+        for table in Base.metadata.tables.values():
+            for index in table.indexes:
+                try:
+                    index.create(bind=self._engine)
+                except OperationalError as e:
+                    if "already exists" not in str(e):
+                        log.error(f"could not create index '{index.name}' - "
+                                  f"{e.__class__.__name__}: {str(e)}")
 
     def set_eventstreamer(self, eventstreamer: EventStreamer):
         self._eventstreamer = eventstreamer
@@ -683,12 +1040,13 @@ class History(SessionWrapper, RootInstance):
             runs = s.query(AnalysisModel).\
                 filter(AnalysisModel.id == analysis).first().runs
 
-            return {
-                run: s.query(ResultModel).\
+            finished: dict = {run: None for run in range(1, runs+1)}
+            for run, t in s.query(ResultModel.run, ResultModel.finished).\
                     filter(ResultModel.analysis == analysis).\
-                    filter(ResultModel.run == run).first().finished
-                for run in range(1, runs+1)
-            }
+                    order_by(ResultModel.id.desc()):
+                if run in finished:
+                    finished[run] = t
+            return finished
 
     # @history.expose(history.get_result)
     @api.db.get_result.expose()
@@ -718,6 +1076,98 @@ class History(SessionWrapper, RootInstance):
                     filter(ResultModel.run == run)
             }
 
+    @api.db.get_run_lists.expose()
+    def get_run_lists(self, analyses: List[int]) -> dict:
+        """Fetch run metadata for multiple analyses in a single query
+
+        :attr:`shapeflow.api._DatabaseDispatcher.get_run_lists`
+
+        Parameters
+        ----------
+        analyses : List[int]
+            Database ids of the analyses
+
+        Returns
+        -------
+        dict
+            A ``dict`` mapping analysis id ``int`` to a ``dict`` mapping
+            run ``int`` to its metadata: ``started``, ``finished``,
+            ``elapsed`` and the analyzed ``features``
+        """
+        analyses = [int(analysis) for analysis in analyses]
+        runs: Dict[int, dict] = {analysis: {} for analysis in analyses}
+
+        with self.session() as s:
+            for analysis, run, feature, started, finished, elapsed in s.query(
+                        ResultModel.analysis, ResultModel.run,
+                        ResultModel.feature, ResultModel.started,
+                        ResultModel.finished, ResultModel.elapsed,
+                    ).\
+                    filter(ResultModel.analysis.in_(analyses)).\
+                    order_by(ResultModel.id):
+                if run not in runs[analysis]:
+                    runs[analysis][run] = {
+                        'started': started,
+                        'finished': finished,
+                        'elapsed': elapsed,
+                        'features': [],
+                    }
+                if feature not in runs[analysis][run]['features']:
+                    runs[analysis][run]['features'].append(feature)
+        return runs
+
+    @api.db.get_results.expose()
+    def get_results(self, analyses: List[int], runs: List[int] = None, features: List[str] = None, masks: List[str] = None, start: float = None, stop: float = None) -> dict:
+        """Fetch results for multiple analyses and runs in a single query
+
+        :attr:`shapeflow.api._DatabaseDispatcher.get_results`
+
+        Parameters
+        ----------
+        analyses : List[int]
+            Database ids of the analyses
+        runs : List[int]
+            Only include these runs. Defaults to ``None``, i.e. all runs.
+        features : List[str]
+            Only include these features. Defaults to ``None``, i.e. all
+            features.
+        masks : List[str]
+            Only include the columns for these masks; the ``'time'`` column is
+            always included. Defaults to ``None``, i.e. all masks.
+        start : float
+            Only include rows at or after this time (in seconds).
+            Defaults to ``None``, i.e. from the start of the video.
+        stop : float
+            Only include rows at or before this time (in seconds).
+            Defaults to ``None``, i.e. until the end of the video.
+
+        Returns
+        -------
+        dict
+            A ``dict`` mapping analysis id ``int`` to run ``int`` to
+            feature ``str`` to its result, formatted ~
+            ``pandas.DataFrame.to_json(orient='split')``
+        """
+        analyses = [int(analysis) for analysis in analyses]
+        if runs is not None:
+            runs = [int(run) for run in runs]
+        results: Dict[int, dict] = {analysis: {} for analysis in analyses}
+
+        with self.session() as s:
+            q = s.query(
+                ResultModel.analysis, ResultModel.run,
+                ResultModel.feature, ResultModel.data
+            ).filter(ResultModel.analysis.in_(analyses))
+            if runs is not None:
+                q = q.filter(ResultModel.run.in_(runs))
+            if features is not None:
+                q = q.filter(ResultModel.feature.in_(features))
+
+            for analysis, run, feature, data in q.order_by(ResultModel.id):
+                results[analysis].setdefault(run, {})[feature] = \
+                    _slice_result(json.loads(data), masks, start, stop)
+        return results
+
     # @history.expose(history.export_result)
     @api.db.export_result.expose()
     def export_result(self, analysis: int, run: int = None) -> bool:
@@ -738,20 +1188,22 @@ class History(SessionWrapper, RootInstance):
             ``True`` if exported,
             ``False`` if something went wrong.
         """
-        with self.session() as s:
-            try:
+        try:
+            with self.session() as s:
                 a = s.query(AnalysisModel).filter_by(
                     id=analysis
                 ).first()
-                a.connect(self)
-                a.export_result(run=run, manual=True)
-                return True
-            except Exception as e:
-                log.error(f"{e.__class__.__name__}: {e}")
-                self.notice(
-                    f"could not export analysis '{analysis}' run '{run}'"
-                )
-                return False
+            a.connect(self)
+            future = a.export_result(run=run, manual=True)
+            if future is not None:
+                future.result()
+            return True
+        except Exception as e:
+            log.error(f"{e.__class__.__name__}: {e}")
+            self.notice(
+                f"could not export analysis '{analysis}' run '{run}'"
+            )
+            return False
 
     def check(self) -> bool:
         """Check the database's integrity (somewhat).
@@ -768,7 +1220,7 @@ class History(SessionWrapper, RootInstance):
         ok = []
         models = [
             VideoFileModel, DesignFileModel, ConfigModel,
-            ResultModel, AnalysisModel
+            ConfigChangeModel, ResultModel, AnalysisModel
         ]
 
         with self.session() as s:
@@ -821,11 +1273,14 @@ class History(SessionWrapper, RootInstance):
 
         * remove 'analysis' entries with ``<null>`` config
 
-        * remove 'config' entries with ``<null>`` json
+        * remove 'config' entries with ``<null>`` json and delta
 
         * for 'analysis' entries older than ``settings.db.cleanup_interval``
 
-           * remove all non-primary 'config' entries
+           * turn the primary 'config' entry into a snapshot
+
+           * remove all non-primary 'config' entries and all of their
+             'config_change' entries
 
            * remove all non-primary 'results' entries
 
@@ -846,15 +1301,26 @@ class History(SessionWrapper, RootInstance):
             for f in unhashed:
                 f._queue_hash(f.path)
 
-            s.query(ConfigModel).filter_by(json=None).delete()
+            s.query(ConfigModel).filter_by(json=None, delta=None).delete()
             s.query(AnalysisModel).filter_by(config=None).delete()
 
             for old in s.query(AnalysisModel).\
                     filter(AnalysisModel.modified < threshold):
+                # The primary config is kept, so it can't depend on the others
+                primary = s.query(ConfigModel).filter_by(id=old.config).first()
+                if primary is not None and primary.json is None:
+                    config = _reconstruct(s, primary)
+                    if config is not None:
+                        primary.json = json.dumps(config)
+                        primary.delta = None
+
                 s.query(ConfigModel). \
                     filter(ConfigModel.analysis == old.id). \
                     filter(ConfigModel.id != old.config).delete()
 
+                s.query(ConfigChangeModel). \
+                    filter(ConfigChangeModel.analysis == old.id).delete()
+
                 s.query(ResultModel). \
                     filter(ResultModel.analysis == old.id). \
                     filter(ResultModel.id != old.results).delete()
@@ -877,6 +1343,7 @@ class History(SessionWrapper, RootInstance):
             VideoFileModel,
             DesignFileModel,
             ConfigModel,
+            ConfigChangeModel,
             ResultModel
         ]
 
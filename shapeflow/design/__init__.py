@@ -4,8 +4,9 @@ Adapted from https://github.com/ybnd/OnionSVG
 """
 
 from pathlib import Path
-from typing import Union
+from typing import Union, Dict
 
+import numpy as np
 from lxml.etree import fromstring
 
 from shapeflow.core import get_logger
@@ -56,3 +57,25 @@ def peel(file: Union[Path, str], dpi: int, dir: Union[Path, str]) -> None:
         dir = Path(dir)
 
     Peeler(file).peel(dpi, dir)
+
+
+def render_layers(file: Union[Path, str], dpi: int) -> Dict[str, np.ndarray]:
+    """Render a design layer per layer in memory
+
+    Parameters
+    ----------
+    file: Union[Path, str]
+        The design file
+    dpi: int
+        The DPI (dots per inch) to render at
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        The render (BGR) of every layer by its label,
+        in the order of the layers in the design file
+    """
+    if isinstance(file, str):
+        file = Path(file)
+
+    return Peeler(file).render(dpi)
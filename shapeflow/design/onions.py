@@ -1,16 +1,54 @@
+import os
+import copy
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List
+from typing import List, Dict, Optional
 
+import cv2
+import numpy as np
 from lxml import etree
 from lxml.etree import _Element, fromstring
 
+from shapeflow import settings
 from shapeflow.core import RootException, get_logger
-from shapeflow.design.render import save_svg
+from shapeflow.design.render import render_svg, get_renderer
 
 
 log = get_logger(__name__)
 
 
+_executor: Optional[Executor] = None
+
+
+def _get_executor() -> Executor:
+    """Layers are rendered in a pool of processes that is shared between
+    all designs ~ :attr:`shapeflow.RenderSettings.workers`.
+
+    Worker processes are spawned rather than forked: the pool is started
+    lazily by a server that's running other threads at that point, and
+    forking a multi-threaded process can leave locks held in the workers.
+    Layers are submitted to the module-level
+    :func:`~shapeflow.design.render.render_svg`, so spawned workers only have
+    to import :mod:`shapeflow.design.render`.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.render.workers or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = None
+
+
 class DesignFileError(RootException):
     pass
 
@@ -29,6 +67,10 @@ class Layer:
     def label(self):
         return self._label
 
+    @property
+    def element(self) -> _Element:
+        return self._root
+
     def hide(self) -> None:
         """Hide this layer
         """
@@ -41,7 +83,7 @@ class Layer:
 
 
 class Peeler:
-    """Renders an SVG file into multiple PNG files layer-per-layer.
+    """Renders an SVG file layer-per-layer.
     """
     file: Path
     """Path to the SVG file
@@ -74,24 +116,77 @@ class Peeler:
 
         self._get_layers()
 
-    def peel(self, dpi: int, to_dir: Path) -> None:
-        """"Peel" the layers
+    def render(self, dpi: int) -> Dict[str, np.ndarray]:
+        """"Peel" the layers in memory
+
+        Parameters
+        ----------
+        dpi: int
+            The DPI (dots per inch) to render at
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The render (BGR) of every layer by its label,
+            in the order of the layers in the design file
         """
         log.info(f"Peeling {self.file} @ {dpi} DPI...")
 
+        get_renderer()  # fail early if there's no renderer at all
+
+        documents = {
+            layer.label: self._layer_svg(layer) for layer in self._layers
+        }
+
+        if settings.render.workers == 1 or len(documents) < 2:
+            renders = self._render_here(documents, dpi)
+        else:
+            try:
+                executor = _get_executor()
+                futures = {
+                    label: executor.submit(render_svg, svg, dpi)
+                    for label, svg in documents.items()
+                }
+                renders = {
+                    label: future.result() for label, future in futures.items()
+                }
+            except BrokenProcessPool as e:
+                log.warning(f"render pool is broken ({e}), "
+                            f"rendering in the current process instead")
+                _reset_executor()
+                renders = self._render_here(documents, dpi)
+
+        log.info(f"Done.")
+        return renders
+
+    @staticmethod
+    def _render_here(documents: Dict[str, bytes], dpi: int) \
+            -> Dict[str, np.ndarray]:
+        return {
+            label: render_svg(svg, dpi) for label, svg in documents.items()
+        }
+
+    def peel(self, dpi: int, to_dir: Path) -> None:
+        """"Peel" the layers into PNG files
+
+        Parameters
+        ----------
+        dpi: int
+            The DPI (dots per inch) to render at
+        to_dir: Path
+            The directory to save to. Any files already in this directory
+            are removed.
+        """
+        renders = self.render(dpi)
+
         if to_dir.is_dir():
             for file in to_dir.iterdir():
                 file.unlink()
         else:
             to_dir.mkdir()
 
-        for layer in self._layers:
-            for hidden in self._layers:
-                hidden.hide()
-            layer.show()
-            self._save(to_dir / f"{layer.label}.png", dpi)
-
-        log.info(f"Done.")
+        for label, image in renders.items():
+            cv2.imwrite(str(to_dir / f"{label}.png"), image)
 
     def _set_background_to_white(self):
         namedview = self._root.find(self.NAMEDVIEW)
@@ -109,5 +204,32 @@ class Peeler:
     def _as_svg(self) -> bytes:
         return self._header + etree.tostring(self._root)
 
-    def _save(self, to: Path, dpi: int):
-        save_svg(self._as_svg(), dpi, to)
+    def _layer_svg(self, layer: Layer) -> bytes:
+        """An independent SVG document with only one of the layers.
+
+        Everything that isn't a layer (``<defs>``, ``<sodipodi:namedview>``,
+        ...) is kept, so the layer can be rendered on its own.
+
+        Parameters
+        ----------
+        layer: Layer
+            The layer to keep
+
+        Returns
+        -------
+        bytes
+            The SVG document
+        """
+        layers = {id(other.element) for other in self._layers}
+
+        root = etree.Element(
+            self._root.tag, attrib=dict(self._root.attrib),
+            nsmap=self._root.nsmap
+        )
+        for child in self._root:
+            if child is layer.element or id(child) not in layers:
+                root.append(copy.deepcopy(child))
+                if child is layer.element:
+                    Layer(root[-1], layer.label).show()
+
+        return self._header + etree.tostring(root)
@@ -1,10 +1,14 @@
 import abc
 import os
+import threading
 from pathlib import Path
 from subprocess import check_call, CalledProcessError
-from tempfile import NamedTemporaryFile
+from tempfile import TemporaryDirectory
 from typing import Union, Any, List, Type, Optional
 
+import cv2
+import numpy as np
+
 from shapeflow.core import RootException, get_logger
 from shapeflow.util import suppress_stdout
 
@@ -19,8 +23,15 @@ class RendererError(RootException):
     pass
 
 
+def _decode(png: bytes) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise RendererError("could not decode render")
+    return image
+
+
 class Renderer(metaclass=abc.ABCMeta):
-    """Renders SVG (as an XML string) to a PNG image.
+    """Renders SVG (as an XML string) to an image.
     Multiple implementations are provided as a fallback for Windows systems
     where cairo may be unavailable.
 
@@ -54,9 +65,27 @@ class Renderer(metaclass=abc.ABCMeta):
         to: Path
             The file to save to
         """
-        self._ensure()
         log.debug(f"{self.__class__.__name__}: rendering to {to}")
-        self._save(svg, dpi, to)
+        cv2.imwrite(str(to), self.render(svg, dpi))
+
+    def render(self, svg: bytes, dpi: int) -> np.ndarray:
+        """Render an SVG string to an image in memory.
+        Checks whether this renderer works on the current system before trying.
+
+        Parameters
+        ----------
+        svg: str
+            An SVG image as an XML string
+        dpi: int
+            The DPI (details per inch) to render the SVG at
+
+        Returns
+        -------
+        np.ndarray
+            The rendered image (BGR)
+        """
+        self._ensure()
+        return self._render(svg, dpi)
 
     def _ensure(self) -> None:
         """Checks whether this renderer can be used.
@@ -77,8 +106,8 @@ class Renderer(metaclass=abc.ABCMeta):
         self._reason = reason
 
     @abc.abstractmethod
-    def _save(self, svg: bytes, dpi: int, to: Path) -> None:
-        """Save a PNG render
+    def _render(self, svg: bytes, dpi: int) -> np.ndarray:
+        """Render to a BGR image
         """
 
     @property
@@ -109,13 +138,12 @@ class CairoRenderer(Renderer):
         except Exception as e:
             self._confirm(False, e)
 
-    def _save(self, svg: bytes, dpi: int, to: Path) -> None:
-        self.cairosvg.svg2png(
+    def _render(self, svg: bytes, dpi: int) -> np.ndarray:
+        return _decode(self.cairosvg.svg2png(
             svg,
             scale = dpi / self.DEFAULT_DPI,
-            write_to = str(to),
             background_color = self.WHITE
-        )
+        ))
 
 
 class WandRenderer(Renderer):
@@ -143,15 +171,14 @@ class WandRenderer(Renderer):
         except Exception as e:
             self._confirm(False, e)
 
-    def _save(self, svg: bytes, dpi: int, to: Path) -> None:
-        with open(to, "wb") as f:
-            with self.Image() as image:
-                image.read(
-                    blob=svg,
-                    background=self.background,
-                    resolution=dpi,
-                )
-                f.write(image.make_blob("png32"))
+    def _render(self, svg: bytes, dpi: int) -> np.ndarray:
+        with self.Image() as image:
+            image.read(
+                blob=svg,
+                background=self.background,
+                resolution=dpi,
+            )
+            return _decode(image.make_blob("png32"))
 
 
 class InkscapeRenderer(Renderer):
@@ -172,20 +199,26 @@ class InkscapeRenderer(Renderer):
                     *self._prefix, "inkscape", "--version"
                 ], shell=self.shell)
             self._confirm(True)
-        except CalledProcessError as e:
+        except (CalledProcessError, OSError) as e:
             self._confirm(False, e)
 
-    def _save(self, svg: bytes, dpi: int, to: Path) -> None:
-        with NamedTemporaryFile(suffix=".svg") as temp:
-            temp.write(svg)
+    def _render(self, svg: bytes, dpi: int) -> np.ndarray:
+        # Inkscape can only export to a file; use a private directory so
+        # concurrent renders don't overwrite each other.
+        with TemporaryDirectory() as temp_dir:
+            svg_file = Path(temp_dir) / "render.svg"
+            png_file = Path(temp_dir) / "render.png"
+
+            svg_file.write_bytes(svg)
             with suppress_stdout():
                 check_call([
                     *self._prefix, "inkscape",
                     "--export-type=png",
-                    f"--export-filename={to}",
+                    f"--export-filename={png_file}",
                     f"--export-dpi={dpi}",
-                    temp.name,
+                    str(svg_file),
                 ], shell=self.shell)
+            return _decode(png_file.read_bytes())
 
     @property
     def _prefix(self) -> List[str]:
@@ -207,8 +240,9 @@ class WindowsInkscapeRenderer(InkscapeRenderer):
 
     def _check(self):
         if os.name != 'nt':
-            self._works = False
+            self._confirm(False, "not on Windows")
             return
+        self._confirm(False, "Inkscape is not installed")
         for candidate in self.INKSCAPE_DIR_CANDIDATES:
             if candidate.is_dir():
                 self.inkscape_dir = candidate
@@ -221,7 +255,8 @@ class WindowsInkscapeRenderer(InkscapeRenderer):
         return ["cd", str(self.inkscape_dir), "&&"]
 
 
-_renderer: Renderer
+_renderer: Optional[Renderer] = None
+_lock = threading.Lock()
 __choices__: List[Type[Renderer]] = [
     CairoRenderer,
     WandRenderer,
@@ -229,17 +264,39 @@ __choices__: List[Type[Renderer]] = [
     WindowsInkscapeRenderer,
 ]
 
-for _renderer_type in __choices__:
-    _candidate = _renderer_type()
-    if _candidate.works:
-        _renderer = _candidate
-        log.debug(f"using {_renderer.__class__.__name__}")
-        break
-    else:
-        log.debug(f"{_candidate.__class__.__name__} won't work")
 
-if '_renderer' not in locals():
-    raise RendererError(f"None of the renderers seem to work")
+def get_renderer() -> Renderer:
+    """Get the renderer for this system.
+
+    Renderers are probed in order of preference ~ :data:`__choices__` the
+    first time this function is called. Probing can be slow (e.g. it may
+    start an Inkscape process), so it's not done when this module is imported.
+
+    Returns
+    -------
+    Renderer
+        The first renderer that works on this system
+
+    Raises
+    ------
+    RendererError
+        if none of the available renderers work on this system
+    """
+    global _renderer
+
+    with _lock:
+        if _renderer is None:
+            for renderer_type in __choices__:
+                candidate = renderer_type()
+                if candidate.works:
+                    _renderer = candidate
+                    log.debug(f"using {_renderer.__class__.__name__}")
+                    break
+                else:
+                    log.debug(f"{candidate.__class__.__name__} won't work")
+            else:
+                raise RendererError(f"None of the renderers seem to work")
+        return _renderer
 
 
 def save_svg(svg: bytes, dpi: int, to: Path) -> None:
@@ -259,5 +316,28 @@ def save_svg(svg: bytes, dpi: int, to: Path) -> None:
     RendererError
         if none of the available renderers work on this system
     """
-    _renderer.save(svg, dpi, to)
+    get_renderer().save(svg, dpi, to)
 
+
+def render_svg(svg: bytes, dpi: int) -> np.ndarray:
+    """Render SVG to an image in memory using the renderer selected for this
+    system.
+
+    Parameters
+    ----------
+    svg: bytes
+        An SVG image as XML bytes
+    dpi: int
+        The DPI (dots per inch) to render the SVG at
+
+    Returns
+    -------
+    np.ndarray
+        The rendered image (BGR)
+
+    Raises
+    ------
+    RendererError
+        if none of the available renderers work on this system
+    """
+    return get_renderer().render(svg, dpi)
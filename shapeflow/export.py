@@ -0,0 +1,264 @@
+"""Result exporters.
+
+Results are stored in the database ~ ``pandas.DataFrame.to_json(orient='split')``.
+Exporters write these to disk row by row, without rebuilding the full
+``DataFrame`` of every feature first.
+
+Exports run on a single background worker so that they don't block
+the analysis queue; see :func:`~shapeflow.export.submit`.
+"""
+
+import os
+import abc
+import csv
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Type, Optional, Iterable, List, Any
+
+from shapeflow import get_logger, ResultFormat
+from shapeflow.core import RootException
+from shapeflow.core.config import __meta_sheet__
+
+log = get_logger(__name__)
+
+
+class ExportError(RootException):
+    """An error while exporting a result.
+    """
+
+
+class ResultExport(object):
+    """Everything needed to write a result to disk, gathered from the
+    database beforehand so that exporters don't have to touch it.
+
+    Parameters
+    ----------
+    base : str
+        Path to export to, without an extension
+    data : Dict[str, str]
+        A ``dict`` mapping feature names to result data, formatted ~
+        ``pandas.DataFrame.to_json(orient='split')``
+    meta : dict
+        Metadata (configuration & file hashes)
+    """
+    base: str
+    data: Dict[str, str]
+    meta: dict
+
+    def __init__(self, base: str, data: Dict[str, str], meta: dict):
+        self.base = base
+        self.data = data
+        self.meta = meta
+
+    def features(self) -> Iterable[str]:
+        return self.data.keys()
+
+    def split(self, feature: str) -> dict:
+        """Parse the result data of a single feature.
+
+        Parameters
+        ----------
+        feature : str
+            The feature to parse
+
+        Returns
+        -------
+        dict
+            A ``dict`` with ``'columns'``, ``'index'`` and ``'data'`` fields
+        """
+        return json.loads(self.data[feature])
+
+    def rows(self, feature: str) -> Iterable[List[Any]]:
+        """Iterate over the result of a single feature as rows.
+        The first row contains the column names, each following row starts
+        with its index.
+
+        Parameters
+        ----------
+        feature : str
+            The feature to iterate over
+        """
+        split = self.split(feature)
+        yield [None] + split['columns']
+        for index, row in zip(split['index'], split['data']):
+            yield [index] + row
+
+    @property
+    def meta_json(self) -> str:
+        return json.dumps(self.meta, indent=2)
+
+
+class Exporter(abc.ABC):
+    """Abstract result exporter.
+    """
+    format: ResultFormat
+
+    @abc.abstractmethod
+    def export(self, result: ResultExport) -> str:
+        """Write a result to disk.
+
+        Parameters
+        ----------
+        result : ResultExport
+            The result to export
+
+        Returns
+        -------
+        str
+            The path that was exported to
+        """
+
+
+_exporters: Dict[ResultFormat, Type[Exporter]] = {}
+
+
+def exporter(format: ResultFormat):
+    """Register an :class:`~shapeflow.export.Exporter` for a
+    :class:`~shapeflow.ResultFormat`. Usage::
+
+        @exporter(ResultFormat.something)
+        class SomethingExporter(Exporter):
+            ...
+
+    Parameters
+    ----------
+    format : ResultFormat
+        The format handled by the exporter
+    """
+    def wrapper(cls: Type[Exporter]) -> Type[Exporter]:
+        cls.format = format
+        _exporters[format] = cls
+        return cls
+    return wrapper
+
+
+def get_exporter(format: ResultFormat) -> Exporter:
+    """Get an exporter instance for a format.
+
+    Parameters
+    ----------
+    format : ResultFormat
+        The format to export to
+
+    Raises
+    ------
+    ExportError
+        If no exporter is registered for ``format``
+    """
+    try:
+        return _exporters[ResultFormat(format)]()
+    except (KeyError, ValueError):
+        raise ExportError(f"no exporter for '{format}'")
+
+
+@exporter(ResultFormat.xlsx)
+class XlsxExporter(Exporter):
+    """Export to a single ``.xlsx`` file with one sheet per feature and
+    a separate sheet for metadata.
+
+    Uses a write-only ``openpyxl`` workbook, so memory usage doesn't grow
+    with the size of the result.
+    """
+    def export(self, result: ResultExport) -> str:
+        from openpyxl import Workbook
+
+        path = result.base + '.xlsx'
+
+        wb = Workbook(write_only=True)
+        for feature in result.features():
+            ws = wb.create_sheet(title=feature)
+            for row in result.rows(feature):
+                ws.append(row)
+
+        ws = wb.create_sheet(title=__meta_sheet__)
+        ws.append([None, 0])
+        ws.append([0, result.meta_json])
+
+        wb.save(path)
+        return path
+
+
+@exporter(ResultFormat.csv)
+class CsvExporter(Exporter):
+    """Export to a ``.csv`` file per feature and a ``.json`` file
+    for metadata.
+    """
+    def export(self, result: ResultExport) -> str:
+        for feature in result.features():
+            with open(f"{result.base} {feature}.csv", 'w', newline='') as f:
+                writer = csv.writer(f)
+                for row in result.rows(feature):
+                    writer.writerow(row)
+
+        path = f"{result.base} {__meta_sheet__}.json"
+        with open(path, 'w') as f:
+            f.write(result.meta_json)
+        return path
+
+
+@exporter(ResultFormat.parquet)
+class ParquetExporter(Exporter):
+    """Export to a ``.parquet`` file per feature and a ``.json`` file
+    for metadata.
+
+    Requires ``pyarrow`` or ``fastparquet`` to be installed.
+    """
+    def export(self, result: ResultExport) -> str:
+        import pandas as pd
+
+        for feature in result.features():
+            split = result.split(feature)
+            df = pd.DataFrame(
+                split['data'], index=split['index'], columns=split['columns']
+            )
+            try:
+                df.to_parquet(f"{result.base} {feature}.parquet")
+            except ImportError as e:
+                raise ExportError(f"can't export to parquet: {e}")
+
+        path = f"{result.base} {__meta_sheet__}.json"
+        with open(path, 'w') as f:
+            f.write(result.meta_json)
+        return path
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _export(result: ResultExport, format: ResultFormat) -> str:
+    try:
+        path = get_exporter(format).export(result)
+        log.info(f"results exported to {path}")
+        return path
+    except Exception as e:
+        log.error(f"could not export results to '{result.base}' - "
+                  f"{e.__class__.__name__}: {e}")
+        raise
+
+
+def submit(result: ResultExport, format: ResultFormat) -> Future:
+    """Export a result on the background export worker.
+
+    Exports are handled one at a time, in the order they were submitted.
+
+    Parameters
+    ----------
+    result : ResultExport
+        The result to export
+    format : ResultFormat
+        The format to export to
+
+    Returns
+    -------
+    Future
+        Resolves to the exported path
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='export'
+            )
+    return _executor.submit(_export, result, format)
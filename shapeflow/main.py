@@ -14,6 +14,7 @@ import time
 import pickle
 from typing import Dict, List, Optional
 from threading import Event, Lock, Thread
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import datetime
 
 from flask import Response
@@ -552,6 +553,10 @@ class _VideoAnalyzerManager(object):
     __analyzers__: Dict[str, BaseAnalyzer] = {}  # todo: analyzer manager should register analyzers with api.va on init
     """The currently active analyzers.
     """
+    _restoring: Dict[str, int]
+    """Analyzers from the application state that haven't been restored yet,
+    by ``id`` and database id.
+    """
 
     ID_LENGTH = 6
     """Length of ``id`` strings. Kept relatively short for readable URLs.
@@ -566,6 +571,7 @@ class _VideoAnalyzerManager(object):
         self._stop_q = Event()
         self._pause_q = Event()
         self._q_state = QueueState.STOPPED
+        self._restoring = {}
 
     def _set_dispatcher(self, dispatcher: _VideoAnalyzerManagerDispatcher):
         self._dispatcher = dispatcher
@@ -575,7 +581,8 @@ class _VideoAnalyzerManager(object):
             id = shortuuid.ShortUUID().random(length=self.ID_LENGTH)
 
             # ensure that the id doesn't start with a number there's no collisions
-            while id[0].isdigit() or id in self.__analyzers__.keys():
+            while id[0].isdigit() or id in self.__analyzers__.keys() \
+                    or id in self._restoring:
                 id = shortuuid.ShortUUID().random(length=self.ID_LENGTH)
 
             analyzer._set_id(id)
@@ -585,19 +592,14 @@ class _VideoAnalyzerManager(object):
         self._dispatcher._add_dispatcher(
             analyzer.id, _VideoAnalyzerDispatcher(instance=analyzer)
         )
-        assert self._dispatcher._update is not None
-        self._dispatcher._update(self._dispatcher)  # todo: lame signature; also should be a part of _add_dispatcher probably
         return analyzer.id
 
     def _remove(self, id: str):
         del self.__analyzers__[id]
-        for k in filter(lambda k: id in k, list(self._dispatcher._address_space.keys())):  # todo: this is a bit lame
-            del self._dispatcher._address_space[k]  # todo: there should be a _remove_dispatcher probably
-        assert self._dispatcher._update is not None
-        self._dispatcher._update(self._dispatcher)  # todo: lame signature
+        self._dispatcher._remove_dispatcher(id)
 
     def _commit(self):
-        for analyzer in self.__analyzers__.values():
+        for analyzer in list(self.__analyzers__.values()):
             analyzer.commit()
 
     def _valid(self, id: str):
@@ -810,18 +812,30 @@ class _VideoAnalyzerManager(object):
 
             self._commit()
 
+            with self._lock:
+                state = dict(self._restoring)
+                analyzers = list(self.__analyzers__.items())
+
+            state.update({
+                id: analyzer.model.get('id')
+                for id, analyzer in analyzers
+                if not analyzer.done
+            })
+
             with open(settings.app.state_path, 'wb') as f:
-                pickle.dump({
-                    id: analyzer.model.get('id')
-                    for id, analyzer in self.__analyzers__.items()
-                    if not analyzer.done
-                }, f)
+                pickle.dump(state, f)
 
     @api.va.load_state.expose()
     def load_state(self) -> None:
         """Load application state from ``shapeflow.settings.app.state_path``
 
         :attr:`shapeflow.api._VideoAnalyzerManagerDispatcher.load_state`
+
+        Analyzers are restored concurrently on a pool of
+        :attr:`shapeflow.ApplicationSettings.threads` workers. Each analyzer
+        is added as soon as it's been launched, so it becomes available
+        without waiting for the others. Once all analyzers have been
+        restored, they're put back in their original order.
         """
         if settings.app.load_state:
             log.info(f"loading application state")
@@ -829,35 +843,77 @@ class _VideoAnalyzerManager(object):
             try:
                 with open(settings.app.state_path, 'rb') as f:
                     S = pickle.load(f)
+            except FileNotFoundError:
+                return
+            except EOFError:
+                return
 
-                for id, model_id in S.items():
-                    assert isinstance(id, str)
-                    assert isinstance(model_id, int)
+            with self._lock:
+                self._restoring.update(S)
+
+            with ThreadPoolExecutor(
+                    max_workers=settings.app.threads,
+                    thread_name_prefix='restore'
+            ) as executor:
+                futures = {
+                    executor.submit(self._restore, id, model_id): id
+                    for id, model_id in S.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        log.error(f"could not restore '{futures[future]}' - "
+                                  f"{e.__class__.__name__}: {str(e)}")
 
-                    model = self._history.fetch_analysis(model_id)
+            with self._lock:
+                analyzers = dict(self.__analyzers__)
+                self.__analyzers__.clear()
+                self.__analyzers__.update({
+                    id: analyzers.pop(id) for id in S if id in analyzers
+                })
+                self.__analyzers__.update(analyzers)
 
-                    if model is not None:
-                        model.connect(self._history)
+    def _restore(self, id: str, model_id: int) -> None:
+        """Restore an analyzer from the application state.
 
-                        config_json = model.get_config_json()
-                        if config_json is not None:
-                            config = loads(config_json)
-                        else:
-                            raise RootException('invalid config from database')
-                        assert isinstance(config, BaseAnalyzerConfig)
+        Parameters
+        ----------
+        id: str
+            The ``id`` of the analyzer
+        model_id: int
+            The database id of the analyzer
+        """
+        try:
+            assert isinstance(id, str)
+            assert isinstance(model_id, int)
 
-                        analyzer = init(config)
-                        analyzer._set_id(id)
-                        analyzer.set_eventstreamer(self._server.eventstreamer)
+            model = self._history.fetch_analysis(model_id)
 
-                        analyzer.launch()
+            if model is not None:
+                model.connect(self._history)
 
-                        self._add(analyzer)
-                        self._history.add_analysis(analyzer, model)
-            except FileNotFoundError:
-                pass
-            except EOFError:
-                pass
+                config_json = model.get_config_json()
+                if config_json is not None:
+                    config = loads(config_json)
+                else:
+                    raise RootException('invalid config from database')
+                assert isinstance(config, BaseAnalyzerConfig)
+
+                analyzer = init(config)
+                analyzer._set_id(id)
+                analyzer.set_eventstreamer(self._server.eventstreamer)
+
+                analyzer.launch()
+
+                self._history.add_analysis(analyzer, model)
+                with self._lock:
+                    self._add(analyzer)
+
+                log.info(f"restored '{id}'")
+        finally:
+            with self._lock:
+                self._restoring.pop(id, None)
 
     @api.va.stream.expose()
     def stream(self, id: str, endpoint: str) -> BaseStreamer:
@@ -908,6 +964,84 @@ class _VideoAnalyzerManager(object):
             # id is not valid anymore (probably already closed)
             pass
 
+    @api.va.mux.expose()
+    def mux(self, client: str) -> BaseStreamer:
+        """Stream frames and events over a single connection.
+
+        :attr:`shapeflow.api._VideoAnalyzerManagerDispatcher.mux`
+
+        Server events are sent on the ``events`` channel, analyzer streams
+        can be added with :func:`~shapeflow.main._VideoAnalyzerManager.mux_add`
+
+        Parameters
+        ----------
+        client: str
+            Identifies the client
+
+        Returns
+        -------
+        BaseStreamer
+            The client's :class:`~shapeflow.core.streaming.Multiplexer`
+        """
+        log.debug(f"multiplex '{client}'")
+        multiplexer = streams.multiplex(client)
+        multiplexer.add('events', self._server.eventstreamer)
+        return multiplexer
+
+    @api.va.mux_add.expose()
+    def mux_add(self, client: str, id: str, endpoint: str) -> None:
+        """Add an analyzer stream to a client's multiplexed stream,
+        on the ``{id}/{endpoint}`` channel.
+
+        :attr:`shapeflow.api._VideoAnalyzerManagerDispatcher.mux_add`
+
+        Parameters
+        ----------
+        client: str
+            Identifies the client
+        id: str
+            The ``id`` of an analyzer
+        endpoint: str
+            The endpoint to stream
+        """
+        self._check_streaming(id, endpoint)
+
+        with self._lock:
+            log.debug(f"multiplex '{id}/{endpoint}' for '{client}'")
+            method = self._dispatcher[id][endpoint].method
+            streamer = streams.register(self.__analyzers__[id], method)
+        streams.multiplex(client).add(f"{id}/{endpoint}", streamer)
+
+    @api.va.mux_remove.expose()
+    def mux_remove(self, client: str, id: str, endpoint: str) -> None:
+        """Remove an analyzer stream from a client's multiplexed stream.
+
+        :attr:`shapeflow.api._VideoAnalyzerManagerDispatcher.mux_remove`
+
+        Parameters
+        ----------
+        client: str
+            Identifies the client
+        id: str
+            The ``id`` of an analyzer
+        endpoint: str
+            The endpoint to stop streaming
+        """
+        streams.multiplex(client).remove(f"{id}/{endpoint}")
+
+    @api.va.mux_stop.expose()
+    def mux_stop(self, client: str) -> None:
+        """Stop a client's multiplexed stream.
+
+        :attr:`shapeflow.api._VideoAnalyzerManagerDispatcher.mux_stop`
+
+        Parameters
+        ----------
+        client: str
+            Identifies the client
+        """
+        streams.demultiplex(client)
+
     def _check_streaming(self, id, endpoint):
         self._valid(id)
         if not endpoint in map(lambda e: e.name, api.va[id].endpoints):
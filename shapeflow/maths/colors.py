@@ -3,7 +3,7 @@
 For now, only 8-bit integer colors are handled.
 """
 import re
-from typing import Dict, Type, List
+from typing import Dict, Type, List, Tuple
 
 import cv2
 import numpy as np
@@ -81,6 +81,17 @@ class Color(BaseConfig):
         converted = cv2.cvtColor(self.np3d, self._conversion_map[colorspace])
         return tuple(converted.flatten())
 
+    def freeze(self) -> 'FrozenColor':
+        """Get an immutable snapshot of this color to use in per-frame code.
+
+        Returns
+        -------
+        FrozenColor
+            A :class:`~shapeflow.maths.colors.FrozenColor` with the same
+            colorspace and channels as this color
+        """
+        return FrozenColor(self._colorspace, self.list)
+
     @classmethod
     def from_str(cls, color: str) -> 'Color':
         """Deserialize from a formatted string.
@@ -139,6 +150,143 @@ class Color(BaseConfig):
             return v
 
 
+class _Frozen(object):
+    """Base class for immutable objects with ``__slots__``.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def _freeze(self, **attributes) -> None:
+        for key, value in attributes.items():
+            object.__setattr__(self, key, value)
+
+
+class FrozenColor(_Frozen):
+    """An immutable, lightweight counterpart of a
+    :class:`~shapeflow.maths.colors.Color`.
+
+    Validating a :class:`~shapeflow.maths.colors.Color` is relatively
+    expensive, so code that runs for every frame should work with a
+    :class:`~shapeflow.maths.colors.FrozenColor` instead, as
+    returned by :func:`~shapeflow.maths.colors.Color.freeze`.
+    Its channels are not validated again and can't be changed.
+
+    Parameters
+    ----------
+    colorspace: str
+        The name of the colorspace of this color
+    channels: Tuple[int, int, int]
+        The channels of this color
+    """
+    __slots__ = ('colorspace', 'channels', 'array', 'np3d')
+
+    colorspace: str
+    """The name of the colorspace of this color.
+    """
+    channels: Tuple[int, ...]
+    """The channels of this color.
+    """
+    array: np.ndarray
+    """This color as a read-only 1D ``float32`` array,
+    e.g. for bounds in ``cv2.inRange``.
+    """
+    np3d: np.ndarray
+    """This color as a read-only 3D ``uint8`` array,
+    see :attr:`~shapeflow.maths.colors.Color.np3d`.
+    """
+
+    def __init__(self, colorspace: str, channels):
+        channels = tuple(int(c) for c in channels)
+        array = np.array(channels, dtype=np.float32)
+        array.flags.writeable = False
+        np3d = np.array([[channels]], dtype=np.uint8)
+        np3d.flags.writeable = False
+
+        self._freeze(
+            colorspace=colorspace, channels=channels, array=array, np3d=np3d
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenColor) \
+               and self.colorspace == other.colorspace \
+               and self.channels == other.channels
+
+    def __hash__(self) -> int:
+        return hash((self.colorspace, self.channels))
+
+    def __repr__(self):
+        return f"FrozenColor({self.colorspace}, {self.channels})"
+
+    @property
+    def list(self) -> List[int]:
+        """This color as a list.
+        """
+        return list(self.channels)
+
+
+class HsvRange(_Frozen):
+    """An immutable range of HSV colors, to select pixels with
+    ``cv2.inRange``.
+
+    If the hue of the lower bound is higher than that of the upper bound,
+    the range wraps around at ``h=180`` and is split in two.
+
+    Parameters
+    ----------
+    c0: FrozenColor
+        The lower bound, in HSV
+    c1: FrozenColor
+        The upper bound, in HSV
+    """
+    __slots__ = ('bounds',)
+
+    bounds: Tuple[Tuple[np.ndarray, np.ndarray], ...]
+    """The lower and upper bounds of each part of the range
+    as ``float32`` arrays.
+    """
+
+    def __init__(self, c0: FrozenColor, c1: FrozenColor):
+        assert c0.colorspace == _HSV and c1.colorspace == _HSV
+
+        bounds: Tuple[Tuple[np.ndarray, np.ndarray], ...]
+        if c0.channels[0] > c1.channels[0]:
+            # handle hue wrapping situation with two ranges
+            bounds = (
+                (c0.array, FrozenColor(_HSV, (WRAP - 1, *c1.channels[1:])).array),
+                (FrozenColor(_HSV, (0, *c0.channels[1:])).array, c1.array),
+            )
+        else:
+            bounds = ((c0.array, c1.array),)
+
+        self._freeze(bounds=bounds)
+
+    def __call__(self, image: np.ndarray) -> np.ndarray:
+        """Select the pixels of an image within this range.
+
+        Parameters
+        ----------
+        image: np.ndarray
+            An HSV image
+
+        Returns
+        -------
+        np.ndarray
+            A binary image
+        """
+        binary = None
+        for lower, upper in self.bounds:
+            if binary is None:
+                binary = cv2.inRange(image, lower, upper, image)
+            else:
+                binary = binary + cv2.inRange(image, lower, upper, image)
+        return binary
+
+
 class HsvColor(Color):
     """Hue-Saturation-Value color.
     """
@@ -1,6 +1,8 @@
 """Some basic tools for working with images.
 """
 
+import zlib
+
 import numpy as np
 import cv2
 
@@ -47,16 +49,47 @@ def overlay(frame: np.ndarray, overlay: np.ndarray, alpha: float = 0.5) -> np.nd
     )
 
 
-def crop_mask(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
+def mask_rect(mask: np.ndarray) -> np.ndarray:
+    """The minimal rectangle that contains a binary mask.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        An ``OpenCV``-compatible binary image
+
+    Returns
+    -------
+    np.ndarray
+        An 'array rectangle': [first_row, last_row + 1, first_column, last_column + 1]
+    """
+    col_0, row_0, width, height = cv2.boundingRect(mask)
+    if width == 0 or height == 0:
+        raise ValueError("mask is empty")
+    return np.array([row_0, row_0 + height, col_0, col_0 + width])
+
+
+def crop_mask(mask: np.ndarray, rect: np.ndarray = None) \
+        -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
     """Crop a binary mask image array to its minimal (rectangular) size
     to exclude unnecessary regions.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        An ``OpenCV``-compatible binary image
+    rect: np.ndarray
+        The rectangle to crop to, if it's already known
+        ~ :func:`~shapeflow.maths.images.mask_rect`
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, Tuple[int, int]]
+        The cropped mask, the rectangle it was cropped to and its center
     """
+    if rect is None:
+        rect = mask_rect(mask)
 
-    nz = np.nonzero(mask)
-    row_0 = int(nz[0].min())     # todo: document, it's confusing!
-    row_1 = int(nz[0].max()+1)
-    col_0 = int(nz[1].min())
-    col_1 = int(nz[1].max()+1)
+    row_0, row_1, col_0, col_1 = (int(i) for i in rect)
     cropped_mask = mask[row_0:row_1, col_0:col_1].copy()
 
     return cropped_mask, \
@@ -154,11 +187,11 @@ def to_mask(image: np.ndarray, kernel: np.ndarray = None) -> np.ndarray:
 
     # Convert to grayscale
     image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    # Threshold to binary
-    ret, image = cv2.threshold(image, 254, 255, cv2.THRESH_BINARY)
-    # Expand binary region to deal with
+    # Threshold to binary: anything that isn't white is part of the mask
+    ret, image = cv2.threshold(image, 254, 255, cv2.THRESH_BINARY_INV)
+    # Shrink the background to deal with
     #  'under-thresholding' due to high setting (254/255)
-    image = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
+    image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
 
     # The binary threshold does not always map the same binary value
     # to the center of the mask (should be the darker tone)
@@ -166,21 +199,48 @@ def to_mask(image: np.ndarray, kernel: np.ndarray = None) -> np.ndarray:
     # not included in the mask (should be ok in normal cases)
 
     # We want to end up with the mask as 255, the background as 0
-
-    # Apparently that's not it, do the arithmetic
-    #  in float & convert to uint8 afterwards!
-
     if image[0, 0] == 255:  # todo: we're hardcoding pixel 0,0 as background here, this is not ideal!
-        # Do the arithmetic in float & convert to uint8 afterwards!
-        return np.array(
-            np.abs(
-                np.subtract(
-                    255, np.array(
-                        image, dtype=np.float32
-                    )
-                )
-            ), dtype=np.uint8
-        )
+        return cv2.bitwise_not(image)
     else:
         return image
 
+
+
+def pack_mask(mask: np.ndarray) -> Tuple[Tuple[int, int], bytes]:
+    """Pack a binary mask into a compact representation.
+
+    Masks are stored as one bit per pixel and compressed, which is much smaller
+    than the ``uint8`` array itself since masks are mostly empty.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        A binary mask as returned by :func:`~shapeflow.maths.images.to_mask`
+
+    Returns
+    -------
+    Tuple[Tuple[int, int], bytes]
+        The shape of the mask and its packed pixels
+    """
+    return mask.shape, zlib.compress(np.packbits(mask > 0).tobytes(), 1)
+
+
+def unpack_mask(packed: Tuple[Tuple[int, int], bytes]) -> np.ndarray:
+    """Unpack a mask packed with :func:`~shapeflow.maths.images.pack_mask`
+
+    Parameters
+    ----------
+    packed: Tuple[Tuple[int, int], bytes]
+        The shape of the mask and its packed pixels
+
+    Returns
+    -------
+    np.ndarray
+        The binary mask, with the mask as 255 and the background as 0
+    """
+    shape, data = packed
+    bits = np.unpackbits(
+        np.frombuffer(zlib.decompress(data), dtype=np.uint8),
+        count=int(np.prod(shape))
+    )
+    return (bits * 255).astype(np.uint8).reshape(shape)
@@ -1,3 +1,5 @@
+from typing import NamedTuple, Optional
+
 import numpy as np
 import cv2
 
@@ -8,7 +10,7 @@ from shapeflow.config import extend, ConfigType, BaseConfig
 
 from shapeflow.core.interface import FilterConfig, FilterInterface, FilterType
 from shapeflow.maths.images import ckernel
-from shapeflow.maths.colors import Color, HsvColor, convert, WRAP
+from shapeflow.maths.colors import Color, HsvColor, HsvRange, convert
 
 log = get_logger(__name__)
 COLOR = HsvColor(h=0, s=0, v=0)
@@ -53,6 +55,22 @@ class _Config(FilterConfig):
     _open_limits = validator('open', pre=True, allow_reuse=True)(BaseConfig._int_limits)
 
 
+class _Compiled(NamedTuple):
+    """:class:`shapeflow.plugins.BackgroundFilter._Config` compiled for
+    :func:`shapeflow.plugins.BackgroundFilter._Filter.filter`
+    """
+    range: HsvRange
+    """The range between :attr:`~shapeflow.plugins.BackgroundFilter._Config.c0`
+    and :attr:`~shapeflow.plugins.BackgroundFilter._Config.c1`
+    """
+    close: Optional[np.ndarray]
+    """The kernel for closing, if any
+    """
+    open: Optional[np.ndarray]
+    """The kernel for opening, if any
+    """
+
+
 @extend(FilterType, True)
 class _Filter(FilterInterface):
     """Filters out colors outside of a :class:`~shapeflow.maths.colors.HsvColor`
@@ -70,29 +88,26 @@ class _Filter(FilterInterface):
     def mean_color(self, filter: _Config) -> Color:
         return COLOR
 
-    def filter(self, filter: _Config, img: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+    def compile(self, filter: _Config) -> _Compiled:
+        return _Compiled(
+            range=HsvRange(filter.c0.freeze(), filter.c1.freeze()),
+            close=ckernel(filter.close) if filter.close else None,
+            open=ckernel(filter.open) if filter.open else None,
+        )
+
+    def filter(self, filter: _Compiled, img: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
         if mask is None:
             raise ValueError('No mask provided to BackgroundFilter')
 
-        if filter.c0.h > filter.c1.h:
-            # handle hue wrapping situation with two ranges
-            c0_a = np.array(filter.c0.list, dtype=np.float32)
-            c1_a = np.array([WRAP-1] + filter.c1.list[1:], dtype=np.float32)
-            c0_b = np.array([0] + filter.c0.list[1:], dtype=np.float32)
-            c1_b = np.array(filter.c1.list, dtype=np.float32)
-
-            inverse = cv2.inRange(img, c0_a, c1_a, img) \
-                   + cv2.inRange(img, c0_b, c1_b, img)
-        else:
-            c0 = np.array(filter.c0.list, dtype=np.float32)
-            c1 = np.array(filter.c1.list, dtype=np.float32)
-
-            inverse = cv2.inRange(img, c0, c1, img)
-
-        if filter.close:
-            inverse = cv2.morphologyEx(inverse, cv2.MORPH_CLOSE, ckernel(filter.close))
-        if filter.open:
-            inverse = cv2.morphologyEx(inverse, cv2.MORPH_OPEN, ckernel(filter.open))
+        if isinstance(filter, _Config):
+            filter = self.compile(filter)
+
+        inverse = filter.range(img)
+
+        if filter.close is not None:
+            inverse = cv2.morphologyEx(inverse, cv2.MORPH_CLOSE, filter.close)
+        if filter.open is not None:
+            inverse = cv2.morphologyEx(inverse, cv2.MORPH_OPEN, filter.open)
 
         binary = cv2.bitwise_not(inverse)
 
@@ -1,3 +1,5 @@
+from typing import NamedTuple, Optional
+
 import numpy as np
 import cv2
 from pydantic import Field, validator
@@ -7,7 +9,7 @@ from shapeflow.config import extend, ConfigType, BaseConfig
 
 from shapeflow.core.interface import FilterConfig, FilterInterface, FilterType
 from shapeflow.maths.images import ckernel
-from shapeflow.maths.colors import Color, HsvColor, convert, WRAP
+from shapeflow.maths.colors import Color, HsvColor, HsvRange, convert
 
 log = get_logger(__name__)
 
@@ -79,6 +81,22 @@ class _Config(FilterConfig):
     _open_limits = validator('open', pre=True, allow_reuse=True)(BaseConfig._int_limits)
 
 
+class _Compiled(NamedTuple):
+    """:class:`shapeflow.plugins.HsvRangeFilter._Config` compiled for
+    :func:`shapeflow.plugins.HsvRangeFilter._Filter.filter`
+    """
+    range: HsvRange
+    """The range between :attr:`~shapeflow.plugins.HsvRangeFilter._Config.c0`
+    and :attr:`~shapeflow.plugins.HsvRangeFilter._Config.c1`
+    """
+    close: Optional[np.ndarray]
+    """The kernel for closing, if any
+    """
+    open: Optional[np.ndarray]
+    """The kernel for opening, if any
+    """
+
+
 @extend(FilterType, True)
 class _Filter(FilterInterface):
     """Filters out colors outside of a :class:`~shapeflow.maths.colors.HsvColor`
@@ -98,26 +116,23 @@ class _Filter(FilterInterface):
         # for both overlay & plot colors
         return HsvColor(h=filter.color.h, s=255, v=200)
 
-    def filter(self, filter: _Config, img: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
-        if filter.c0.h > filter.c1.h:
-            # handle hue wrapping situation with two ranges
-            c0_a = np.array(filter.c0.list, dtype=np.float32)
-            c1_a = np.array([WRAP-1] + filter.c1.list[1:], dtype=np.float32)
-            c0_b = np.array([0] + filter.c0.list[1:], dtype=np.float32)
-            c1_b = np.array(filter.c1.list, dtype=np.float32)
-
-            binary = cv2.inRange(img, c0_a, c1_a, img) \
-                   + cv2.inRange(img, c0_b, c1_b, img)
-        else:
-            c0 = np.array(filter.c0.list, dtype=np.float32)
-            c1 = np.array(filter.c1.list, dtype=np.float32)
-
-            binary = cv2.inRange(img, c0, c1, img)
-
-        if filter.close:
-            binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, ckernel(filter.close))
-        if filter.open:
-            binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, ckernel(filter.open))
+    def compile(self, filter: _Config) -> _Compiled:
+        return _Compiled(
+            range=HsvRange(filter.c0.freeze(), filter.c1.freeze()),
+            close=ckernel(filter.close) if filter.close else None,
+            open=ckernel(filter.open) if filter.open else None,
+        )
+
+    def filter(self, filter: _Compiled, img: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+        if isinstance(filter, _Config):
+            filter = self.compile(filter)
+
+        binary = filter.range(img)
+
+        if filter.close is not None:
+            binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, filter.close)
+        if filter.open is not None:
+            binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, filter.open)
         if mask is not None:
             # Mask off again
             binary = cv2.bitwise_and(binary, mask)
@@ -1,22 +1,39 @@
-from os.path import dirname, basename, isfile, join
-import os
-import glob
+import pkgutil
 
 from shapeflow import get_logger
+from shapeflow.core.config import ConfigType
+from shapeflow.core.registry import registry
+from shapeflow.core.interface import TransformType, FilterType
+from shapeflow.core.backend import FeatureType
 
 log = get_logger(__name__)
 
-# list plugins
-__all__ = [
-    basename(f).split('.')[0] for f in os.listdir(os.path.dirname(__file__))
-    if f not in ['__init__.py', '__pycache__']
-]
-log.info(f"loading plugins: {', '.join(__all__)}")
+# the factories each built-in plugin extends
+_factories = {
+    'Area_mm2': (FeatureType,),
+    'BackgroundFilter': (FilterType, ConfigType),
+    'HsvRangeFilter': (FilterType, ConfigType),
+    'PerspectiveTransform': (TransformType, ConfigType),
+    'PixelSum': (FeatureType,),
+    'Volume_uL': (FeatureType, ConfigType),
+}
 
-# import plugins
-from . import *
-from shapeflow.core.interface import TransformType, FilterType
-from shapeflow.core.backend import FeatureType
+# list plugins; every module in this package implements one
+__all__ = sorted(
+    module.name for module in pkgutil.iter_modules(__path__)
+    if not module.name.startswith('_')
+)
+
+# register plugins; their modules are only imported once they're used
+for _name in __all__:
+    registry.add(_name, f'{__name__}.{_name}', *_factories[_name])
+
+# register plugins from installed packages
+registry.discover('shapeflow.transforms', TransformType, ConfigType)
+registry.discover('shapeflow.filters', FilterType, ConfigType)
+registry.discover('shapeflow.features', FeatureType, ConfigType)
+
+log.info(f"registered plugins: {', '.join(p.name for p in registry.plugins)}")
 
 
 TransformType.set_default(TransformType('PerspectiveTransform'))
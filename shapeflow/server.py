@@ -3,7 +3,7 @@ import os
 import time
 import subprocess
 from threading import Thread, Event, Lock
-from typing import Optional
+from typing import Optional, Any, Dict, Callable
 
 from flask import Flask, send_from_directory, jsonify, request, Response, make_response, abort
 import waitress
@@ -16,6 +16,7 @@ from shapeflow.core import DispatchingError
 import shapeflow.core.streaming as streaming
 from shapeflow.api import ApiDispatcher
 from shapeflow.main import load, ShapeflowServerInterface
+from shapeflow.asgi import AsgiApp
 
 log = shapeflow.get_logger(__name__)
 UI = os.path.join(
@@ -25,14 +26,17 @@ UI = os.path.join(
 
 
 class ServerThread(Thread, metaclass=util.Singleton):
-    """A thread running a ``Flask`` app over a ``waitress`` server.
+    """A thread running a ``Flask`` app over a ``waitress`` server,
+    or an ASGI app over a ``uvicorn`` server.
     """
     _app: Flask
+    _asgi: Optional[Callable]
     _host: str
     _port: int
 
-    def __init__(self, app: Flask, host: str, port: int):
+    def __init__(self, app: Flask, host: str, port: int, asgi: Optional[Callable] = None):
         self._app = app
+        self._asgi = asgi
         self._host = host
         self._port = port
         super().__init__(daemon=True)
@@ -43,6 +47,24 @@ class ServerThread(Thread, metaclass=util.Singleton):
         If the current address is already in use, the server errors out & stops
         the current process with :func:`shapeflow.server.ServerThread.stop`.
         """
+        if self._asgi is not None:
+            try:
+                import uvicorn
+            except ImportError:
+                log.warning("uvicorn is not installed, serving with waitress")
+            else:
+                try:
+                    uvicorn.run(
+                        self._asgi,
+                        host=self._host,
+                        port=self._port,
+                        log_level="warning",
+                    )
+                except (OSError, SystemExit):
+                    log.warning("address already in use")
+                    self.stop()
+                return
+
         try:
             waitress.serve(
                 self._app,
@@ -107,8 +129,13 @@ class ShapeflowServer(ShapeflowServerInterface):
         log.info(f"serving on http://{host}:{port}")
 
         # Don't show waitress console output (server URL)
+        if shapeflow.settings.app.server == shapeflow.ServerBackend.asgi:
+            asgi = AsgiApp(self, UI)
+        else:
+            asgi = None
+
         with util.suppress_stdout():
-            self._server = ServerThread(self._app, host, port)
+            self._server = ServerThread(self._app, host, port, asgi)
             self._server.start()
 
             time.sleep(self._timeout_suppress)  # Wait for Waitress to catch up
@@ -157,32 +184,51 @@ class ShapeflowServer(ShapeflowServerInterface):
             os.path.basename(path)
         )
 
-    def call_api(self, address: str) -> Response:
+    def dispatch(self, address: str, data: bytes, args: Dict[str, str]) -> Any:
+        """Dispatch an API call
+
+        Parameters
+        ----------
+        address: str
+            The address of the endpoint, relative to ``/api/``
+        data: bytes
+            The body of the request, as JSON
+        args: Dict[str, str]
+            The query arguments of the request
+
+        Returns
+        -------
+        Any
+            The result of the call, ``True`` if the endpoint returned ``None``
+        """
         self.active()
 
         kwargs = {}
-        if request.data:
-            try:
-                kwargs.update(json.loads(request.data))
-            except json.JSONDecodeError as e:
-                log.error(f"could not decode '{str(request.data)}'")
-                raise e
-        if request.args.to_dict():
-            try:
-                kwargs.update({
-                    k: v
-                    for k, v in request.args.to_dict().items()
-                    if v != ''
-                })
-            except json.JSONDecodeError as e:
-                log.error(f"could not decode '{request.args.to_dict()}'")
-                raise e
+        if data:
+            kwargs.update(json.loads(data))
+        if args:
+            kwargs.update({
+                k: v
+                for k, v in args.items()
+                if v != ''
+            })
+
+        result = self.api.dispatch(address, **kwargs)
+
+        if result is None:
+            result = True
+        return result
+
+    def to_json(self, result: Any) -> str:
+        """Encode a result the same way ``flask.jsonify`` does
+        """
+        return self._app.json.dumps(result)
 
+    def call_api(self, address: str) -> Response:
         try:
-            result = self.api.dispatch(address, **kwargs)
-
-            if result is None:
-                result = True
+            result = self.dispatch(
+                address, request.data, request.args.to_dict()
+            )
 
             if isinstance(result, bytes):
                 return make_response(result)
@@ -8,26 +8,52 @@ import time
 from pathlib import Path
 import json
 from logging import Logger
-from distutils.util import strtobool
 from functools import wraps, lru_cache
-from typing import Any, Generator, Optional, Union
+from typing import Any, Generator, Optional, Union, TYPE_CHECKING
 from collections import namedtuple
-import threading
-import queue
 import hashlib
 from contextlib import contextmanager
 
-import numpy as np
+if TYPE_CHECKING:
+    # Only for annotations; numpy is imported where it's used so that
+    #  e.g. the CLI doesn't have to wait for it.
+    import numpy as np
 
 
-def ndarray2str(array: np.ndarray) -> str:
+def ndarray2str(array: 'np.ndarray') -> str:
     return str(json.dumps(array.tolist()))
 
 
-def str2ndarray(string: str) -> np.ndarray:
+def str2ndarray(string: str) -> 'np.ndarray':
+    import numpy as np
     return np.array(json.loads(str(string)))
 
 
+def strtobool(value: str) -> bool:
+    """Convert a string representation of truth to ``True`` or ``False``,
+    like ``distutils.util.strtobool``
+
+    Parameters
+    ----------
+    value: str
+        ``"y"``, ``"yes"``, ``"t"``, ``"true"``, ``"on"`` or ``"1"``
+        for ``True``; ``"n"``, ``"no"``, ``"f"``, ``"false"``, ``"off"``
+        or ``"0"`` for ``False``. Case-insensitive.
+
+    Raises
+    ------
+    ValueError
+        If the value can't be interpreted
+    """
+    value = value.lower()
+    if value in ('y', 'yes', 't', 'true', 'on', '1'):
+        return True
+    elif value in ('n', 'no', 'f', 'false', 'off', '0'):
+        return False
+    else:
+        raise ValueError(f"invalid truth value {value}")
+
+
 Timing = namedtuple('Timing', ('t0', 't1', 'elapsed'))
 
 
@@ -151,6 +177,8 @@ def frame_number_iterator(total: int,
     Generator
         An iterator that returns the requested frame numbers.
     """
+    import numpy as np
+
     if Nf is not None and (dt is None and fps is None):  # todo: very awkward, make two methods instead? also, this should be in shapeflow.video instead of here
         Nf = min(Nf, total)
         for f in np.linspace(0, total, Nf):
@@ -182,8 +210,8 @@ def after_version(version_a, version_b):
     return not before_version(version_a, version_b)
 
 
-def hash_file(path: str, blocksize: int = 1024) -> queue.Queue:
-    """Start hashing a file without blocking the current thread.
+def sha1_file(path: str, blocksize: int = 2**20) -> str:
+    """SHA1 hash of a file.
 
     Parameters
     ----------
@@ -191,30 +219,60 @@ def hash_file(path: str, blocksize: int = 1024) -> queue.Queue:
         The path of the file to hash.
     blocksize: int
         The blocksize step to take when reading the file.
-        Defaults to 1024.
+        Defaults to 1 MiB.
 
     Returns
     -------
-    queue.Queue
-        A new ``queue.Queue`` object.
-        Once the hash is ready, it will be pushed to this queue.
+    str
+        The hash as a hexadecimal string
     """
-    if os.path.isfile:
-        q: queue.Queue = queue.Queue()
-        def _hash_file():
-            nonlocal q
-
-            m = hashlib.sha1()
-            with open(path, 'rb') as f:
-                while True:
-                    buf = f.read(blocksize)
-                    if not buf:
-                        break
-                    m.update(buf)
-                hash = m.hexdigest()
-                q.put(hash)
-        threading.Thread(target=_hash_file, daemon=True).start()
-        return q
+    m = hashlib.sha1()
+    with open(path, 'rb') as f:
+        while True:
+            buf = f.read(blocksize)
+            if not buf:
+                break
+            m.update(buf)
+    return m.hexdigest()
+
+
+def fingerprint_file(path: str, blocksize: int = 2**20, blocks: int = 16) -> str:
+    """SHA1 hash of a sample of a file: its size, its first and last block and
+    ``blocks`` equally spaced blocks in between.
+
+    Files that are too small to sample are hashed completely, i.e.
+    the fingerprint is the same as :func:`~shapeflow.util.sha1_file`.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file to fingerprint.
+    blocksize: int
+        The size of the sampled blocks.
+        Defaults to 1 MiB.
+    blocks: int
+        The number of blocks to sample between the first and last block.
+        Defaults to 16.
+
+    Returns
+    -------
+    str
+        The fingerprint as a hexadecimal string
+    """
+    size = os.path.getsize(path)
+
+    if size <= blocksize * (blocks + 2):
+        return sha1_file(path, blocksize)
+
+    stride = (size - blocksize) // (blocks + 1)
+    offsets = [i * stride for i in range(blocks + 1)] + [size - blocksize]
+
+    m = hashlib.sha1(str(size).encode())
+    with open(path, 'rb') as f:
+        for offset in offsets:
+            f.seek(offset)
+            m.update(f.read(blocksize))
+    return m.hexdigest()
 
 
 @contextmanager
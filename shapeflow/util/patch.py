@@ -0,0 +1,104 @@
+"""A subset of `JSON Patch <https://tools.ietf.org/html/rfc6902>`_.
+
+Only ``add``, ``remove`` and ``replace`` operations are generated & applied.
+"""
+import copy
+from typing import Any, List, Union
+
+
+def _escape(key: Union[str, int]) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def diff(a: Any, b: Any, path: str = '') -> List[dict]:
+    """Compute a patch that turns ``a`` into ``b``.
+
+    Nested ``dict`` values are compared key by key and lists of the same
+    length element by element; anything else is replaced as a whole.
+
+    Parameters
+    ----------
+    a
+        The original JSON-compatible object
+    b
+        The target JSON-compatible object
+    path
+        JSON pointer to ``a`` and ``b``. Defaults to the document root.
+
+    Returns
+    -------
+    List[dict]
+        A list of patch operations
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        ops: List[dict] = []
+        for key in a:
+            if key not in b:
+                ops.append({'op': 'remove', 'path': f"{path}/{_escape(key)}"})
+        for key, value in b.items():
+            if key not in a:
+                ops.append({
+                    'op': 'add', 'path': f"{path}/{_escape(key)}", 'value': value
+                })
+            else:
+                ops += diff(a[key], value, f"{path}/{_escape(key)}")
+        return ops
+    elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+        ops = []
+        for i, (x, y) in enumerate(zip(a, b)):
+            ops += diff(x, y, f"{path}/{i}")
+        return ops
+    elif a != b or type(a) != type(b):
+        return [{'op': 'replace', 'path': path, 'value': b}]
+    else:
+        return []
+
+
+def patch(document: Any, ops: List[dict]) -> Any:
+    """Apply a patch to a document.
+
+    Parameters
+    ----------
+    document
+        A JSON-compatible object. Is not modified.
+    ops
+        A list of patch operations ~ :func:`~shapeflow.util.patch.diff`
+
+    Returns
+    -------
+    Any
+        The patched document
+    """
+    document = copy.deepcopy(document)
+
+    for op in ops:
+        if not op['path']:
+            if op['op'] == 'remove':
+                document = None
+            else:
+                document = copy.deepcopy(op['value'])
+            continue
+
+        *parents, last = [_unescape(t) for t in op['path'].split('/')[1:]]
+
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        key: Union[str, int] = int(last) if isinstance(target, list) else last
+
+        if op['op'] == 'remove':
+            del target[key]
+        elif op['op'] in ('add', 'replace'):
+            if op['op'] == 'add' and isinstance(target, list):
+                target.insert(int(key), copy.deepcopy(op['value']))
+            else:
+                target[key] = copy.deepcopy(op['value'])
+        else:
+            raise ValueError(f"unsupported patch operation '{op['op']}'")
+
+    return document
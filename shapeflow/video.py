@@ -3,11 +3,11 @@ import re
 import abc
 import threading
 import copy
-from typing import Callable, Any, Dict, Generator, Optional, List, Tuple, Type
+from typing import Callable, Any, Dict, Generator, Optional, List, Tuple, \
+    Type, TYPE_CHECKING
 
 import cv2
 import numpy as np
-import pandas as pd
 
 from shapeflow import get_logger, settings, ResultSaveMode
 from shapeflow.api import api
@@ -20,17 +20,22 @@ from shapeflow.core.backend import Instance, CachingInstance, \
     BaseAnalyzer, BackendSetupError, AnalyzerType, Feature, \
     FeatureSet, \
     FeatureType, AnalyzerState, PushEvent, FeatureConfig, CacheAccessError
-from shapeflow.core.config import extend
+from shapeflow.core import identity
+from shapeflow.core.config import extend, _version
 from shapeflow.core.interface import TransformInterface, FilterConfig, \
     FilterInterface, FilterType, TransformType, Handler
 from shapeflow.core.streaming import stream, streams
-from shapeflow.design import peel
-from shapeflow.maths.colors import Color, HsvColor, BgrColor, convert, css_hex
+from shapeflow.design import render_layers
+from shapeflow.maths.colors import Color, HsvColor, BgrColor, FrozenColor, \
+    convert, css_hex
 from shapeflow.maths.images import to_mask, crop_mask, ckernel, \
-    overlay, rect_contains
+    overlay, rect_contains, pack_mask, unpack_mask, mask_rect
 from shapeflow.maths.coordinates import ShapeCoo, Roi
 from shapeflow.util import frame_number_iterator
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 log = get_logger(__name__)
 
 
@@ -50,7 +55,7 @@ class VideoFileHandler(CachingInstance, Lockable):
     frame_number: int
     _requested_frames: List[int]
 
-    _capture: cv2.VideoCapture
+    _capture: Optional[cv2.VideoCapture]
 
     _shape: tuple
 
@@ -71,23 +76,52 @@ class VideoFileHandler(CachingInstance, Lockable):
 
         self.path = video_path
         self._cached = False
+        self._capture = None
+
+        # Key the metadata by file identity rather than by content, so
+        #  opening a video doesn't have to wait for it to be hashed
+        stat = os.stat(self.path)
+        metadata = self.cached_call(
+            self._probe, os.path.abspath(self.path),
+            stat.st_size, stat.st_mtime_ns
+        )
 
-        self._capture = cv2.VideoCapture(
-            os.path.join(os.getcwd(), self.path)
-        )  # todo: handle failure to open capture
-
-        self.frame_count = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT))  # todo: should be 'private' attributes
-        self.fps = self._capture.get(cv2.CAP_PROP_FPS)
-        self.frame_number = int(self._capture.get(cv2.CAP_PROP_POS_FRAMES))
+        self.frame_count = metadata['frame_count']  # todo: should be 'private' attributes
+        self.fps = metadata['fps']
+        self.frame_number = 0
 
-        self._shape = tuple([
-            int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-        ])
+        self._shape = tuple(metadata['shape'])
 
         if self.frame_count == 0:
             raise VideoFileTypeError
 
+    def _probe(self, path: str, size: int, mtime: int) -> dict:
+        # The arguments only identify the file for the cache;
+        #  the video itself is always read from self.path.
+        capture = self.capture
+
+        return {
+            'frame_count': int(capture.get(cv2.CAP_PROP_FRAME_COUNT)),
+            'fps': capture.get(cv2.CAP_PROP_FPS),
+            'shape': (
+                int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            ),
+        }
+
+    @property
+    def capture(self) -> cv2.VideoCapture:
+        """The ``cv2.VideoCapture`` of the video file.
+
+        Only opened once it's needed; the metadata of the video is cached,
+        so videos with cached frames can be loaded without opening them.
+        """
+        if self._capture is None:
+            self._capture = cv2.VideoCapture(
+                os.path.join(os.getcwd(), self.path)
+            )  # todo: handle failure to open capture
+        return self._capture
+
     @property
     def config(self) -> VideoFileHandlerConfig:
         return self._config
@@ -143,7 +177,7 @@ class VideoFileHandler(CachingInstance, Lockable):
     def _set_position(self, frame_number: int):
         """Set the position of the ``cv2.VideoCapture``.
         """
-        self._capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
         self._get_position()
 
     def _get_position(self) -> int:
@@ -152,7 +186,7 @@ class VideoFileHandler(CachingInstance, Lockable):
         Due to some internal workings of OpenCV, the actual position the
         capture object ends up at may differ from the requested position.
         """
-        self.frame_number = self._capture.get(cv2.CAP_PROP_POS_FRAMES)
+        self.frame_number = self.capture.get(cv2.CAP_PROP_POS_FRAMES)
         return self.frame_number
 
     def _read_frame(self, _: str, frame_number: int = None) -> Optional[np.ndarray]:
@@ -169,7 +203,7 @@ class VideoFileHandler(CachingInstance, Lockable):
             log.debug(f"reading  {self.path} frame {self.frame_number}")
 
             self._set_position(frame_number)
-            ret, frame = self._capture.read()
+            ret, frame = self.capture.read()
 
             if ret:
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, frame)
@@ -204,8 +238,6 @@ class VideoFileHandler(CachingInstance, Lockable):
     def seek(self, position: float = None) -> float:
         """Seek to a relative position in the video ~ [0,1]
         """
-        # todo: had to remove lock to enable reading frames :/
-        #       (otherwise streams.update() can get deadocked @ VideoFileHandler if not reading frames from cache)
         if position is not None:
             frame_number = int(position * self.frame_count)
             if settings.cache.resolve_frame_number:
@@ -214,7 +246,6 @@ class VideoFileHandler(CachingInstance, Lockable):
                 self.frame_number = frame_number
 
         log.debug(f"seeking  {self.path} {self.frame_number}/{self.frame_count}")
-        streams.update()
 
         return self.frame_number / self.frame_count
 
@@ -315,7 +346,6 @@ class TransformHandler(Instance, Handler):  # todo: clean up config / config.dat
             self.config(roi=roi)
 
             self.set(self._implementation.estimate(self._adjust(roi), self._video_shape, self._design_shape))
-            streams.update()
 
     def _adjust(self, roi: Roi) -> Roi:
         """Adjust ROI (90° turns & flips)
@@ -371,8 +401,6 @@ class TransformHandler(Instance, Handler):  # todo: clean up config / config.dat
         self.config(roi=None)
         self.set(None)
 
-        streams.update()
-
     def get_coordinates(self) -> Optional[list]:
         if isinstance(self.config.roi, list):
             return self.config.roi
@@ -421,8 +449,11 @@ class FilterHandler(Instance, Handler):
     _config_class = FilterHandlerConfig
     _config: FilterHandlerConfig
 
+    _compiled: Optional[Tuple[tuple, Any]]
+
     def __init__(self, config: FilterHandlerConfig = None):
         super(FilterHandler, self).__init__(config)
+        self._compiled = None
 
         if config is not None:
             self._config = config
@@ -471,6 +502,10 @@ class FilterHandler(Instance, Handler):
 
         implementation = super(FilterHandler, self).set_implementation(implementation)
 
+        if self.config.type == implementation and \
+                type(self.config.data) is self.implementation.config_class():
+            return implementation
+
         # Keep matching config fields accross implementations
         old_data = self.config.data.to_dict()
         new_keys = list(self.implementation.config_class().__fields__.keys())
@@ -487,7 +522,22 @@ class FilterHandler(Instance, Handler):
     def __call__(self, frame: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
         """Filter an image
         """
-        return self.implementation.filter(self.config.data, frame, mask)
+        return self.implementation.filter(self.compiled, frame, mask)
+
+    @property
+    def compiled(self) -> Any:
+        """The filter configuration as compiled by the implementation,
+        see :func:`~shapeflow.core.interface.FilterInterface.compile`.
+        Only compiled again once the configuration has changed.
+        """
+        data = self.config.data
+        compiled = self._compiled
+        version = (self.implementation, data.version)
+
+        if compiled is None or compiled[0] != version:
+            compiled = (version, self.implementation.compile(data))
+            self._compiled = compiled
+        return compiled[1]
 
 
 class Mask(Instance):
@@ -515,6 +565,7 @@ class Mask(Instance):
             name: str,
             config: MaskConfig = None,
             filter: FilterHandler = None,
+            rect: np.ndarray = None,
     ):
         if config is None:
             config = MaskConfig()
@@ -526,7 +577,7 @@ class Mask(Instance):
         self.config(name=name)
 
         self._full = mask
-        self._part, self._rect, self._center = crop_mask(self._full)
+        self._part, self._rect, self._center = crop_mask(self._full, rect)
 
         # Each Mask should have its own FilterHandler instance, unless otherwise specified
         if filter is None:
@@ -649,20 +700,22 @@ class DesignFileHandler(CachingInstance):
         self._render(path, mask_config)
 
     def _render(self, path: str = None, mask_config: Tuple[MaskConfig, ...] = None):
-        if path is None:
-            path = self._path
+        if path is not None:
+            self._path = path
 
-        self._overlay = self.peel_design(path, self.config.dpi)
+        self._overlay, masks, rects, names = self.render_design(
+            self._path, self.config.dpi, self.config.smoothing
+        )
         self._shape = (self._overlay.shape[1], self._overlay.shape[0])
 
         self._masks = []
-        for i, (mask, name) in enumerate(zip(*self.read_masks(path, self.config.dpi))):
-            if mask_config is not None and len(mask_config) > 0 and len(mask_config) >= i + 1:  # handle case len(mask_config) < len(self.read_masks(path))
+        for i, (mask, rect, name) in enumerate(zip(masks, rects, names)):
+            if mask_config is not None and len(mask_config) > 0 and len(mask_config) >= i + 1:  # handle case len(mask_config) < len(masks)
                 self._masks.append(
-                    Mask(self, mask, name, mask_config[i])
+                    Mask(self, mask, name, mask_config[i], rect=rect)
                 )
             else:
-                self._masks.append(Mask(self, mask, name))
+                self._masks.append(Mask(self, mask, name, rect=rect))
 
     @property
     def config(self) -> DesignFileHandlerConfig:
@@ -674,78 +727,124 @@ class DesignFileHandler(CachingInstance):
         for f in renders:
             os.remove(os.path.join(settings.render.dir, f))
 
-    def _peel_design(self, design_path, dpi) -> np.ndarray:
+    def _keep_renders(self, renders: Dict[str, np.ndarray]) -> None:
         if not os.path.isdir(settings.render.dir):
             os.mkdir(settings.render.dir)
         else:
             self._clear_renders()
 
-        peel(design_path, dpi, settings.render.dir)
+        for label, image in renders.items():
+            cv2.imwrite(
+                os.path.join(settings.render.dir, f"{label}.png"), image
+            )
+
+    def _render_layers(self, design_path: str, dpi: int) -> Dict[str, np.ndarray]:
+        renders = render_layers(design_path, dpi)
 
-        overlay = cv2.imread(
-            os.path.join(settings.render.dir, 'overlay.png')
-        )
+        if settings.render.keep:
+            self._keep_renders(renders)
 
-        return overlay
+        return renders
 
-    def _read_masks(self, _, __) -> Tuple[List[np.ndarray], List[str]]:
-        files = os.listdir(settings.render.dir)
-        files.remove('overlay.png')
+    @staticmethod
+    def _order_layers(labels: List[str]) -> List[Tuple[str, str]]:
+        """Order mask layers: numbered layers first, by number,
+        then unnumbered layers in the order they appear in the design.
 
-        # Catch file names of numbered layers
+        Parameters
+        ----------
+        labels: List[str]
+            Layer labels, without the overlay
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The label and mask name of every layer
+        """
+        # Catch labels of numbered layers
         pattern = re.compile(r'(\d+)[?\-=_#/\\\ ]+([?\w\-=_#/\\\ ]+)')
 
-        sorted_files = []
-        matched = {}
-        mismatched = []
+        matched: Dict[int, Tuple[str, str]] = {}
+        mismatched: List[Tuple[str, str]] = []
 
-        for path in files:
-            match = pattern.search(os.path.splitext(path)[0])
-            path = os.path.join(settings.render.dir, path)
+        for label in labels:
+            match = pattern.search(label)
 
             if match:
                 matched.update(  # numbered layer
-                    {int(match.groups()[0]): path}  # keep track of index
+                    {int(match.groups()[0]): (label, match.groups()[1].strip())}
                 )
             else:
-                mismatched.append(path)  # not a numbered layer
+                mismatched.append((label, label))  # not a numbered layer
 
-        # Sort numbered layers
-        for index in sorted(matched.keys()):
-            sorted_files.append(matched[index])
+        # Sort numbered layers and append unnumbered layers to the end
+        return [matched[index] for index in sorted(matched.keys())] + mismatched
 
-        # Append unnumbered layers to the end of the list
-        sorted_files = sorted_files + mismatched
+    def _render_design(self, design_hash: str, dpi: int, smoothing: int,
+                       path: str) -> dict:
+        # The design file is identified by its hash so renders can be cached
+        #  by content; its path is passed as a keyword argument, which
+        #  cached_call leaves out of the key.
+        renders = self._render_layers(path, dpi)
+
+        kernel = ckernel(smoothing)
 
-        masks = []
         names = []
-        for path in sorted_files:
-            masks.append(
-                to_mask(
-                    cv2.imread(path), ckernel(self.config.smoothing)
-                )
-            )
+        masks = []
+        rects = []
+        for label, name in self._order_layers(
+                [label for label in renders if label != 'overlay']
+        ):
+            mask = to_mask(renders[label], kernel)
+            masks.append(pack_mask(mask))
+            rects.append(mask_rect(mask))
+            names.append(name)
+
+        return {
+            'overlay': cv2.imencode('.png', renders['overlay'])[1].tobytes(),
+            'masks': masks,
+            'rects': rects,
+            'names': names,
+        }
 
-            match = pattern.search(path)
-            if match:
-                names.append(match.groups()[1].strip())
-            else:
-                names.append(path)
+    def render_design(self, design_path: str, dpi: int, smoothing: int) \
+            -> Tuple[np.ndarray, List[np.ndarray], List[np.ndarray], List[str]]:
+        """Render the overlay and masks of a design.
 
-        if not settings.render.keep:
-            self._clear_renders()
+        Renders are cached by the contents of the design file, the DPI and
+        the smoothing kernel size. The overlay and masks are cached in a
+        compact form ~ :func:`~shapeflow.maths.images.pack_mask`, so
+        designs that have been rendered before load quickly, also after
+        a restart.
 
-        return masks, names
+        Parameters
+        ----------
+        design_path: str
+            The path to the design file
+        dpi: int
+            The DPI (dots per inch) to render at
+        smoothing: int
+            The size of the smoothing kernel used to generate the masks
 
-    def peel_design(self, design_path: str, dpi: int) -> np.ndarray:
-        """Render out all of the layers in a design
-        """
-        return self.cached_call(self._peel_design, design_path, dpi)
+        Returns
+        -------
+        Tuple[np.ndarray, List[np.ndarray], List[np.ndarray], List[str]]
+            The overlay (BGR), the masks, the rectangles they should be
+            cropped to ~ :func:`~shapeflow.maths.images.mask_rect`
+            and their names
+        """
+        design = self.cached_call(
+            self._render_design, identity.identify(design_path), dpi, smoothing,
+            path=design_path
+        )
 
-    def read_masks(self, design_path: str, dpi: int) -> Tuple[List[np.ndarray], List[str]]:
-        """Load masks from the rendered files
-        """
-        return self.cached_call(self._read_masks, design_path, dpi)
+        overlay = cv2.imdecode(
+            np.frombuffer(design['overlay'], dtype=np.uint8), cv2.IMREAD_COLOR
+        )
+        masks = [unpack_mask(mask) for mask in design['masks']]
+        rects = design.get('rects', [None] * len(masks))
+
+        return overlay, masks, list(rects), list(design['names'])
 
     @property
     def shape(self):
@@ -791,8 +890,10 @@ class MaskFunction(Feature, metaclass=abc.ABCMeta):
     dpi: int
 
     _feature_type: FeatureType
+    _bgr: Optional[Tuple[Color, tuple, FrozenColor]]
 
     def __init__(self, mask: Mask, global_config: FeatureConfig, config: Optional[dict] = None):
+        self._bgr = None
         self.mask = mask
         self.filter = mask.filter
         self.dpi = mask.design.config.dpi
@@ -852,6 +953,19 @@ class MaskFunction(Feature, metaclass=abc.ABCMeta):
     def _guideline_color(self) -> Color:
         return self.filter.mean_color()
 
+    @property
+    def bgr(self) -> FrozenColor:
+        """The color of this feature in BGR, for state images.
+        Only converted again once the color has changed.
+        """
+        color = self.color
+        bgr = self._bgr
+
+        if bgr is None or bgr[0] is not color or bgr[1] != color.version:
+            bgr = (color, color.version, convert(color, BgrColor).freeze())
+            self._bgr = bgr
+        return bgr[2]
+
     def value(self, frame) -> Any:
         """The value of this feature for a given frame
 
@@ -875,22 +989,21 @@ class MaskFunction(Feature, metaclass=abc.ABCMeta):
                 # Masked & filtered pixels ~ frame
                 binary = self.filter(self.mask(frame), self.mask.part)
 
-                substate = np.multiply(
-                    np.ones((binary.shape[0], binary.shape[1], 3),
-                            dtype=np.uint8),
-                    convert(self.color, BgrColor).np3d
+                substate = np.full(
+                    (binary.shape[0], binary.shape[1], 3),
+                    self.bgr.channels, dtype=np.uint8
                 )
                 state[self.mask.rows, self.mask.cols, :] \
                     += cv2.bitwise_and(substate, substate, mask=binary)
             else:
                 # Not ready -> highlight feature with a rectangle
                 substate = np.zeros((*self.mask.part.shape, 3), dtype=np.uint8)
+                c = self.bgr.channels
 
-                for i,c in enumerate(convert(self.color, BgrColor).list):  # todo: numpy this
-                    substate[0:2, :, i] = c
-                    substate[-2:, :, i] = c
-                    substate[:, 0:2, i] = c
-                    substate[:, -2:, i] = c
+                substate[0:2, :] = c
+                substate[-2:, :] = c
+                substate[:, 0:2] = c
+                substate[:, -2:] = c
 
                 state[self.mask.rows, self.mask.cols, :] += substate
 
@@ -937,7 +1050,7 @@ class VideoAnalyzer(BaseAnalyzer):
     features: Tuple[Feature,...]
     """The features used in this analysis
     """
-    results: Dict[str, pd.DataFrame]
+    results: Dict[str, 'pd.DataFrame']
     """The results of the current run of this analysis
     """
 
@@ -945,7 +1058,7 @@ class VideoAnalyzer(BaseAnalyzer):
 
     def __init__(self, config: VideoAnalyzerConfig = None):
         super().__init__(config)
-        self.results: Dict[FeatureType, pd.DataFrame] = {}
+        self.results: Dict[FeatureType, 'pd.DataFrame'] = {}
 
     @property
     def config(self) -> VideoAnalyzerConfig:
@@ -953,13 +1066,16 @@ class VideoAnalyzer(BaseAnalyzer):
 
     def _gather_config(self):
         # todo: would be nice if this wasn't necessary :(
-        if hasattr(self, 'video') and self.config.video != self.video.config:
+        if hasattr(self, 'video') and self.config.video.version != self.video.config.version:
             self.config(video=self.video.config)
-        if hasattr(self, 'design') and self.config.design != self.design.config:
+        if hasattr(self, 'design') and self.config.design.version != self.design.config.version:
             self.config(design=self.design.config)
-        if hasattr(self, 'transform') and self.config.transform != self.transform.config:
+        if hasattr(self, 'transform') and self.config.transform.version != self.transform.config.version:
             self.config(transform=self.transform.config)
-        if hasattr(self, 'masks'):
+        if hasattr(self, 'masks') and (
+                tuple(m.version for m in self.config.masks) != tuple(m.config.version for m in self.masks)
+                or any(len(m.parameters) != len(self.config.features) for m in self.config.masks)
+        ):  # mask parameters are resolved against the features on assignment
             self.config(masks=tuple([mask.config for mask in self.masks]))
 
     @property
@@ -1045,6 +1161,8 @@ class VideoAnalyzer(BaseAnalyzer):
         self.get_colors()
 
     def _new_results(self):
+        import pandas as pd
+
         self.results = {}
         for fs, feature in zip(self._featuresets.values(), self.config.features):
             self.results[str(feature)] = pd.DataFrame(
@@ -1077,6 +1195,39 @@ class VideoAnalyzer(BaseAnalyzer):
         self._config(**config)
         self._gather_config()
 
+    def _config_versions(self) -> Dict[str, Any]:
+        """Take a snapshot of the configuration to check which parts of it
+        are changed by :func:`~shapeflow.video.VideoAnalyzer.set_config`.
+
+        Nested configuration is represented by its version, so this is cheap
+        regardless of the number of masks.
+        """
+        roi = self.config.transform.roi
+        return {
+            'name': self.config.name,
+            'description': self.config.description,
+            'frames': (
+                self.config.Nf, self.config.dt,
+                self.config.frame_interval_setting
+            ),
+            'features': self.config.features,
+            'feature_parameters': tuple(
+                _version(parameters)
+                for parameters in self.config.feature_parameters
+            ),
+            'video_path': self.config.video_path,
+            'design_path': self.config.design_path,
+            'video': self.config.video.version,
+            'design': self.config.design.version,
+            'transform': self.config.transform.version,
+            'roi': (
+                self.config.transform.flip.version,
+                self.config.transform.turn,
+                roi.version if roi is not None else None,
+            ),
+            'masks': tuple(mask.version for mask in self.config.masks),
+        }
+
     @api.va.__id__.set_config.expose()
     def set_config(self, config: dict, silent: bool = False) -> dict:
         with self.lock():
@@ -1085,70 +1236,56 @@ class VideoAnalyzer(BaseAnalyzer):
                 do_relaunch = False
                 log.debug(f"Setting VideoAnalyzerConfig to {config}")
 
-                previous_name = copy.copy(self.config.name)
-                previous_desc = copy.copy(self.config.description)
-                previous_Nf = copy.copy(self.config.Nf)
-                previous_dt = copy.copy(self.config.dt)
-                previous_fis = copy.copy(self.config.frame_interval_setting)
-                previous_features = copy.deepcopy(self.config.features)  # todo: clean up
-                previous_video_path = copy.deepcopy(self.config.video_path)
-                previous_design_path = copy.deepcopy(self.config.design_path)
-                previous_design = copy.deepcopy(self.config.design)
-                previous_flip = copy.deepcopy(self.config.transform.flip)
-                previous_turn = copy.deepcopy(self.config.transform.turn)
-                previous_roi = copy.deepcopy(self.config.transform.roi)
-                previous_masks = copy.deepcopy(self.config.masks)
+                # Fields that are assigned the same value keep their version,
+                #  so changes can be detected without comparing against a copy
+                previous = self._config_versions()
 
                 # Set implementations
                 if hasattr(self, 'transform') and 'transform' in config and 'type' in config['transform']:
-                    self.transform.set_implementation(config['transform']['type'])   # todo: shouldn't do this every time
+                    self.transform.set_implementation(config['transform']['type'])
                 if hasattr(self, 'design') and 'masks' in config:
                     for i, mask in enumerate(self.design.masks):
                         if 'filter' in config['masks'][i] and 'type' in config['masks'][i]['filter']:
-                            mask.filter.set_implementation(config['masks'][i]['filter']['type'])  # todo: shouldn't do this every time
+                            mask.filter.set_implementation(config['masks'][i]['filter']['type'])
 
                 self._set_config(config)
 
-                if hasattr(self, 'transform'):
+                current = self._config_versions()
+                changed = {k for k in current if current[k] != previous[k]}
+
+                if hasattr(self, 'transform') and 'transform' in changed:
                     self.transform._config(**self.config.transform.to_dict())
-                    self.transform.set_implementation()   # todo: shouldn't do this every time
-                if hasattr(self, 'design'):
+                    self.transform.set_implementation()
+                if hasattr(self, 'design') and 'design' in changed:
                     self.design._config(**self.config.design.to_dict())
 
                 # Check for file changes
-                if self.launched and previous_video_path != self.config.video_path:
-                    do_commit = True
-                    do_relaunch = True
-
-                if self.launched and previous_design_path != self.config.design_path:
+                if self.launched and changed & {'video_path', 'design_path'}:
                     do_commit = True
                     do_relaunch = True
 
                 # Check for design render changes
-                if previous_design != self.config.design:
+                if 'design' in changed:
                     self.design._render(mask_config=self.config.masks)
                     self.transform._design_shape = self.design.shape
                     self.estimate_transform()
                     do_commit = True
 
                 # Check for name/description changes
-                if self.config.name != previous_name:
-                    do_commit = True
-                if self.config.description != previous_desc:
+                if changed & {'name', 'description'}:
                     do_commit = True
 
                 # Check for changes in frames
-                if hasattr(self, 'video'):
-                    if any([
-                        previous_Nf != self.config.Nf,
-                        previous_dt != self.config.dt,
-                        previous_fis != self.config.frame_interval_setting
-                    ]):
-                        self.video.set_requested_frames(list(self.frame_numbers()))
-                        do_commit = True
+                if hasattr(self, 'video') and 'frames' in changed:
+                    self.video.set_requested_frames(list(self.frame_numbers()))
+                    do_commit = True
+
+                # Check for video handler changes
+                if 'video' in changed:
+                    do_commit = True
 
                 # Check for changes in features
-                if previous_features != self.config.features:
+                if changed & {'features', 'feature_parameters'}:
                     if self.launched:
                         self._get_featuresets()
 
@@ -1159,16 +1296,24 @@ class VideoAnalyzer(BaseAnalyzer):
                     self._get_featuresets()
 
                 # Check for ROI adjustments
-                if previous_flip != self.config.transform.flip \
-                        or previous_turn != self.config.transform.turn \
-                        or previous_roi != self.config.transform.roi:
+                if 'roi' in changed:
                     self.estimate_transform()  # todo: self.config.bla.thing should be exactly self.bla.config.thing always
                     do_commit = True
 
-                # Check for mask adjustments
-                if previous_masks != self.config.masks:
-                    for i, mask in enumerate(self.design.masks):
-                        mask.set_config(self.config.masks[i].to_dict())
+                # Check for mask adjustments; only reconfigure masks that changed
+                if 'masks' in changed:
+                    if len(previous['masks']) == len(current['masks']):
+                        masks = [
+                            i for i, (p, c) in enumerate(zip(previous['masks'], current['masks']))
+                            if p != c
+                        ]
+                    else:
+                        masks = list(range(len(self.config.masks)))
+
+                    if hasattr(self, 'design'):
+                        for i in masks:
+                            if i < len(self.design.masks):
+                                self.design.masks[i].set_config(self.config.masks[i].to_dict())
 
                     do_commit = True
 
@@ -1183,11 +1328,15 @@ class VideoAnalyzer(BaseAnalyzer):
 
                 config = self.get_config()
 
-                # Push config event
-                self.event(PushEvent.CONFIG, config)
+                if changed or do_relaunch:
+                    # Push config event
+                    self.event(PushEvent.CONFIG, config)
 
-                # Push streams
-                streams.update()
+                    # Push affected streams
+                    if do_relaunch or changed & {'video', 'design', 'transform', 'roi'}:
+                        streams.update(self)
+                    elif changed & {'masks', 'features', 'feature_parameters'}:
+                        streams.update(self, methods=[self.get_state_frame])
 
                 return config
 
@@ -1311,6 +1460,7 @@ class VideoAnalyzer(BaseAnalyzer):
         """
         self.video.seek(position)
         self.push_status()
+        streams.update(self)
 
         return self.position
 
@@ -1339,6 +1489,7 @@ class VideoAnalyzer(BaseAnalyzer):
             roi_config = Roi(**roi)
 
         self.transform.estimate(roi_config)
+        streams.update(self)
 
         self.state_transition()
         self.event(PushEvent.CONFIG, self.get_config())
@@ -1355,6 +1506,7 @@ class VideoAnalyzer(BaseAnalyzer):
         :attr:`shapeflow.api._VideoAnalyzerDispatcher.clear_roi`
         """
         self.transform.clear()
+        streams.update(self)
         self.state_transition()
 
     @api.va.__id__.turn_cw.expose()
@@ -1509,7 +1661,7 @@ class VideoAnalyzer(BaseAnalyzer):
             self.event(PushEvent.CONFIG, self.get_config())
             self.commit()
 
-            streams.update()
+            streams.update(self)
             self.commit()
         elif len(hits) == 0:
             log.debug(f"no hit for {design_space_click.idx}")
@@ -1535,7 +1687,7 @@ class VideoAnalyzer(BaseAnalyzer):
         self.event(PushEvent.CONFIG, self.get_config())
         self.commit()
 
-        streams.update()
+        streams.update(self)
 
         return True
 
@@ -0,0 +1,135 @@
+import os
+import json
+import shutil
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+
+from shapeflow.core import DispatchingError
+from shapeflow.core.streaming import JsonStreamer
+from shapeflow.asgi import AsgiApp
+
+
+class StubServer(object):
+    def __init__(self):
+        self.calls = []
+        self.streamer = JsonStreamer()
+
+    def dispatch(self, address, data, args):
+        self.calls.append((address, data, args))
+
+        if address == 'echo':
+            return {'data': json.loads(data) if data else None, 'args': args}
+        elif address == 'stream':
+            def push():
+                for i in range(3):
+                    self.streamer.push({'i': i})
+                time.sleep(0.1)
+                self.streamer.stop()
+            threading.Timer(0.1, push).start()
+            return self.streamer
+        elif address == 'idle':
+            return self.streamer
+        elif address == 'error':
+            raise ValueError('oops')
+        else:
+            raise DispatchingError
+
+    def to_json(self, result):
+        return json.dumps(result)
+
+    def active(self):
+        pass
+
+
+def call(app, path, method='GET', query=b'', body=b'', disconnect=10.0):
+    messages = []
+    received = [False]
+
+    async def receive():
+        if not received[0]:
+            received[0] = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        await asyncio.sleep(disconnect)
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query,
+    }
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), timeout=5))
+
+    status = messages[0]['status']
+    headers = dict(messages[0]['headers'])
+    return status, headers, [m['body'] for m in messages[1:] if m['body']]
+
+
+class AsgiAppTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, 'index.html'), 'w') as f:
+            f.write('<html></html>')
+
+        self.server = StubServer()
+        self.app = AsgiApp(self.server, self.dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_call(self):
+        status, headers, body = call(
+            self.app, '/api/echo', 'POST', b'a=1&b=&a=2', b'{"x": 1}'
+        )
+
+        self.assertEqual(200, status)
+        self.assertEqual(b'application/json', headers[b'content-type'])
+        self.assertEqual(
+            {'data': {'x': 1}, 'args': {'a': '1', 'b': ''}},
+            json.loads(b''.join(body))
+        )
+
+    def test_not_found(self):
+        self.assertEqual(404, call(self.app, '/api/nothing')[0])
+        self.assertEqual(404, call(self.app, '/nothing.js')[0])
+        self.assertEqual(404, call(self.app, '/../../etc/passwd')[0])
+
+    def test_error(self):
+        self.assertEqual(500, call(self.app, '/api/error')[0])
+
+    def test_file(self):
+        status, headers, body = call(self.app, '/')
+
+        self.assertEqual(200, status)
+        self.assertEqual(b'text/html', headers[b'content-type'])
+        self.assertEqual(b'<html></html>', b''.join(body))
+
+    def test_stream(self):
+        status, headers, body = call(self.app, '/api/stream')
+
+        self.assertEqual(200, status)
+        self.assertEqual(b'text/event-stream', headers[b'content-type'])
+        self.assertEqual(
+            [{'i': 0}, {'i': 1}, {'i': 2}],
+            [json.loads(chunk[len(b'data:'):]) for chunk in body]
+        )
+
+    def test_disconnect(self):
+        # Streams that are waiting for data stop when the client disconnects
+        status, headers, body = call(self.app, '/api/idle', disconnect=0.1)
+
+        self.assertEqual(200, status)
+        self.assertEqual([], body)
+
+        # The thread relaying the stream doesn't hang around
+        for thread in threading.enumerate():
+            if thread.name == 'relay':
+                thread.join(timeout=1)
+                self.assertFalse(thread.is_alive())
+        self.assertFalse(self.server.streamer.active)
+
+        # The streamer itself keeps going, it may be streamed again
+        self.assertFalse(self.server.streamer._stop.is_set())
@@ -9,7 +9,8 @@ from shapeflow.core.config import Factory, BaseConfig, VERSION, CLASS
 from shapeflow.core import EnforcedStr
 from shapeflow.core.interface import FilterType
 
-from shapeflow.config import normalize_config, ColorSpace
+from shapeflow.config import normalize_config, schemas, ColorSpace
+from shapeflow.core.registry import registry
 
 __VIDEO__ = 'test.mp4'
 __DESIGN__ = 'test.svg'
@@ -100,6 +101,33 @@ class ConfigTest(unittest.TestCase):
         self.assertNotEqual(conf1.c, conf2.c)
         self.assertEqual(conf1.d, conf2.d)
 
+    def test_version(self):
+        class DummyNestedConfig(BaseConfig):
+            a: int = Field(default=123)
+
+        class DummyConfig(BaseConfig):
+            b: DummyNestedConfig = Field(default_factory=DummyNestedConfig)
+            c: Tuple[DummyNestedConfig, ...] = Field(default=())
+
+        conf = DummyConfig(c=(DummyNestedConfig(), DummyNestedConfig()))
+
+        version = conf.version
+        conf(b={'a': 123}, c=conf.c)
+        self.assertEqual(version, conf.version)
+
+        conf.c[1](a=456)
+        self.assertNotEqual(version, conf.version)
+
+        version = conf.version
+        conf(b=DummyNestedConfig())
+        self.assertNotEqual(version, conf.version)
+
+        # Copies share their version with the original until either changes
+        copied = conf.copy()
+        self.assertEqual(conf.version, copied.version)
+        copied(c=())
+        self.assertNotEqual(conf.version, copied.version)
+
 
 class ConfigResolutionTest(unittest.TestCase):
     def test_resolution(self):
@@ -182,4 +210,21 @@ class VideoAnalyzerConfigTest(unittest.TestCase):
             normalize_config, {VERSION: '0.3', CLASS: 'Unknown'}
         )
 
+    def test_normalize_current_version(self):
+        config = VideoAnalyzerConfig(Nf=42).to_dict(do_tag=True)
+
+        self.assertEqual(
+            VideoAnalyzerConfig(Nf=42).to_dict(), normalize_config(config)
+        )
+
+    def test_schemas_memoized(self):
+        self.assertIs(schemas(), schemas())
+        self.assertIs(schemas()['config'], VideoAnalyzerConfig.schema())
+
+        # Invalidated when plugins change
+        previous = schemas()
+        registry.changed()
+        self.assertIsNot(previous, schemas())
+        self.assertEqual(previous, schemas())
+
 
@@ -0,0 +1,368 @@
+import os
+import shutil
+import tempfile
+import json
+import datetime
+import sqlite3
+import unittest
+from unittest.mock import patch
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from shapeflow import settings
+from shapeflow.config import VideoAnalyzerConfig
+from shapeflow.core import identity
+from shapeflow.core.config import CLASS
+from shapeflow.db import History, VideoFileModel, AnalysisModel, ResultModel, ConfigModel, ConfigChangeModel
+
+
+VIDEO = os.path.join(os.path.dirname(__file__), 'test.mp4')
+DESIGN = os.path.join(os.path.dirname(__file__), 'test.svg')
+
+
+T0 = datetime.datetime(2020, 1, 1)
+
+
+def _result(offset: float) -> str:
+    return pd.DataFrame(
+        [[0.0, 1.0 + offset, 2.0], [1.0, 3.0 + offset, 4.0], [2.0, 5.0, None]],
+        columns=['time', 'mask 1', 'mask 2'],
+        index=[0, 30, 60],
+    ).to_json(orient='split')
+
+
+class HistoryResultsTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.history = History(Path(os.path.join(self.dir, 'history.db')))
+
+        with self.history.session() as s:
+            for analysis in (1, 2):
+                s.add(AnalysisModel(id=analysis, runs=2))
+                for run in (1, 2):
+                    for feature in ('Area_mm2', 'PixelSum'):
+                        s.add(ResultModel(
+                            analysis=analysis,
+                            run=run,
+                            feature=feature,
+                            data=_result(run),
+                            started=T0,
+                            finished=T0 + datetime.timedelta(minutes=run),
+                            elapsed=60.0 * run,
+                        ))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_get_result_list(self):
+        self.assertEqual(
+            {
+                1: T0 + datetime.timedelta(minutes=1),
+                2: T0 + datetime.timedelta(minutes=2)
+            },
+            self.history.get_result_list(1)
+        )
+
+    def test_get_run_lists(self):
+        runs = self.history.get_run_lists([1, 2, 3])
+
+        self.assertEqual({}, runs[3])
+        self.assertEqual([1, 2], sorted(runs[1].keys()))
+        self.assertEqual(['Area_mm2', 'PixelSum'], runs[2][2]['features'])
+        self.assertEqual(120.0, runs[2][2]['elapsed'])
+
+    def test_get_results(self):
+        results = self.history.get_results([1, 2])
+
+        self.assertEqual([1, 2], sorted(results[1].keys()))
+        self.assertEqual(
+            self.history.get_result(2, 1),
+            results[2][1]
+        )
+
+    def test_get_results_projection(self):
+        results = self.history.get_results(
+            [1], runs=[2], features=['PixelSum'], masks=['mask 2']
+        )
+
+        self.assertEqual([2], list(results[1].keys()))
+        self.assertEqual(['PixelSum'], list(results[1][2].keys()))
+        self.assertEqual(
+            {
+                'columns': ['time', 'mask 2'],
+                'index': [0, 30, 60],
+                'data': [[0.0, 2.0], [1.0, 4.0], [2.0, None]],
+            },
+            results[1][2]['PixelSum']
+        )
+
+    def test_get_results_str_ids(self):
+        results = self.history.get_results(['1', '2'], runs=['1'])
+        runs = self.history.get_run_lists(['1'])
+
+        self.assertEqual([1, 2], sorted(results.keys()))
+        self.assertEqual([1], list(results[2].keys()))
+        self.assertEqual([1, 2], sorted(runs[1].keys()))
+
+    def test_get_results_time_range(self):
+        results = self.history.get_results([1], start=0.5, stop=1.5)
+
+        self.assertEqual(
+            {
+                'columns': ['time', 'mask 1', 'mask 2'],
+                'index': [30],
+                'data': [[1.0, 4.0, 4.0]],
+            },
+            results[1][1]['Area_mm2']
+        )
+
+
+class HistoryStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'history.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_wal(self):
+        history = History(Path(self.path))
+
+        with history.session() as s:
+            self.assertEqual(
+                'wal', s.execute('PRAGMA journal_mode').scalar()
+            )
+
+    def test_indexes(self):
+        History(Path(self.path))
+
+        # Indexes should be added to databases that don't have them yet
+        with sqlite3.connect(self.path) as db:
+            db.execute('DROP INDEX ix_results_analysis_run')
+
+        history = History(Path(self.path))
+
+        with history.session() as s:
+            indexes = [r[0] for r in s.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )]
+
+        for index in [
+            'ix_results_analysis_run',
+            'ix_config_video_design_added',
+            'ix_analysis_modified',
+        ]:
+            self.assertIn(index, indexes)
+        self.assertTrue(history.check())
+
+
+class MockAnalyzer(object):
+    def __init__(self):
+        self.config = VideoAnalyzerConfig(video_path=VIDEO, design_path=DESIGN)
+        self.runs = 0
+        self.results = {}
+        self.timing = None
+        self.model = None
+
+    def set_model(self, model):
+        self.model = model
+
+    def get_config(self, do_tag=False):
+        return self.config.to_dict(do_tag)
+
+    def apply(self, config):
+        for k, v in config.items():
+            if k in ('Nf', 'description'):
+                setattr(self.config, k, v)
+
+
+class HistoryConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.history = History(Path(os.path.join(self.dir, 'history.db')))
+
+        self.analyzer = MockAnalyzer()
+        self.model = self.history.add_analysis(self.analyzer)
+
+        # seq 1-3 change Nf, seq 4-5 change the description
+        for Nf in (1, 2, 3):
+            self.analyzer.config.Nf = Nf
+            self.model.store()
+        for description in ('a', 'b'):
+            self.analyzer.config.description = description
+            self.model.store()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_sequence_numbers(self):
+        with self.history.session() as s:
+            self.assertEqual(
+                [1, 2, 3, 4, 5],
+                [c.seq for c in s.query(ConfigModel).order_by(ConfigModel.id)]
+            )
+            self.assertEqual(
+                [(2, 'Nf'), (3, 'Nf'), (4, 'description'), (5, 'description')],
+                [(c.seq, c.context) for c in
+                 s.query(ConfigChangeModel).order_by(ConfigChangeModel.seq)]
+            )
+
+    def test_store_unchanged(self):
+        self.model.store()
+        self.model.store()
+
+        with self.history.session() as s:
+            self.assertEqual(5, s.query(ConfigModel).count())
+
+    def test_deltas(self):
+        with self.history.session() as s:
+            configs = list(s.query(ConfigModel).order_by(ConfigModel.seq))
+
+            self.assertIsNotNone(configs[0].json)
+            for config in configs[1:]:
+                self.assertIsNone(config.json)
+                self.assertIsNotNone(config.delta)
+
+        self.assertEqual(
+            json.loads(json.dumps(self.analyzer.get_config(do_tag=True))),
+            json.loads(self.model.get_config_json())
+        )
+
+    def test_snapshot_interval(self):
+        analyzer = MockAnalyzer()
+        model = self.history.add_analysis(analyzer)
+
+        with settings.db.override({'snapshot_interval': 2}):
+            for Nf in (1, 2, 3, 4, 5):
+                analyzer.config.Nf = Nf
+                model.store()
+
+        with self.history.session() as s:
+            self.assertEqual(
+                [True, False, True, False, True],
+                [c.json is not None for c in s.query(ConfigModel).\
+                    filter(ConfigModel.analysis == model.get_id()).\
+                    order_by(ConfigModel.seq)]
+            )
+        self.assertEqual(
+            json.loads(json.dumps(analyzer.get_config(do_tag=True))),
+            json.loads(model.get_config_json())
+        )
+
+    def test_undo_redo(self):
+        config, _ = self.model.get_undo_config()
+        self.assertEqual('a', config['description'])
+        self.analyzer.apply(config)
+
+        config, _ = self.model.get_undo_config()
+        self.assertNotIn('description', config)
+        self.assertEqual(3, config['Nf'])
+        self.analyzer.apply(config)
+
+        config, _ = self.model.get_redo_config()
+        self.assertEqual('a', config['description'])
+
+    def test_undo_redo_context(self):
+        config, _ = self.model.get_undo_config('Nf')
+        self.assertEqual({'Nf': 2}, config)
+        self.analyzer.apply(config)
+        self.model.store()
+
+        config, _ = self.model.get_undo_config('Nf')
+        self.assertEqual({'Nf': 1}, config)
+        self.analyzer.apply(config)
+        self.model.store()
+
+        self.assertEqual((None, None), self.model.get_undo_config('Nf'))
+
+        config, _ = self.model.get_redo_config('Nf')
+        self.assertEqual({'Nf': 2}, config)
+
+    def test_normalize_on_read(self):
+        with patch('shapeflow.db.normalize_config') as normalize:
+            config, _ = self.model.get_undo_config()
+            self.assertEqual('a', config['description'])
+            self.assertNotIn(CLASS, config)
+            normalize.assert_not_called()
+
+        # Configurations written by older versions are still normalized
+        with self.history.session() as s:
+            s.query(ConfigModel).update({ConfigModel.version: None})
+
+        with patch('shapeflow.db.normalize_config', side_effect=lambda d: d) as normalize:
+            self.model.get_undo_config()
+            normalize.assert_called_once()
+
+    def test_number_existing_configs(self):
+        with self.history.session() as s:
+            s.query(ConfigChangeModel).delete()
+            for config in s.query(ConfigModel):
+                config.seq = None
+
+        history = History(Path(os.path.join(self.dir, 'history.db')))
+
+        with history.session() as s:
+            self.assertEqual(
+                [1, 2, 3, 4, 5],
+                [c.seq for c in s.query(ConfigModel).order_by(ConfigModel.id)]
+            )
+            self.assertEqual(
+                4, s.query(ConfigChangeModel).count()
+            )
+
+
+class FileIdentityTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'video.mp4')
+        shutil.copy(VIDEO, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_identify(self):
+        with settings.db.override({'identity_dir': os.path.join(self.dir, 'identity')}):
+            self.assertIsNone(identity.known(self.path))
+
+            hash = identity.identify(self.path)
+            self.assertEqual(hash, identity.known(self.path))
+
+            # Changed files have to be hashed again
+            with open(self.path, 'ab') as f:
+                f.write(b'x')
+            self.assertIsNone(identity.known(self.path))
+            self.assertNotEqual(hash, identity.identify(self.path))
+
+    def test_resolve(self):
+        with settings.db.override({'identity_dir': os.path.join(self.dir, 'identity')}):
+            history = History(Path(os.path.join(self.dir, 'history.db')))
+
+            history.add_video_file(self.path)
+            history.add_video_file(self.path)
+
+            with history.session() as s:
+                self.assertEqual(
+                    [identity.known(self.path)],
+                    [f.hash for f in s.query(VideoFileModel)]
+                )
+
+    def test_deduplicate_concurrent_hashes(self):
+        with settings.db.override({'identity_dir': os.path.join(self.dir, 'identity')}):
+            hashing = threading.Event()
+            calls = []
+
+            def identify(path):
+                calls.append(path)
+                hashing.wait(timeout=10)
+                return 'hash'
+
+            with patch('shapeflow.core.identity.identify', identify):
+                a = identity.submit(self.path)
+                b = identity.submit(self.path)
+                self.assertIs(a, b)
+
+                hashing.set()
+                self.assertEqual('hash', a.result(timeout=10))
+                self.assertEqual([self.path], calls)
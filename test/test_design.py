@@ -0,0 +1,49 @@
+import os
+import unittest
+from pathlib import Path
+
+import numpy as np
+from lxml.etree import fromstring
+
+from shapeflow import settings
+from shapeflow.design.onions import Peeler
+
+
+__DESIGN__ = Path(os.path.join(os.path.dirname(__file__), 'test.svg'))
+__DPI__ = 100
+
+
+class PeelerTest(unittest.TestCase):
+    def test_layer_svg(self):
+        peeler = Peeler(__DESIGN__)
+
+        for layer in peeler._layers:
+            root = fromstring(peeler._layer_svg(layer))
+            labels = [
+                child.attrib[Peeler.LABEL] for child in root
+                if child.tag == Peeler.G and Peeler.LABEL in child.attrib
+                and not child.attrib[Peeler.LABEL].startswith('_')
+            ]
+
+            self.assertEqual([layer.label], labels)
+            self.assertIsNotNone(root.find(Peeler.NAMEDVIEW))
+
+        # The original document is left alone
+        self.assertEqual(
+            10, len([l for l in peeler._layers if l.element.getparent() is not None])
+        )
+
+    def test_render_parallel(self):
+        peeler = Peeler(__DESIGN__)
+
+        with settings.render.override({'workers': 1}):
+            expected = peeler.render(__DPI__)
+        renders = peeler.render(__DPI__)
+
+        self.assertEqual(list(expected.keys()), list(renders.keys()))
+        for label in expected:
+            self.assertTrue(np.array_equal(expected[label], renders[label]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 
-from typing import Callable
+from typing import Callable, Optional, List
 
-from shapeflow.core import Endpoint, Dispatcher
+from shapeflow.core import Endpoint, Dispatcher, DispatchingError
 from shapeflow.util.meta import bind, unbind
 from shapeflow.api import _CacheDispatcher, _DatabaseDispatcher, \
     _VideoAnalyzerManagerDispatcher, _FilesystemDispatcher, \
@@ -145,3 +145,64 @@ class DispatcherTest(unittest.TestCase):
             rd.level1.address_space['dummy3'],
             rd.address_space['level1/dummy3']
         )
+
+    def test_dispatch(self):
+        class LeafDispatcher(Dispatcher):
+            get = Endpoint(Callable[[], str])
+
+        class RootDispatcher(Dispatcher):
+            __id__ = LeafDispatcher()
+
+        class Leaf(object):
+            def __init__(self, name: str):
+                self.name = name
+
+            @RootDispatcher.__id__.get.expose()
+            def get(self) -> str:
+                return self.name
+
+        rd = RootDispatcher(object())
+        rd._add_dispatcher('a', LeafDispatcher(Leaf('a')))
+        rd._add_dispatcher('b', LeafDispatcher(Leaf('b')))
+
+        self.assertEqual('a', rd.dispatch('a/get'))
+        self.assertEqual('b', rd.dispatch('b/get'))
+        self.assertNotIn('__id__/get', rd.address_space)
+        self.assertRaises(DispatchingError, rd.dispatch, '__id__/get')
+
+        # Removing a dispatcher doesn't affect the others
+        rd._remove_dispatcher('a')
+        self.assertRaises(DispatchingError, rd.dispatch, 'a/get')
+        self.assertNotIn('a/get', rd.address_space)
+        self.assertFalse(hasattr(rd, 'a'))
+        self.assertEqual('b', rd.dispatch('b/get'))
+        self.assertEqual((rd.__id__, rd.b), rd.dispatchers)
+
+        self.assertRaises(DispatchingError, rd.dispatch, 'b/nothing')
+        self.assertRaises(DispatchingError, rd.dispatch, 'c/get')
+
+    def test_coerce_arguments(self):
+        class TestDispatcher(Dispatcher):
+            call = Endpoint(Callable[[int, Optional[float], bool, List[int], str], dict])
+
+        class Test(object):
+            @TestDispatcher.call.expose()
+            def call(self, i: int, f: Optional[float], b: bool, l: List[int], s: str) -> dict:
+                return {'i': i, 'f': f, 'b': b, 'l': l, 's': s}
+
+        td = TestDispatcher(Test())
+
+        # Query arguments are converted to the annotated types
+        self.assertEqual(
+            {'i': 1, 'f': 0.5, 'b': False, 'l': [1, 2], 's': '3'},
+            td.dispatch('call', i='1', f='0.5', b='false', l='[1, 2]', s='3')
+        )
+        self.assertEqual(
+            {'i': 1, 'f': None, 'b': True, 'l': [1], 's': 's'},
+            td.dispatch('call', i=1, f='null', b=True, l=[1], s='s')
+        )
+
+        # Arguments that can't be converted are passed on as they are
+        self.assertEqual(
+            'x', td.dispatch('call', i='x', f=None, b='1', l=[], s='')['i']
+        )
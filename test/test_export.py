@@ -0,0 +1,59 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from shapeflow import ResultFormat
+from shapeflow.core.config import __meta_sheet__
+from shapeflow.export import ResultExport, get_exporter, submit, ExportError
+
+
+DF = pd.DataFrame(
+    [[0.0, 1.0, np.nan], [0.5, 2.0, 3.0], [1.0, np.nan, 4.0]],
+    columns=['time', 'a', 'b'],
+    index=[0, 15, 30]
+)
+META = {'config': {'name': 'test'}, 'video_hash': 'abc', 'design_hash': 'def'}
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.result = ResultExport(
+            base=os.path.join(self.dir, 'result'),
+            data={'Area_mm2': DF.to_json(orient='split')},
+            meta=META,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_xlsx(self):
+        path = get_exporter(ResultFormat.xlsx).export(self.result)
+
+        df = pd.read_excel(path, sheet_name='Area_mm2', index_col=0)
+        pd.testing.assert_frame_equal(DF, df, check_dtype=False)
+
+        meta = pd.read_excel(path, sheet_name=__meta_sheet__, index_col=0)
+        self.assertEqual(META, json.loads(meta.iloc[0, 0]))
+
+    def test_csv(self):
+        path = get_exporter(ResultFormat.csv).export(self.result)
+
+        df = pd.read_csv(self.result.base + ' Area_mm2.csv', index_col=0)
+        pd.testing.assert_frame_equal(DF, df, check_dtype=False)
+
+        with open(path, 'r') as f:
+            self.assertEqual(META, json.load(f))
+
+    def test_submit(self):
+        path = submit(self.result, ResultFormat.xlsx).result(timeout=10)
+        self.assertTrue(os.path.isfile(path))
+
+    def test_invalid_format(self):
+        with self.assertRaises(ExportError):
+            get_exporter('not a format')
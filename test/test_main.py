@@ -598,6 +598,41 @@ class ServerAnalyzerTest(unittest.TestCase):
         finally:
             clear_files()
 
+    def test_load_state(self):
+        with application() as (server, analyzers, history, client, settings):
+            ids = []
+            for _ in range(3):
+                id = json.loads(client.post('/api/va/init').data)
+                client.post(
+                    f'/api/va/{id}/set_config',
+                    data=json.dumps({"config": self.CONFIG})
+                )
+                client.post(f'/api/va/{id}/launch')
+                ids.append(id)
+
+            client.post('/api/va/save_state')
+            with open(STATE, 'rb') as f:
+                state = f.read()
+
+            for id in ids:
+                client.post(f'/api/va/close?id={id}')
+            self.assertEqual([], list(analyzers.keys()))
+
+            # Closing analyzers updates the application state; restore it
+            with open(STATE, 'wb') as f:
+                f.write(state)
+
+            client.post('/api/va/load_state')
+
+            # Analyzers are restored in their original order
+            app_state = json.loads(client.get('/api/va/state').data)
+            self.assertEqual(ids, app_state['ids'])
+            for status in app_state['status']:
+                self.assertLessEqual(
+                    3,  # AnalyzerState.LAUNCHED
+                    status['state']
+                )
+
     @unittest.skip("doesn't work after 06024b46")  # todo: have to bypass CAN_FILTER by setting up all masks
     def test_analyzers_queue_ops(self):
         with application() as (server, analyzers, history, client, settings):
@@ -198,6 +198,41 @@ class area_pixelsumTest(unittest.TestCase):
         self.assertEqual(13, area_pixelsum(ckernel_5))
 
 
+class to_maskTest(unittest.TestCase):
+    def test_to_mask(self):
+        image = np.full((100, 120, 3), 255, dtype=np.uint8)
+        cv2.circle(image, (60, 50), 20, (40, 80, 120), -1)
+        image[50, 60] = 255  # hole
+
+        mask = to_mask(image, ckernel(5))
+
+        self.assertEqual(np.uint8, mask.dtype)
+        self.assertEqual({0, 255}, set(np.unique(mask)))
+        self.assertEqual(0, mask[5, 5])
+        self.assertEqual(255, mask[50, 60])  # filled in
+        self.assertEqual([30, 71, 40, 81], list(mask_rect(mask)))
+
+    def test_mask_rect(self):
+        mask = np.zeros((50, 60), dtype=np.uint8)
+        mask[10:20, 30:35] = 255
+
+        self.assertEqual([10, 20, 30, 35], list(mask_rect(mask)))
+        self.assertRaises(ValueError, mask_rect, np.zeros((5, 5), dtype=np.uint8))
+
+
+class pack_maskTest(unittest.TestCase):
+    def test_round_trip(self):
+        mask = np.zeros((301, 203), dtype=np.uint8)
+        mask[20:80, 10:150] = 255
+        mask[100:110, 200:] = 255
+
+        shape, data = pack_mask(mask)
+
+        self.assertEqual(mask.shape, shape)
+        self.assertLess(len(data), mask.size / 8)
+        self.assertTrue(np.array_equal(mask, unpack_mask((shape, data))))
+
+
 class colorTest(unittest.TestCase):
     colors = {
         'rgb': (51, 127, 63),
@@ -261,6 +296,43 @@ class colorTest(unittest.TestCase):
             HsvColor.from_str(str(HsvColor(*self.colors['hsv'])))
         )
 
+    def test_freeze(self):
+        color = RgbColor(*self.colors['rgb'])
+        frozen = color.freeze()
+
+        self.assertEqual(FrozenColor('rgb', self.colors['rgb']), frozen)
+        self.assertEqual(color.list, frozen.list)
+        self.assertTrue(np.array_equal(color.np3d, frozen.np3d))
+
+        self.assertRaises(AttributeError, setattr, frozen, 'channels', (0, 0, 0))
+        self.assertRaises(AttributeError, setattr, frozen, 'something', 0)
+        self.assertRaises(ValueError, frozen.array.fill, 0)
+
+        # Changing the original color doesn't affect the frozen one
+        color(r=0)
+        self.assertEqual(self.colors['rgb'], frozen.channels)
+
+    def test_hsv_range(self):
+        image = np.array(
+            [[[0, 100, 100], [10, 100, 100], [90, 100, 100], [175, 100, 100]]],
+            dtype=np.uint8
+        )
+
+        self.assertEqual(
+            [0, 255, 0, 0],
+            list(HsvRange(
+                HsvColor(5, 50, 50).freeze(), HsvColor(15, 150, 150).freeze()
+            )(image.copy()).flatten())
+        )
+
+        # Hue wraps around
+        self.assertEqual(
+            [255, 0, 0, 255],
+            list(HsvRange(
+                HsvColor(170, 50, 50).freeze(), HsvColor(5, 150, 150).freeze()
+            )(image.copy()).flatten())
+        )
+
 
 class coordinateTest(unittest.TestCase):
     co1 = ShapeCoo(x=0.101, y=0.199, shape=(150,250))
@@ -1,4 +1,10 @@
+import os
+import sys
+import shutil
+import tempfile
+import importlib.metadata
 import unittest
+from unittest.mock import patch
 
 import abc
 from typing import Type, Dict, List
@@ -9,6 +15,7 @@ import numpy as np
 from shapeflow.maths.coordinates import Roi, Coo
 from shapeflow.maths.images import ckernel
 from shapeflow.core.config import Factory
+from shapeflow.core.registry import registry, PluginError
 from shapeflow.config import TransformType, ConfigType, TransformConfig
 from shapeflow.plugins import *
 from shapeflow.video import *
@@ -25,6 +32,22 @@ if os.getcwd() == '/home/travis/build/ybnd/shapeflow':
 
 
 class PluginRegistrationTest(unittest.TestCase):
+    def test_builtin_plugins(self):
+        import shapeflow.plugins
+
+        modules = [
+            os.path.splitext(file)[0]
+            for file in os.listdir(os.path.dirname(shapeflow.plugins.__file__))
+            if file.endswith('.py') and not file.startswith('_')
+        ]
+        registered = [plugin.name for plugin in registry.plugins]
+
+        # Every module in shapeflow.plugins is registered as a plugin
+        self.assertTrue(modules)
+        for module in modules:
+            self.assertIn(module, registered)
+            self.assertIn(module, shapeflow.plugins.__all__)
+
     def test_valid_extension(self):
         @extend(TransformType)
         class SomeTransform(TransformInterface):
@@ -81,6 +104,90 @@ class PluginRegistrationTest(unittest.TestCase):
         )
 
 
+class PluginRegistryTest(unittest.TestCase):
+    PLUGIN = 'SomeRegisteredFilter'
+    SOURCE = '''
+from shapeflow.core.config import extend
+from shapeflow.core.interface import FilterType, FilterInterface, FilterConfig
+
+
+@extend(FilterType, True)
+class _Filter(FilterInterface):
+    _config_class = FilterConfig
+
+    def set_filter(self, filter, color):
+        return filter
+
+    def mean_color(self, filter):
+        return None
+
+    def filter(self, filter, image, mask=None):
+        return image
+'''
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, self.PLUGIN + '.py'), 'w') as f:
+            f.write(self.SOURCE)
+        sys.path.insert(0, self.dir)
+
+    def tearDown(self):
+        sys.path.remove(self.dir)
+        sys.modules.pop(self.PLUGIN, None)
+        FilterType._mapping.pop(self.PLUGIN, None)
+        registry._remove(self.PLUGIN)
+        shutil.rmtree(self.dir)
+
+    def test_load_on_use(self):
+        registry.add(self.PLUGIN, self.PLUGIN, FilterType)
+
+        self.assertIn(self.PLUGIN, FilterType().options)
+        self.assertNotIn(self.PLUGIN, sys.modules)
+
+        FilterType(self.PLUGIN).get()
+        self.assertIn(self.PLUGIN, sys.modules)
+        self.assertEqual(1, FilterType().options.count(self.PLUGIN))
+
+    def test_load_for_descriptions(self):
+        registry.add(self.PLUGIN, self.PLUGIN, FilterType)
+
+        self.assertIn(self.PLUGIN, FilterType().descriptions)
+        self.assertIn(self.PLUGIN, sys.modules)
+
+    def test_broken_plugin(self):
+        registry.add(self.PLUGIN, 'shapeflow.plugins.NonExistent', FilterType)
+
+        self.assertRaises(PluginError, FilterType(self.PLUGIN).get)
+        self.assertNotIn(self.PLUGIN, FilterType().options)
+
+    def test_broken_plugin_value_error(self):
+        registry.add(self.PLUGIN, 'shapeflow.plugins.NonExistent', FilterType)
+
+        # Callers of Factory.get expect a ValueError for options they can't use
+        self.assertRaises(ValueError, FilterType(self.PLUGIN).get)
+
+    def test_discover(self):
+        class EntryPoints(list):
+            def select(self, group):
+                return [ep for ep in self if ep.group == group]
+
+        entry_points = EntryPoints([
+            importlib.metadata.EntryPoint(
+                self.PLUGIN, self.PLUGIN, 'shapeflow.filters'
+            ),
+            importlib.metadata.EntryPoint(
+                'SomethingElse', 'some_package', 'other.group'
+            ),
+        ])
+
+        with patch('importlib.metadata.entry_points', lambda: entry_points):
+            registry.discover('shapeflow.filters', FilterType, ConfigType)
+
+        self.assertIn(self.PLUGIN, FilterType().options)
+        self.assertNotIn('SomethingElse', [p.name for p in registry.plugins])
+        self.assertIsNotNone(FilterType(self.PLUGIN).get())
+
+
 class BaseTransformTest(abc.ABC, unittest.TestCase):
     transform: TransformInterface
 
@@ -169,6 +276,13 @@ class BaseFilterTest(abc.ABC, unittest.TestCase):
                 self.filter.filter, filter, self.img
             )
 
+    def test_compile(self):
+        for filter in self.valid_filter:
+            self.assertTrue(np.array_equal(
+                self.filter.filter(filter, self.img.copy()),
+                self.filter.filter(self.filter.compile(filter), self.img.copy())
+            ))
+
     def test_ready(self):
         for filter in self.ready_filter:
             self.assertTrue(filter.ready)
@@ -327,6 +441,24 @@ class HsvRangeFilterTest(BaseFilterTest):
         ]
 
 
+class FilterHandlerTest(unittest.TestCase):
+    def test_compiled(self):
+        handler = FilterHandler()
+        handler.set(HsvColor(h=50, s=50, v=50))
+
+        compiled = handler.compiled
+        self.assertIs(compiled, handler.compiled)
+
+        # Compiled again once the configuration changes
+        handler.config.data(close=5)
+        self.assertIsNot(compiled, handler.compiled)
+        self.assertIsNotNone(handler.compiled.close)
+
+        compiled = handler.compiled
+        handler.set_implementation('BackgroundFilter')
+        self.assertIsNot(compiled, handler.compiled)
+
+
 class PixelSumTest(BaseMaskFunctionTest):
     feature_type = FeatureType('PixelSum').get()
     parameters_type = FeatureConfig
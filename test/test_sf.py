@@ -1,4 +1,5 @@
 import sys
+import json
 import subprocess
 import unittest
 from pathlib import Path
@@ -92,3 +93,41 @@ class BootstrapVenvTest(unittest.TestCase):
         with self.assertRaises(Exception):
             with patch.object(sys, 'argv', prog + ['serve']):
                 sf._bootstrap_venv(self.fails_to_import)
+
+
+def _import(module: str) -> dict:
+    """Import a module in a fresh interpreter
+    """
+    return json.loads(subprocess.check_output([
+        sys.executable, '-c',
+        'import sys, time, json; '
+        't0 = time.time(); '
+        f'import {module}; '
+        'print(json.dumps({"elapsed": time.time() - t0, "modules": list(sys.modules)}))'
+    ], cwd=str(Path(__file__).parent.parent), stderr=subprocess.DEVNULL).splitlines()[-1])
+
+
+class ImportTest(unittest.TestCase):
+    BUDGET = 1.0  # seconds
+
+    def test_cli(self):
+        result = _import('shapeflow.cli')
+
+        self.assertLess(result['elapsed'], self.BUDGET)
+        for module in ('numpy', 'cv2', 'pandas', 'flask', 'sqlalchemy',
+                       'git', 'requests', 'distutils'):
+            self.assertNotIn(module, result['modules'])
+
+    def test_server(self):
+        result = _import('shapeflow.server')
+
+        self.assertLess(result['elapsed'], self.BUDGET)
+        for module in ('pandas', 'cairosvg', 'wand'):
+            self.assertNotIn(module, result['modules'])
+
+    def test_renderer_is_probed_on_first_use(self):
+        from shapeflow.design import render
+
+        with patch.object(render, '_renderer', None), \
+             patch.object(render, '__choices__', []):
+            self.assertRaises(render.RendererError, render.get_renderer)
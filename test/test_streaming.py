@@ -1,15 +1,21 @@
+import json
+import logging
 import unittest
+from unittest.mock import patch
 
 from typing import Generator, Type, Callable
 from threading import Thread
+import threading
 import time
 
 import cv2
 import numpy as np
 
+from shapeflow import settings, get_logger
 from shapeflow.core import Endpoint, Dispatcher, stream_image
 from shapeflow.core.config import Instance, BaseConfig
-from shapeflow.core.streaming import BaseStreamer, JpegStreamer, JsonStreamer, streams, stream
+from shapeflow.core.backend import BaseAnalyzer
+from shapeflow.core.streaming import BaseStreamer, JpegStreamer, JsonStreamer, EventStreamer, Multiplexer, streams, stream
 
 
 class StreamerThread(Thread):
@@ -29,6 +35,27 @@ class StreamerThread(Thread):
             pass
 
 
+def _parts(data: list) -> list:
+    """Split MJPEG stream output into decoded images, checking its framing.
+    """
+    stream = b''.join(data)
+    assert stream.startswith(b'--frame\r\n')
+
+    # Every part is followed by a boundary, so the last 'part' is empty
+    *parts, last = stream.split(b'--frame\r\n')[1:]
+    assert last == b''
+
+    images = []
+    for part in parts:
+        headers, body = part.split(b'\r\n\r\n', 1)
+        length = int(headers.split(b'Content-Length: ')[1])
+        assert body[length:] == b'\r\n'
+        images.append(
+            cv2.imdecode(np.frombuffer(body[:length], np.uint8), cv2.IMREAD_COLOR)
+        )
+    return images
+
+
 class BaseStreamerTest(unittest.TestCase):
     streamer_type: Type[BaseStreamer]
 
@@ -51,15 +78,65 @@ class BaseStreamerTest(unittest.TestCase):
 
         thread.join()
 
-        # Valid data should 'arrive' at the generator
-        if streamer._double_yield:
-            self.assertEqual(
-                2 * len(self.valid_data), len(thread.data)
-            )
-        else:
-            self.assertEqual(
-                len(self.valid_data), len(thread.data)
-            )
+        # Valid data should 'arrive' at the generator, unless superseded
+        self.assertEqual(
+            len(self.valid_data), streamer.encoded + streamer.dropped
+        )
+        self.assertEqual(
+            streamer.encoded, len(thread.data)
+        )
+
+    def test_stop_idle(self):
+        streamer = self.streamer_type()
+
+        thread = StreamerThread(streamer.stream())
+        thread.start()
+
+        time.sleep(self._timeout)
+        streamer.stop()
+
+        # Stopping should wake up a stream that's waiting for data
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+
+    def test_stop_one_stream(self):
+        streamer = self.streamer_type()
+        stop = threading.Event()
+
+        thread = StreamerThread(streamer.stream(stop))
+        other = StreamerThread(streamer.stream())
+        thread.start()
+        other.start()
+
+        time.sleep(self._timeout)
+        stop.set()
+        streamer.wake()
+
+        # Only the stream that was asked to stop does so
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(other.is_alive())
+
+        streamer.stop()
+        other.join(timeout=1)
+        self.assertFalse(other.is_alive())
+
+    def test_active(self):
+        streamer = self.streamer_type()
+
+        threads = [StreamerThread(streamer.stream()) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+
+        time.sleep(self._timeout)
+        self.assertEqual(len(threads), streamer.active)
+
+        # Streams opening and closing concurrently are all counted
+        streamer.stop()
+        for thread in threads:
+            thread.join(timeout=1)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(0, streamer.active)
 
     def test_push_invalid_data(self):
         streamer = self.streamer_type()
@@ -95,6 +172,79 @@ class JpegStreamerTest(BaseStreamerTest):
     ]
 
 
+class LatestFrameTest(unittest.TestCase):
+    frames: list = [
+        np.full((64, 64, 3), i, dtype=np.uint8) for i in range(5)
+    ]
+
+    def _stream(self, latest_only: bool):
+        with settings.stream.override({'latest_only': latest_only}):
+            streamer = JpegStreamer()
+
+        # Push all frames before the stream starts consuming them
+        for frame in self.frames:
+            streamer.push(frame)
+
+        thread = StreamerThread(streamer.stream())
+        thread.start()
+        time.sleep(0.1)
+        streamer.stop()
+        thread.join(timeout=1)
+
+        return streamer, thread
+
+    def test_latest_only(self):
+        streamer, thread = self._stream(latest_only=True)
+
+        # Superseded frames are dropped before encoding
+        self.assertEqual(1, streamer.encoded)
+        self.assertEqual(len(self.frames) - 1, streamer.dropped)
+
+        self.assertTrue(np.allclose(
+            cv2.cvtColor(self.frames[-1], cv2.COLOR_HSV2BGR),
+            _parts(thread.data)[0],
+            atol=2
+        ))
+
+    def test_queued(self):
+        streamer, thread = self._stream(latest_only=False)
+
+        self.assertEqual(len(self.frames), streamer.encoded)
+        self.assertEqual(0, streamer.dropped)
+        self.assertEqual(len(self.frames), len(_parts(thread.data)))
+
+    def test_shared_encoding(self):
+        streamer = JpegStreamer()
+
+        threads = [StreamerThread(streamer.stream()) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+
+        streamer.push(self.frames[0])
+        time.sleep(0.1)
+        streamer.stop()
+        for thread in threads:
+            thread.join(timeout=1)
+
+        # All streams get the same frame, but it's only encoded once
+        self.assertEqual(1, streamer.encoded)
+        for thread in threads:
+            self.assertEqual(thread.data, threads[0].data)
+
+    def test_quality_and_size(self):
+        frame = np.random.randint(0, 255, (256, 128, 3), dtype=np.uint8)
+
+        full = JpegStreamer()._encode(frame)
+        with settings.stream.override({'jpeg_quality': 20, 'max_size': 64}):
+            small = JpegStreamer()._encode(frame)
+
+        self.assertLess(len(small), len(full))
+        self.assertEqual(
+            (64, 32, 3),
+            cv2.imdecode(np.frombuffer(small, np.uint8), cv2.IMREAD_COLOR).shape
+        )
+
+
 class JsonStreamerTest(BaseStreamerTest):
     streamer_type = JsonStreamer
 
@@ -129,20 +279,15 @@ class StreamHandlerTest(unittest.TestCase):
         streamable = StreamableClass()
         dispatcher = TestDispatcher(streamable)
 
-        thread1 = StreamerThread(
-            streams.register(
-                streamable, dispatcher.method1.method
-            ).stream()
-        )
+        streamer1 = streams.register(streamable, dispatcher.method1.method)
+        thread1 = StreamerThread(streamer1.stream())
         thread1.start()
-        thread2 = StreamerThread(
-            streams.register(
-                streamable, dispatcher.method2.method
-            ).stream()
-        )
+        streamer2 = streams.register(streamable, dispatcher.method2.method)
+        thread2 = StreamerThread(streamer2.stream())
         thread2.start()
 
         streams.update()
+        self.assertTrue(streams.wait(timeout=1))
         time.sleep(0.1)
 
         # Unregiter specific method
@@ -150,14 +295,274 @@ class StreamHandlerTest(unittest.TestCase):
         # Unregister all methods & stop
         streams.stop()
 
-        # FrameStreamer -> double yield
         # each streamer pushes once when registered and once on streams.update()
+        # the first frame may be superseded before it's streamed
+        for streamer, thread in ((streamer1, thread1), (streamer2, thread2)):
+            self.assertEqual(2, streamer.encoded + streamer.dropped)
+            self.assertEqual(streamer.encoded, len(thread.data))
+
+
+class StreamUpdateTest(unittest.TestCase):
+    def setUp(self):
+        class TestDispatcher(Dispatcher):
+            get_frame = Endpoint(Callable[[], np.ndarray], stream_image)
+
+        self.release = threading.Event()
+
+        class SlowStreamable(object):
+            def __init__(self, release):
+                self.release = release
+                self.calls = 0
+
+            @stream
+            @TestDispatcher.get_frame.expose()
+            def get_frame(self) -> np.ndarray:
+                self.calls += 1
+                self.release.wait(timeout=1)
+                return np.zeros((8, 8, 3), dtype=np.uint8)
+
+        self.release.set()
+        self.a = SlowStreamable(self.release)
+        self.b = SlowStreamable(self.release)
+        for streamable in (self.a, self.b):
+            streams.register(streamable, TestDispatcher(streamable).get_frame.method)
+        self.release.clear()
+
+    def tearDown(self):
+        self.release.set()
+        streams.wait(timeout=1)
+        for streamable in (self.a, self.b):
+            streams.unregister(streamable, streamable.get_frame)
+
+    def test_returns_immediately(self):
+        t0 = time.time()
+        streams.update(self.a)
+        self.assertLess(time.time() - t0, 0.5)
+
+        self.release.set()
+        self.assertTrue(streams.wait(timeout=1))
+        self.assertEqual(2, self.a.calls)
+
+    def test_scoped(self):
+        self.release.set()
+        streams.update(self.a)
+        self.assertTrue(streams.wait(timeout=1))
+
+        self.assertEqual(2, self.a.calls)
+        self.assertEqual(1, self.b.calls)
+
+    def test_coalesce(self):
+        streams.update(self.a)
+        time.sleep(0.05)
+
+        # Updates that arrive while updating are coalesced into one
+        for _ in range(10):
+            streams.update(self.a)
+
+        self.release.set()
+        self.assertTrue(streams.wait(timeout=1))
+        self.assertEqual(3, self.a.calls)
+
+    def test_methods(self):
+        self.release.set()
+
+        streams.update(self.a, methods=[])
+        self.assertTrue(streams.wait(timeout=1))
+        self.assertEqual(1, self.a.calls)
+
+        # Decorated methods are resolved to the registered method
+        streams.update(self.a, methods=[self.a.get_frame])
+        self.assertTrue(streams.wait(timeout=1))
+        self.assertEqual(2, self.a.calls)
+
+
+def _messages(data: list) -> list:
+    """Split multiplexed stream output into (kind, channel, payload) tuples.
+    """
+    stream = b''.join(data)
+    messages = []
+    while stream:
+        kind, channel_length, payload_length = Multiplexer._header.unpack_from(stream)
+        stream = stream[Multiplexer._header.size:]
+        channel = stream[:channel_length].decode('utf-8')
+        payload = stream[channel_length:channel_length + payload_length]
+        stream = stream[channel_length + payload_length:]
+        messages.append((kind, channel, payload))
+    return messages
+
+
+class MultiplexerTest(unittest.TestCase):
+    def test_multiplex(self):
+        events = EventStreamer()
+        frames = JpegStreamer()
+        frame = np.full((64, 64, 3), 128, dtype=np.uint8)
+
+        mux = Multiplexer()
+        mux.add('events', events)
+        mux.add('frames', frames)
+
+        thread = StreamerThread(mux.stream())
+        thread.start()
+
+        events.event('status', 'abc', {'progress': 0.5})
+        frames.push(frame)
+        time.sleep(0.1)
+        mux.stop()
+        thread.join(timeout=1)
+
+        messages = _messages(thread.data)
+        self.assertEqual(
+            [(b'e', 'events'), (b'f', 'frames')],
+            [(kind, channel) for kind, channel, _ in messages]
+        )
         self.assertEqual(
-            4, len(thread1.data)
+            {'category': 'status', 'id': 'abc', 'data': {'progress': 0.5}},
+            json.loads(messages[0][2])
         )
         self.assertEqual(
-            4, len(thread2.data)
+            (64, 64, 3),
+            cv2.imdecode(np.frombuffer(messages[1][2], np.uint8), cv2.IMREAD_COLOR).shape
         )
 
+        # The frame was encoded once by its own streamer
+        self.assertEqual(1, frames.encoded)
+
+    def test_latest_frame_per_channel(self):
+        frames = JpegStreamer()
+
+        mux = Multiplexer()
+        mux.add('frames', frames)
+        for i in range(5):
+            frames.push(np.full((8, 8, 3), i, dtype=np.uint8))
+
+        thread = StreamerThread(mux.stream())
+        thread.start()
+        time.sleep(0.1)
+        mux.stop()
+        thread.join(timeout=1)
+
+        self.assertEqual(1, len(_messages(thread.data)))
+        self.assertEqual(4, mux.dropped)
+
+    def test_remove(self):
+        events = EventStreamer()
+
+        mux = Multiplexer()
+        mux.add('events', events)
+        mux.remove('events')
+
+        # Values aren't queued for listeners that are gone
+        events.event('status', 'abc', {})
+        self.assertEqual([], mux.channels)
+        self.assertFalse(mux._events)
+
+    def test_max_events(self):
+        events = EventStreamer()
+
+        mux = Multiplexer()
+        mux.add('events', events)
+
+        # Events don't pile up if nothing is streaming them
+        for i in range(Multiplexer._max_events + 10):
+            events.event('status', 'abc', {'i': i})
+        self.assertEqual(Multiplexer._max_events, len(mux._events))
+        self.assertEqual(10, mux.dropped)
+
+        mux.stop()
+
+    def test_disconnect(self):
+        events = EventStreamer()
+
+        mux = streams.multiplex('client')
+        mux.add('events', events)
+
+        stream = mux.stream()
+        events.event('status', 'abc', {})
+        next(stream)
+        self.assertEqual(1, mux.encoded)
+
+        # Closing the stream without stopping it stops multiplexing
+        stream.close()
+        self.assertEqual([], mux.channels)
+        self.assertEqual([], events._listeners)
+        self.assertIsNot(mux, streams.multiplex('client'))
+
+        streams.demultiplex('client')
+
+    def test_msgpack_fallback(self):
+        events = EventStreamer()
+
+        mux = Multiplexer()
+        mux.add('events', events)
+
+        thread = StreamerThread(mux.stream())
+        thread.start()
+
+        with settings.stream.override({'event_encoding': 'msgpack'}), \
+                patch('shapeflow.core.streaming._get_msgpack', return_value=False):
+            events.event('status', 'abc', {'progress': 0.5})
+            time.sleep(0.1)
+        mux.stop()
+        thread.join(timeout=1)
+
+        # Events are encoded as JSON if msgpack is not available
+        (kind, channel, payload), = _messages(thread.data)
+        self.assertEqual(b'e', kind)
+        self.assertEqual({'progress': 0.5}, json.loads(payload)['data'])
+
+
+class ProgressTest(unittest.TestCase):
+    class Analyzer(object):
+        set_progress = BaseAnalyzer.set_progress
+        _push_progress = BaseAnalyzer._push_progress
+
+        def __init__(self):
+            self._progress = 0.0
+            self._progress_pushed = 0.0
+            self._progress_timer = None
+            self._progress_lock = threading.Lock()
+            self.pushed = []
+
+        def push_status(self):
+            self.pushed.append(self._progress)
+
+    def test_rate_limit(self):
+        analyzer = self.Analyzer()
+
+        with settings.stream.override({'progress_interval': 0.2}):
+            for i in range(1, 1001):
+                analyzer.set_progress(i / 1000)
+            time.sleep(0.3)
+
+        # The first update is pushed right away, the rest is combined
+        # into a single push with the latest progress
+        self.assertEqual([0.001, 1.0], analyzer.pushed)
+
+    def test_no_push(self):
+        analyzer = self.Analyzer()
+        analyzer.set_progress(0.5, push=False)
+
+        self.assertEqual(0.5, analyzer._progress)
+        self.assertEqual([], analyzer.pushed)
+
+
+class LoggingTest(unittest.TestCase):
+    def test_lazy_formatting(self):
+        class Payload(object):
+            formatted = 0
+
+            def __str__(self):
+                Payload.formatted += 1
+                return 'payload'
+
+        log = get_logger('test')
+        log.setLevel(logging.INFO)
+
+        log.debug("data: %s", Payload())
+        self.assertEqual(0, Payload.formatted)
+
+        log.info("data: %s", Payload())
+        self.assertEqual(1, Payload.formatted)
+
 
 del BaseStreamerTest
@@ -3,6 +3,9 @@ from unittest.mock import patch
 
 import os
 import json
+import shutil
+import hashlib
+import tempfile
 import tkinter
 import tkinter.filedialog
 import subprocess
@@ -10,6 +13,8 @@ import subprocess
 
 from shapeflow.util.filedialog import _SubprocessTkinter, _Zenity
 from shapeflow.util.from_venv import _VenvCall, _WindowsVenvCall, from_venv
+from shapeflow.util.patch import diff, patch as apply_patch
+from shapeflow.util import sha1_file, fingerprint_file
 
 
 class FileDialogTest(unittest.TestCase):
@@ -250,3 +255,78 @@ class VenvCallTest(unittest.TestCase):
         self.assertRaises(
             EnvironmentError, _WindowsVenvCall(ENV, PYTHON).resolve
         )
+
+
+class PatchTest(unittest.TestCase):
+    a = {
+        'name': 'a',
+        'Nf': 100,
+        'transform': {'roi': {'BL': {'x': 0.1, 'y': 0.2}}, 'flip': False},
+        'masks': [{'name': 'm/1', 'skip': False}, {'name': 'm~2', 'skip': False}],
+        'features': ['Area_mm2'],
+    }
+    b = {
+        'name': 'a',
+        'dt': 5.0,
+        'transform': {'roi': {'BL': {'x': 0.3, 'y': 0.2}}, 'flip': True},
+        'masks': [{'name': 'm/1', 'skip': True}, {'name': 'm~2', 'skip': False}],
+        'features': ['Area_mm2', 'PixelSum'],
+    }
+
+    def test_diff_patch(self):
+        self.assertEqual(self.b, apply_patch(self.a, diff(self.a, self.b)))
+        self.assertEqual(self.a, apply_patch(self.b, diff(self.b, self.a)))
+
+    def test_no_difference(self):
+        self.assertEqual([], diff(self.a, self.a))
+
+    def test_minimal(self):
+        self.assertEqual(
+            [{'op': 'replace', 'path': '/masks/0/skip', 'value': True}],
+            diff(self.a['masks'], self.b['masks'], '/masks')
+        )
+
+    def test_escape(self):
+        a = {'a/b': {'c~d': 1}}
+        b = {'a/b': {'c~d': 2}}
+        self.assertEqual(
+            [{'op': 'replace', 'path': '/a~1b/c~0d', 'value': 2}], diff(a, b)
+        )
+        self.assertEqual(b, apply_patch(a, diff(a, b)))
+
+    def test_does_not_modify(self):
+        a = json.loads(json.dumps(self.a))
+        apply_patch(a, diff(a, self.b))
+        self.assertEqual(self.a, a)
+
+
+class HashTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'file')
+        with open(self.path, 'wb') as f:
+            f.write(os.urandom(64 * 1024))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_sha1(self):
+        with open(self.path, 'rb') as f:
+            self.assertEqual(
+                hashlib.sha1(f.read()).hexdigest(), sha1_file(self.path, 1000)
+            )
+
+    def test_fingerprint_small_file(self):
+        self.assertEqual(sha1_file(self.path), fingerprint_file(self.path))
+
+    def test_fingerprint(self):
+        fingerprint = fingerprint_file(self.path, blocksize=1024, blocks=4)
+        self.assertNotEqual(sha1_file(self.path), fingerprint)
+
+        # Sampled blocks change the fingerprint
+        with open(self.path, 'r+b') as f:
+            f.seek(64 * 1024 - 1)
+            f.write(b'x')
+        self.assertNotEqual(
+            fingerprint, fingerprint_file(self.path, blocksize=1024, blocks=4)
+        )
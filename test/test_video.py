@@ -1,5 +1,7 @@
 import unittest
+from unittest.mock import patch
 from copy import deepcopy
+import tempfile
 
 import os
 import time
@@ -9,7 +11,7 @@ import cv2
 from threading import Thread
 import shutil
 
-from shapeflow.design import peel
+from shapeflow.design import peel, render_layers
 
 from shapeflow.config import VideoFileHandlerConfig, TransformHandlerConfig, \
     DesignFileHandlerConfig, VideoAnalyzerConfig, TransformType
@@ -18,8 +20,9 @@ from shapeflow.plugins.PerspectiveTransform import _Config
 from shapeflow.plugins import *
 
 from shapeflow.video import VideoFileHandler, VideoFileTypeError, \
-    CachingInstance, VideoAnalyzer
+    CachingInstance, VideoAnalyzer, DesignFileHandler
 from shapeflow import settings
+from shapeflow.core.backend import PushEvent
 from shapeflow.core.config import *
 
 
@@ -123,6 +126,28 @@ class VideoInterfaceTest(FrameTest):
                         frame, vi.read_frame(frame_number)
                 )
 
+            # The capture wasn't opened again
+            self.assertIsNone(vi._capture)
+
+    def test_cached_metadata(self):
+        with settings.cache.override({'do_cache': True}):
+            vi = VideoFileHandler(__VIDEO__)
+
+            # Metadata is read from the cache, without opening the video
+            cached = VideoFileHandler(__VIDEO__)
+            self.assertIsNone(cached._capture)
+
+            self.assertEqual(vi.frame_count, cached.frame_count)
+            self.assertEqual(vi.fps, cached.fps)
+            self.assertEqual(vi.shape, cached.shape)
+
+    def test_metadata_without_hashing(self):
+        # Opening a video doesn't wait for its hash
+        with patch('shapeflow.core.identity.identify', side_effect=AssertionError), \
+                settings.cache.override({'do_cache': True}):
+            vi = VideoFileHandler(__VIDEO__)
+            self.assertLess(0, vi.frame_count)
+
     def test_get_cached_frame_threaded(self):
         __INTERVAL__ = 0.1
 
@@ -238,6 +263,54 @@ class VideoAnalyzerTest(FrameTest):
             self.assertTrue(hasattr(va.design, '_masks'))
             self.assertEqual(len(va.design._masks), 9)
 
+    def test_set_config_feature_parameters(self):
+        va = VideoAnalyzer(VideoAnalyzerConfig(
+            video_path=__VIDEO__,
+            design_path=__DESIGN__,
+            features=('Volume_uL', 'Volume_uL'),
+            feature_parameters=({'h': 0.3}, {'h': 0.5}),
+        ))
+
+        # Parameters that don't change are kept as well
+        va.set_config({'feature_parameters': [{'h': 0.3}, {'h': 0.7}]})
+        self.assertEqual(
+            [0.3, 0.7], [p.h for p in va.config.feature_parameters]
+        )
+
+    def test_set_config_feature_parameters_only(self):
+        va = VideoAnalyzer(VideoAnalyzerConfig(
+            video_path=__VIDEO__,
+            design_path=__DESIGN__,
+            features=('Volume_uL',),
+            feature_parameters=({'h': 0.3},),
+        ))
+
+        with patch.object(va, 'event') as event, \
+                patch.object(va, 'commit') as commit:
+            va.set_config({'feature_parameters': [{'h': 0.9}]})
+
+            self.assertEqual(0.9, va.config.feature_parameters[0].h)
+            self.assertIn(
+                PushEvent.CONFIG, [call.args[0] for call in event.call_args_list]
+            )
+            commit.assert_called_once()
+
+    def test_set_config_masks(self):
+        va = VideoAnalyzer(VideoAnalyzerConfig(
+            video_path=__VIDEO__,
+            design_path=__DESIGN__,
+            masks=({'name': 'a', 'skip': True}, {'name': 'b', 'skip': True}),
+        ))
+
+        # Masks that don't change are kept as well
+        va.set_config({'masks': [
+            {'name': 'a', 'skip': True}, {'name': 'B', 'skip': True}
+        ]})
+        self.assertEqual(
+            [('a', True), ('B', True)],
+            [(m.name, m.skip) for m in va.config.masks]
+        )
+
     def test_frame_number_generator(self):  # todo: don't need the design to load here
         # Don't overwrite self.config
         config = deepcopy(self.config)
@@ -270,5 +343,83 @@ class VideoAnalyzerTest(FrameTest):
                 self.assertEqualArray(TEST_TRANSFORMED_FRAME_HSV[fn], frame)
 
 
+class DesignFileHandlerTest(unittest.TestCase):
+    def test_order_layers(self):
+        self.assertEqual(
+            [('1 - a', 'a'), ('2_b', 'b'), ('10 - c', 'c'), ('d', 'd')],
+            DesignFileHandler._order_layers(['10 - c', 'd', '2_b', '1 - a'])
+        )
+
+    def test_render_in_memory(self):
+        with settings.cache.override({"do_cache": False}):
+            before = sorted(os.listdir(settings.render.dir))
+
+            handlers = []
+            threads = [
+                Thread(target=lambda: handlers.append(
+                    DesignFileHandler(__DESIGN__, DesignFileHandlerConfig(dpi=__DPI__))
+                )) for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(before, sorted(os.listdir(settings.render.dir)))
+            for handler in handlers:
+                self.assertEqual(9, len(handler.masks))
+                self.assertEqualArray(overlay, handler._overlay)
+
+    def test_render_cache(self):
+        dir = tempfile.mkdtemp()
+        path = os.path.join(dir, 'design.svg')
+        shutil.copy(__DESIGN__, path)
+
+        renders = []
+
+        def _render(*args):
+            renders.append(args)
+            return render_layers(*args)
+
+        try:
+            with settings.cache.override({"dir": os.path.join(dir, 'cache')}), \
+                 patch('shapeflow.video.render_layers', _render):
+                config = DesignFileHandlerConfig(dpi=__DPI__)
+
+                a = DesignFileHandler(path, config)
+                b = DesignFileHandler(path, config)
+                self.assertEqual(1, len(renders))
+                self.assertEqual(
+                    [m.name for m in a.masks], [m.name for m in b.masks]
+                )
+                for ma, mb in zip(a.masks, b.masks):
+                    self.assertEqualArray(ma._full, mb._full)
+                self.assertEqualArray(a._overlay, b._overlay)
+
+                # Different smoothing ~ different masks
+                DesignFileHandler(path, DesignFileHandlerConfig(dpi=__DPI__, smoothing=9))
+                self.assertEqual(2, len(renders))
+
+                # Files that are changed in place are rendered again
+                with open(path, 'a') as f:
+                    f.write('\n')
+                DesignFileHandler(path, config)
+                self.assertEqual(3, len(renders))
+
+                # Other designs are rendered from their own path
+                other = os.path.join(dir, 'other.svg')
+                shutil.copy(__DESIGN__, other)
+                with open(other, 'a') as f:
+                    f.write('\n\n')
+                a.render_design(other, __DPI__, config.smoothing)
+                self.assertEqual(4, len(renders))
+                self.assertEqual(other, renders[-1][0])
+        finally:
+            shutil.rmtree(dir)
+
+    def assertEqualArray(self, a, b):
+        self.assertTrue(np.array_equal(a, b))
+
+
 if __name__ == '__main__':
     unittest.main()